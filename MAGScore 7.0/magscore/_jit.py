@@ -0,0 +1,25 @@
+"""
+MAGScore 7.0 — Compilation Numba optionnelle
+=============================================
+Point d'import unique de njit et prange pour les noyaux du package
+(modules._kernels, engine.vision_engine).
+
+Sans Numba, njit est un décorateur neutre (la fonction reste en Python
+pur, avec ou sans options) et prange est range.
+"""
+
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+    prange = range
+    
+    def njit(*args, **kwargs):
+        """Décorateur neutre : sans Numba, la fonction reste en Python pur."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+__all__ = ["HAS_NUMBA", "njit", "prange"]
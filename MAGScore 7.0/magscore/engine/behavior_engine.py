@@ -389,17 +389,16 @@ class BehaviorEngine:
             # Vérifier les contradictions dans cette catégorie
             codes = [b["code"] for b in cat_behaviors]
             contradiction_found = False
-            contradicting_codes: List[str] = []
+            # Dict ordonné : codes sans doublons, dans leur ordre de détection
+            contradicting_codes: Dict[str, None] = {}
             
             # Vérifier chaque paire de codes
             for i, code_a in enumerate(codes):
                 for code_b in codes[i+1:]:
                     if are_behaviors_contradicting(code_a, code_b):
                         contradiction_found = True
-                        if code_a not in contradicting_codes:
-                            contradicting_codes.append(code_a)
-                        if code_b not in contradicting_codes:
-                            contradicting_codes.append(code_b)
+                        contradicting_codes[code_a] = None
+                        contradicting_codes[code_b] = None
             
             if contradiction_found:
                 # Créer un comportement AMBIGU
@@ -415,7 +414,7 @@ class BehaviorEngine:
                     "signals_count": None,
                     "signals_required": None,
                     "raw_values": None,
-                    "details": contradicting_codes,
+                    "details": list(contradicting_codes),
                 }
                 result.append(ambiguous_behavior)
                 
@@ -13,7 +13,7 @@ QualityControlEngine v1 :
 Vision : NO CHANCE — ONLY PATTERNS
 """
 
-from typing import Dict, Any, List, Set
+from typing import Dict, Any, List, Set, Tuple, FrozenSet
 
 from magscore.orchestration.lexicon_guard import (
     validate as lexicon_validate,
@@ -57,9 +57,49 @@ CONTRADICTORY_PAIRS = [
     ("PSY_01", "PSY_02", "Psychology contradiction: PSY_01 & PSY_02"),
 ]
 
+# Entrée de l'index : (rang déclaré, code1, code2, message)
+ContradictionEntry = Tuple[int, str, str, str]
+
+
+def _index_contradictions(
+    pairs: List[Tuple[str, str, str]]
+) -> Dict[str, Tuple[ContradictionEntry, ...]]:
+    """
+    Indexe les paires contradictoires par premier code.
+    
+    Toutes les paires d'un même premier code sont conservées, avec leur
+    rang dans la table pour rapporter la première paire déclarée.
+    
+    Args:
+        pairs: Triplets (code1, code2, message), par ordre de priorité.
+    
+    Returns:
+        Dict code1 → entrées (rang, code1, code2, message).
+    """
+    index: Dict[str, Tuple[ContradictionEntry, ...]] = {}
+    for rank, (code1, code2, error_message) in enumerate(pairs):
+        index[code1] = index.get(code1, ()) + ((rank, code1, code2, error_message),)
+    return index
+
+
+# Index des paires par premier code : code1 → entrées (rang, code1, code2, message)
+CONTRADICTION_MAP: Dict[str, Tuple[ContradictionEntry, ...]] = (
+    _index_contradictions(CONTRADICTORY_PAIRS)
+)
+CONTRADICTION_FIRSTS: FrozenSet[str] = frozenset(CONTRADICTION_MAP)
+
 # Clés obligatoires dans le payload final
 REQUIRED_KEYS = {"behaviors", "patterns", "flow", "report", "meta"}
 
+# Types attendus pour chaque clé du payload final
+PAYLOAD_TYPES = (
+    ("behaviors", list),
+    ("patterns", list),
+    ("flow", list),
+    ("report", str),
+    ("meta", dict),
+)
+
 
 # =============================================================================
 # EXCEPTION
@@ -74,6 +114,8 @@ class QualityControlError(Exception):
         category: Catégorie de l'erreur (contradiction, report, pattern, flow, payload).
     """
     
+    __slots__ = ("violations", "category")
+    
     def __init__(
         self, 
         message: str, 
@@ -83,6 +125,13 @@ class QualityControlError(Exception):
         self.violations = violations or []
         self.category = category
         super().__init__(message)
+    
+    def __reduce__(self):
+        """Préserve violations/category au pickling (pas de __dict__)."""
+        return (
+            self.__class__,
+            (*self.args[:1], self.violations, self.category),
+        )
 
 
 # =============================================================================
@@ -145,14 +194,44 @@ class QualityControlEngine:
         # 2. Valider le rapport texte
         self._check_report(report_text)
         
+        # Codes des behaviors (tous / actifs), extraits en un seul passage
+        all_codes, active_codes = self._collect_codes(behaviors)
+        
         # 3. Valider les contradictions de comportements
-        self._check_contradictions(behaviors)
+        self._check_contradictions(active_codes)
         
         # 4. Valider l'intégrité des sources de patterns
-        self._check_pattern_sources(behaviors, patterns)
+        self._check_pattern_sources(all_codes, patterns)
         
         # 5. Valider la cohérence flow ↔ behaviors/patterns
-        self._check_flow_coherence(behaviors, patterns, flow)
+        self._check_flow_coherence(all_codes, patterns, flow)
+    
+    @staticmethod
+    def _collect_codes(
+        behaviors: List[Dict[str, Any]]
+    ) -> Tuple[Set[str], Set[str]]:
+        """
+        Extrait les codes des comportements en un seul parcours.
+        
+        Un comportement est considéré actif si status == "ACTIVE"
+        ou s'il n'a pas de status.
+        
+        Args:
+            behaviors: Liste des comportements.
+        
+        Returns:
+            Tuple (tous les codes, codes actifs).
+        """
+        all_codes: Set[str] = set()
+        active_codes: Set[str] = set()
+        
+        for behavior in behaviors:
+            code = behavior.get("code", "")
+            all_codes.add(code)
+            if behavior.get("status", "ACTIVE") == "ACTIVE":
+                active_codes.add(code)
+        
+        return all_codes, active_codes
     
     def _check_json_structure(self, final_payload: Dict[str, Any]) -> None:
         """
@@ -169,26 +248,19 @@ class QualityControlEngine:
             QualityControlError: Si une clé manque ou un type est incorrect.
         """
         # Vérifier les clés manquantes
-        missing_keys = self.REQUIRED_KEYS - set(final_payload.keys())
+        missing_keys = [k for k in self.REQUIRED_KEYS if k not in final_payload]
         if missing_keys:
             raise QualityControlError(
                 f"Missing required key: {', '.join(sorted(missing_keys))}",
-                violations=list(missing_keys),
+                violations=missing_keys,
                 category="payload"
             )
         
-        # Vérifier les types
-        type_checks = [
-            ("behaviors", list),
-            ("patterns", list),
-            ("flow", list),
-            ("report", str),
-            ("meta", dict),
-        ]
-        
-        for key, expected_type in type_checks:
-            value = final_payload.get(key)
-            if not isinstance(value, expected_type):
+        # Vérifier les types (comparaison exacte d'abord, isinstance
+        # seulement pour les sous-classes)
+        for key, expected_type in PAYLOAD_TYPES:
+            value = final_payload[key]
+            if type(value) is not expected_type and not isinstance(value, expected_type):
                 actual_type = type(value).__name__
                 raise QualityControlError(
                     f"Invalid type for '{key}': expected {expected_type.__name__}, got {actual_type}",
@@ -259,7 +331,7 @@ class QualityControlEngine:
                 category="lexicon"
             )
     
-    def _check_contradictions(self, behaviors: List[Dict[str, Any]]) -> None:
+    def _check_contradictions(self, active_codes: Set[str]) -> None:
         """
         Valide l'absence de contradictions entre comportements.
         
@@ -269,50 +341,42 @@ class QualityControlEngine:
             - PSY_01 et PSY_02
         
         Args:
-            behaviors: Liste des comportements.
+            active_codes: Codes des comportements actifs.
         
         Raises:
             QualityControlError: Si une contradiction est détectée.
         """
-        # Extraire les codes actifs
-        active_codes: Set[str] = set()
-        for behavior in behaviors:
-            code = behavior.get("code", "")
-            status = behavior.get("status", "ACTIVE")
-            
-            # Considérer comme actif si status == "ACTIVE" ou si pas de status
-            if status == "ACTIVE" or "status" not in behavior:
-                active_codes.add(code)
-        
-        # Vérifier les paires contradictoires
-        for code1, code2, error_message in CONTRADICTORY_PAIRS:
-            if code1 in active_codes and code2 in active_codes:
-                raise QualityControlError(
-                    error_message,
-                    violations=[code1, code2],
-                    category="contradiction"
-                )
+        # Vérifier uniquement les paires dont le premier code est actif ;
+        # la première paire déclarée (rang minimal) est rapportée
+        conflicts = [
+            entry
+            for first in active_codes & CONTRADICTION_FIRSTS
+            for entry in CONTRADICTION_MAP[first]
+            if entry[2] in active_codes
+        ]
+        if conflicts:
+            _, code1, code2, error_message = min(conflicts)
+            raise QualityControlError(
+                error_message,
+                violations=[code1, code2],
+                category="contradiction"
+            )
     
     def _check_pattern_sources(
         self,
-        behaviors: List[Dict[str, Any]],
+        available_codes: Set[str],
         patterns: List[Dict[str, Any]]
     ) -> None:
         """
         Valide que les sources des patterns existent dans behaviors.
         
         Args:
-            behaviors: Liste des comportements.
+            available_codes: Codes de tous les comportements.
             patterns: Liste des patterns.
         
         Raises:
             QualityControlError: Si une source de pattern n'existe pas.
         """
-        # Récupérer les codes disponibles dans behaviors
-        available_codes: Set[str] = {
-            b.get("code", "") for b in behaviors
-        }
-        
         # Vérifier chaque pattern
         for pattern in patterns:
             sources = pattern.get("sources", [])
@@ -326,7 +390,7 @@ class QualityControlEngine:
     
     def _check_flow_coherence(
         self,
-        behaviors: List[Dict[str, Any]],
+        behavior_codes: Set[str],
         patterns: List[Dict[str, Any]],
         flow: List[Any]
     ) -> None:
@@ -342,21 +406,16 @@ class QualityControlEngine:
             - Une liste de dicts avec "codes" → validation des codes
         
         Args:
-            behaviors: Liste des comportements.
+            behavior_codes: Codes de tous les comportements.
             patterns: Liste des patterns.
             flow: Liste des phases du flow.
         
         Raises:
             QualityControlError: Si le flow référence un code inconnu.
         """
-        # Construire l'ensemble des codes connus
-        known_codes: Set[str] = set()
-        
-        # Ajouter les codes des behaviors
-        for behavior in behaviors:
-            code = behavior.get("code", "")
-            if code:
-                known_codes.add(code)
+        # Construire l'ensemble des codes connus (codes des behaviors)
+        known_codes: Set[str] = set(behavior_codes)
+        known_codes.discard("")
         
         # Ajouter les codes et sources des patterns
         for pattern in patterns:
@@ -18,6 +18,7 @@ de persistance entre les appels.
 Vision : NO CHANCE — ONLY PATTERNS
 """
 
+import random
 from typing import Dict, Any
 from copy import deepcopy
 
@@ -109,8 +110,10 @@ class SignalMemory:
         if not signals:
             return {}
         
-        # Créer le buffer interne avec N copies
-        buffer = [deepcopy(signals) for _ in range(self._max_memory)]
+        # Créer le buffer interne avec N copies. La moyenne ne fait que lire
+        # le buffer : des références au même dict donnent le même résultat
+        # que des deepcopy, sans leur coût (~2/3 du temps de smooth).
+        buffer = [signals] * self._max_memory
         
         # Calculer la moyenne
         smoothed = self._compute_average(buffer)
@@ -133,7 +136,6 @@ class SignalMemory:
         if not buffer:
             return {}
         
-        n = len(buffer)
         result = {}
         
         # Itérer sur les catégories
@@ -178,8 +180,6 @@ class SignalMemory:
         Returns:
             Dictionnaire des signaux lissés avec bruit.
         """
-        import random
-        
         if not signals:
             return {}
         
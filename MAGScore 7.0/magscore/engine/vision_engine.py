@@ -18,8 +18,10 @@ Vision : NO CHANCE — ONLY PATTERNS
 
 from typing import Dict, Any, List, Optional, Tuple
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timedelta
 import logging
+import queue
+import threading
 
 try:
     import numpy as np
@@ -35,6 +37,7 @@ except ImportError:
     HAS_CV2 = False
     cv2 = None
 
+from .._jit import HAS_NUMBA, njit, prange
 from .definitions import (
     Frame,
     VisualSignal,
@@ -50,6 +53,90 @@ from .definitions import (
 VISION_ENGINE_VERSION = "1.0"
 
 
+# =============================================================================
+# CONSTANTES D'ANALYSE
+# =============================================================================
+
+# Résolution d'analyse (largeur, hauteur) : les métriques sont des heuristiques
+# grossières, calculées sur une version réduite de chaque frame.
+ANALYSIS_RESOLUTION = (320, 180)
+
+# Métriques produites par VisionSignalExtractor.extract_metrics (ordre fixe)
+METRIC_KEYS = ("density_def", "density_off", "optical_flow_avg", "cluster_density")
+METRIC_KEY_SET = frozenset(METRIC_KEYS)
+
+# Taille de la file entre le thread de décodage et l'extraction (frames)
+FRAME_QUEUE_SIZE = 4
+
+
+# =============================================================================
+# NOYAU FUSIONNÉ (NUMBA)
+# =============================================================================
+
+@njit(parallel=True, cache=True)
+def _metrics_kernel(gray, prev, def_y, off_y):
+    """
+    Parcourt la frame une seule fois pour les densités de zone et le flux.
+    
+    Compte les pixels actifs (> 127) des zones défensive (lignes >= def_y)
+    et offensive (lignes < off_y), et somme les différences absolues avec
+    la frame précédente (norme L1).
+    
+    Args:
+        gray: Frame uint8 (hauteur, largeur) à la résolution d'analyse.
+        prev: Frame précédente, de même forme.
+        def_y: Première ligne de la zone défensive.
+        off_y: Fin (exclue) de la zone offensive.
+    
+    Returns:
+        Tuple (actifs_def, actifs_off, somme_l1).
+    """
+    height, width = gray.shape
+    def_count = 0
+    off_count = 0
+    l1 = 0
+    
+    for y in prange(height):
+        row_active = 0
+        row_l1 = 0
+        for x in range(width):
+            value = int(gray[y, x])
+            if value > 127:
+                row_active += 1
+            diff = value - int(prev[y, x])
+            row_l1 += diff if diff >= 0 else -diff
+        
+        if y >= def_y:
+            def_count += row_active
+        if y < off_y:
+            off_count += row_active
+        l1 += row_l1
+    
+    return def_count, off_count, l1
+
+
+def _cuda_available() -> bool:
+    """
+    Vérifie si le chemin CUDA d'OpenCV est utilisable.
+    
+    Requiert un GPU CUDA et un build OpenCV exposant les modules
+    cudaimgproc (cvtColor) et cudawarping (resize).
+    
+    Returns:
+        True si la conversion et la réduction peuvent tourner sur GPU.
+    """
+    if not HAS_CV2 or not hasattr(cv2, "cuda"):
+        return False
+    
+    if not all(hasattr(cv2.cuda, name) for name in ("cvtColor", "resize")):
+        return False
+    
+    try:
+        return cv2.cuda.getCudaEnabledDeviceCount() > 0
+    except cv2.error:
+        return False
+
+
 # =============================================================================
 # EXCEPTIONS
 # =============================================================================
@@ -97,6 +184,7 @@ class VideoStreamHandler:
         self._fps = 0.0
         self._width = 0
         self._height = 0
+        self._sample_stride = 1
         self._logger = logging.getLogger(__name__)
     
     @property
@@ -119,12 +207,20 @@ class VideoStreamHandler:
         """Retourne la résolution (width, height)."""
         return (self._width, self._height)
     
-    def open(self, source: str) -> bool:
+    @property
+    def sample_stride(self) -> int:
+        """Retourne le pas de down-sampling (1 = toutes les frames)."""
+        return self._sample_stride
+    
+    def open(self, source: str, sample_fps: Optional[float] = None) -> bool:
         """
         Ouvre un flux vidéo.
         
         Args:
             source: URL ou chemin du flux.
+            sample_fps: Fréquence cible de lecture (optionnel). Si fournie,
+                read_frame() ne décode qu'une frame sur
+                round(fps / sample_fps).
         
         Returns:
             True si l'ouverture a réussi.
@@ -147,6 +243,7 @@ class VideoStreamHandler:
             self._width = int(self._capture.get(cv2.CAP_PROP_FRAME_WIDTH))
             self._height = int(self._capture.get(cv2.CAP_PROP_FRAME_HEIGHT))
             self._frame_count = int(self._capture.get(cv2.CAP_PROP_FRAME_COUNT))
+            self._sample_stride = self._compute_stride(self._fps, sample_fps)
             
             self._logger.info(
                 f"Flux ouvert: {source} ({self._width}x{self._height} @ {self._fps}fps)"
@@ -157,23 +254,67 @@ class VideoStreamHandler:
         except Exception as e:
             raise VideoStreamError(f"Erreur d'ouverture du flux: {str(e)}") from e
     
+    @staticmethod
+    def _compute_stride(fps: float, sample_fps: Optional[float]) -> int:
+        """
+        Calcule le pas de down-sampling à partir des fréquences.
+        
+        Args:
+            fps: Fréquence native du flux.
+            sample_fps: Fréquence cible (None = pas de down-sampling).
+        
+        Returns:
+            Nombre de frames avancées par lecture (>= 1).
+        """
+        if not sample_fps or sample_fps <= 0 or not fps or fps <= 0:
+            return 1
+        return max(1, int(round(fps / sample_fps)))
+    
     def read_frame(self) -> Optional[Any]:
         """
         Lit la prochaine frame du flux.
         
+        Si un pas de down-sampling est actif, les frames intermédiaires
+        sont avancées via grab() (sans décodage complet) avant de
+        décoder la frame conservée via retrieve().
+        
         Returns:
             Frame numpy array ou None si fin du flux.
         """
         if not self._is_open or self._capture is None:
             return None
         
-        ret, frame = self._capture.read()
+        if self._sample_stride > 1:
+            for _ in range(self._sample_stride - 1):
+                if not self._capture.grab():
+                    return None
+            if not self._capture.grab():
+                return None
+            ret, frame = self._capture.retrieve()
+        else:
+            ret, frame = self._capture.read()
         
         if not ret:
             return None
         
         return frame
     
+    def grab_frame(self) -> bool:
+        """
+        Avance d'une frame sans la convertir en image BGR.
+        
+        Utilisé pour les frames non échantillonnées : grab() seul évite
+        la conversion/copie de l'image effectuée par retrieve().
+        Le pas de down-sampling (sample_fps) ne s'applique pas ici.
+        
+        Returns:
+            True si une frame a été avancée, False en fin de flux.
+        """
+        if not self._is_open or self._capture is None:
+            return False
+        
+        return bool(self._capture.grab())
+    
     def close(self) -> None:
         """Ferme le flux vidéo."""
         if self._capture is not None:
@@ -212,7 +353,35 @@ class VisionSignalExtractor:
     def __init__(self) -> None:
         """Initialise l'extracteur de signaux visuels."""
         self._logger = logging.getLogger(__name__)
+        # Frame niveaux de gris pleine résolution (avant réduction)
+        self._gray_full = None
+        # Double buffer à la résolution d'analyse : la frame précédente est
+        # conservée par échange de références plutôt que par copie.
+        self._buf_a = None
+        self._buf_b = None
         self._prev_frame = None
+        # Buffers réutilisés pour le seuillage des zones et le flou
+        self._binary_buf = None
+        self._blur_buf = None
+        # Pile de frames réduites pour le traitement par lot
+        self._gray_stack = None
+        
+        # Constantes dérivées de la résolution d'analyse (fixe)
+        width, height = ANALYSIS_RESOLUTION
+        self._def_y = int(height * 0.66)
+        self._off_y = int(height * 0.33)
+        self._min_area = width * height * 0.001  # 0.1% de l'image
+        # Noyau gaussien 5×5 séparable, construit une seule fois
+        self._gauss_kernel = cv2.getGaussianKernel(5, 0) if HAS_CV2 else None
+        
+        # Chemin CUDA : envoi, conversion et réduction sur GPU, puis seule la
+        # frame réduite (320×180) revient sur CPU pour les métriques
+        self._use_cuda = _cuda_available()
+        if self._use_cuda:
+            self._cuda_stream = cv2.cuda_Stream()
+            self._gpu_frame = cv2.cuda_GpuMat()
+            self._gpu_gray = cv2.cuda_GpuMat()
+            self._gpu_small = cv2.cuda_GpuMat()
     
     @property
     def is_available(self) -> bool:
@@ -242,59 +411,290 @@ class VisionSignalExtractor:
             return self._fallback_metrics()
         
         try:
-            metrics = {}
+            # Convertir en niveaux de gris puis réduire à la résolution
+            # d'analyse, dans des buffers pré-alloués
+            gray = self._next_gray_buffer()
+            self._to_analysis_gray(frame, gray)
             
-            # Convertir en niveaux de gris
-            gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-            height, width = gray.shape
+            metrics = self._metrics_from_gray(gray)
             
-            # Zone défensive (tiers inférieur)
-            def_zone = gray[int(height * 0.66):, :]
-            metrics["density_def"] = self._compute_density(def_zone)
+            # Conserver pour le prochain calcul de flux optique (sans copie)
+            self._prev_frame = gray
             
-            # Zone offensive (tiers supérieur)
-            off_zone = gray[:int(height * 0.33), :]
-            metrics["density_off"] = self._compute_density(off_zone)
+            return metrics
             
-            # Flux optique (mouvement global)
-            metrics["optical_flow_avg"] = self._compute_optical_flow(gray)
+        except Exception as e:
+            self._logger.warning(f"Erreur extraction métriques: {e}")
+            return self._fallback_metrics()
+    
+    def extract_metrics_batch(self, frames: Any) -> List[Dict[str, float]]:
+        """
+        Extrait les métriques d'un lot de frames consécutives.
+        
+        Les K frames sont d'abord toutes converties et réduites dans une
+        pile contiguë (K, hauteur, largeur) pré-allouée, puis analysées
+        dans l'ordre (le flux optique compare chaque frame à la précédente).
+        
+        Args:
+            frames: Pile numpy (K, H, W, 3) de frames BGR consécutives.
+        
+        Returns:
+            Liste de K dicts de métriques (même format qu'extract_metrics).
+        """
+        if frames is None or len(frames) == 0:
+            return []
+        
+        if not self.is_available:
+            return [self._fallback_metrics() for _ in range(len(frames))]
+        
+        try:
+            count = len(frames)
+            stack = self._gray_stack_buffer(count)
+            # Alloue aussi les buffers de travail à la première utilisation
+            last = self._next_gray_buffer()
             
-            # Densité de clusters (blobs)
-            metrics["cluster_density"] = self._compute_cluster_density(gray)
+            for k in range(count):
+                self._to_analysis_gray(frames[k], stack[k])
             
-            # Sauvegarder pour le prochain calcul de flux optique
-            self._prev_frame = gray.copy()
+            results: List[Dict[str, float]] = []
+            for k in range(count):
+                results.append(self._metrics_from_gray(stack[k]))
+                self._prev_frame = stack[k]
             
-            return metrics
+            # La pile est réutilisée au prochain lot : conserver la dernière
+            # frame dans le double buffer
+            np.copyto(last, stack[count - 1])
+            self._prev_frame = last
+            
+            return results
             
         except Exception as e:
-            self._logger.warning(f"Erreur extraction métriques: {e}")
-            return self._fallback_metrics()
+            self._logger.warning(f"Erreur extraction métriques (lot): {e}")
+            self._prev_frame = None
+            return [self._fallback_metrics() for _ in range(len(frames))]
     
-    def _compute_density(self, zone: Any) -> float:
+    def _to_analysis_gray(self, frame: Any, dst: Any) -> None:
         """
-        Calcule la densité de pixels actifs dans une zone.
+        Convertit une frame BGR en niveaux de gris à la résolution d'analyse.
         
         Args:
-            zone: Zone de l'image (numpy array grayscale).
+            frame: Frame numpy array (BGR).
+            dst: Buffer uint8 (hauteur, largeur) d'analyse à remplir.
+        """
+        if self._use_cuda:
+            try:
+                self._to_analysis_gray_cuda(frame, dst)
+                return
+            except Exception as e:
+                self._logger.warning(f"Chemin CUDA désactivé: {e}")
+                self._use_cuda = False
+        
+        gray_full = self._full_gray_buffer(frame.shape[0], frame.shape[1])
+        cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY, dst=gray_full)
+        cv2.resize(
+            gray_full, ANALYSIS_RESOLUTION, dst=dst,
+            interpolation=cv2.INTER_AREA
+        )
+    
+    def _to_analysis_gray_cuda(self, frame: Any, dst: Any) -> None:
+        """
+        Variante GPU de _to_analysis_gray.
+        
+        Toutes les opérations sont mises en file sur un même cv2.cuda_Stream ;
+        seule la frame réduite est rapatriée dans dst.
+        
+        Args:
+            frame: Frame numpy array (BGR).
+            dst: Buffer uint8 (hauteur, largeur) d'analyse à remplir.
+        """
+        stream = self._cuda_stream
+        self._gpu_frame.upload(frame, stream)
+        cv2.cuda.cvtColor(
+            self._gpu_frame, cv2.COLOR_BGR2GRAY, self._gpu_gray, stream=stream
+        )
+        cv2.cuda.resize(
+            self._gpu_gray, ANALYSIS_RESOLUTION, self._gpu_small,
+            interpolation=cv2.INTER_AREA, stream=stream
+        )
+        self._gpu_small.download(stream, dst)
+        stream.waitForCompletion()
+    
+    def _metrics_from_gray(self, gray: Any) -> Dict[str, float]:
+        """
+        Calcule les 4 métriques sur une frame réduite en niveaux de gris.
+        
+        Args:
+            gray: Frame à la résolution d'analyse.
         
         Returns:
-            Valeur entre 0.0 et 1.0.
+            Dict des métriques (voir extract_metrics).
         """
-        if zone is None or zone.size == 0:
-            return 0.5
+        metrics = {}
+        
+        if HAS_NUMBA:
+            # Densités et flux en un seul passage parallèle
+            density_def, density_off, flow = self._compute_fused_metrics(gray)
+        else:
+            # Zones défensive (tiers inférieur) et offensive (tiers supérieur)
+            density_def, density_off = self._compute_zone_densities(
+                gray, self._def_y, self._off_y
+            )
+            # Flux optique (mouvement global)
+            flow = self._compute_optical_flow(gray)
+        
+        metrics["density_def"] = density_def
+        metrics["density_off"] = density_off
+        metrics["optical_flow_avg"] = flow
+        
+        # Densité de clusters (blobs)
+        metrics["cluster_density"] = self._compute_cluster_density(gray)
+        
+        return metrics
+    
+    def _full_gray_buffer(self, height: int, width: int) -> Any:
+        """
+        Retourne le buffer niveaux de gris pleine résolution.
+        
+        Réalloué uniquement si la résolution du flux change.
+        
+        Args:
+            height: Hauteur de la frame.
+            width: Largeur de la frame.
+        
+        Returns:
+            Buffer numpy uint8 (height, width) à remplir.
+        """
+        if self._gray_full is None or self._gray_full.shape != (height, width):
+            self._gray_full = np.empty((height, width), dtype=np.uint8)
+        
+        return self._gray_full
+    
+    def _next_gray_buffer(self) -> Any:
+        """
+        Retourne le buffer d'analyse qui ne contient pas la frame précédente.
+        
+        Les buffers (résolution ANALYSIS_RESOLUTION) sont alloués à la
+        première frame.
+        
+        Returns:
+            Buffer numpy uint8 (hauteur, largeur) à remplir.
+        """
+        if self._buf_a is None:
+            width, height = ANALYSIS_RESOLUTION
+            self._buf_a = np.empty((height, width), dtype=np.uint8)
+            self._buf_b = np.empty((height, width), dtype=np.uint8)
+            self._binary_buf = np.empty((height, width), dtype=np.uint8)
+            self._blur_buf = np.empty((height, width), dtype=np.uint8)
+        
+        return self._buf_b if self._prev_frame is self._buf_a else self._buf_a
+    
+    def _gray_stack_buffer(self, count: int) -> Any:
+        """
+        Retourne une pile (count, hauteur, largeur) à la résolution d'analyse.
+        
+        Réallouée uniquement si un lot plus grand que les précédents arrive.
+        
+        Args:
+            count: Nombre de frames du lot.
+        
+        Returns:
+            Vue numpy uint8 contiguë sur les count premières frames.
+        """
+        if self._gray_stack is None or self._gray_stack.shape[0] < count:
+            width, height = ANALYSIS_RESOLUTION
+            self._gray_stack = np.empty((count, height, width), dtype=np.uint8)
+        
+        return self._gray_stack[:count]
+    
+    def _compute_zone_densities(
+        self, 
+        gray: Any, 
+        def_y: int, 
+        off_y: int
+    ) -> Tuple[float, float]:
+        """
+        Calcule la densité de pixels actifs des zones défensive et offensive.
+        
+        Un seul seuillage de la frame, puis une projection par ligne :
+        les zones couvrant toute la largeur, leur somme se lit en O(1)
+        dans les sommes cumulées des lignes (image intégrale 1-D).
+        
+        Args:
+            gray: Frame en niveaux de gris.
+            def_y: Première ligne de la zone défensive (jusqu'au bas).
+            off_y: Fin (exclue) de la zone offensive (depuis le haut).
+        
+        Returns:
+            Tuple (density_def, density_off), valeurs entre 0.0 et 1.0.
+        """
+        height, width = gray.shape
         
         # Seuillage simple pour détecter les pixels "actifs"
-        # (joueurs, ballon, lignes = pixels clairs ou très foncés)
-        _, binary = cv2.threshold(zone, 127, 255, cv2.THRESH_BINARY)
+        # (joueurs, ballon, lignes = pixels clairs) → 0 / 1
+        cv2.threshold(gray, 127, 1, cv2.THRESH_BINARY, dst=self._binary_buf)
+        
+        row_counts = cv2.reduce(
+            self._binary_buf, 1, cv2.REDUCE_SUM, dtype=cv2.CV_32S
+        ).ravel()
+        prefix = np.concatenate(([0], np.cumsum(row_counts)))
+        
+        def_rows = height - def_y
+        if def_rows > 0 and width > 0:
+            density_def = float(prefix[height] - prefix[def_y]) / (def_rows * width)
+        else:
+            density_def = 0.5
+        
+        if off_y > 0 and width > 0:
+            density_off = float(prefix[off_y]) / (off_y * width)
+        else:
+            density_off = 0.5
+        
+        return (
+            min(1.0, max(0.0, density_def)),
+            min(1.0, max(0.0, density_off)),
+        )
+    
+    def _compute_fused_metrics(self, gray: Any) -> Tuple[float, float, float]:
+        """
+        Calcule densités de zone et flux optique via le noyau fusionné.
+        
+        Mêmes valeurs que _compute_zone_densities et _compute_optical_flow.
+        
+        Args:
+            gray: Frame en niveaux de gris.
+        
+        Returns:
+            Tuple (density_def, density_off, optical_flow_avg).
+        """
+        height, width = gray.shape
+        def_y, off_y = self._def_y, self._off_y
+        prev = self._prev_frame
+        
+        def_count, off_count, l1 = _metrics_kernel(
+            gray, gray if prev is None else prev, def_y, off_y
+        )
+        
+        def_rows = height - def_y
+        if def_rows > 0 and width > 0:
+            density_def = def_count / (def_rows * width)
+        else:
+            density_def = 0.5
         
-        # Compter les pixels blancs
-        white_pixels = np.sum(binary == 255)
-        total_pixels = binary.size
+        if off_y > 0 and width > 0:
+            density_off = off_count / (off_y * width)
+        else:
+            density_off = 0.5
         
-        density = white_pixels / total_pixels if total_pixels > 0 else 0.5
+        if prev is None:
+            flow = 0.5
+        else:
+            flow = min(1.0, max(0.0, l1 / (gray.size * 255.0) * 5))
         
-        return min(1.0, max(0.0, density))
+        return (
+            min(1.0, max(0.0, density_def)),
+            min(1.0, max(0.0, density_off)),
+            flow,
+        )
     
     def _compute_optical_flow(self, gray: Any) -> float:
         """
@@ -310,11 +710,12 @@ class VisionSignalExtractor:
             return 0.5
         
         try:
-            # Différence absolue entre frames
-            diff = cv2.absdiff(gray, self._prev_frame)
+            # Somme des différences absolues entre frames (norme L1),
+            # sans image de différence intermédiaire
+            l1 = cv2.norm(gray, self._prev_frame, cv2.NORM_L1)
             
             # Moyenne de la différence
-            mean_diff = np.mean(diff) / 255.0
+            mean_diff = l1 / (gray.size * 255.0)
             
             # Normaliser entre 0 et 1
             return min(1.0, max(0.0, mean_diff * 5))  # Facteur d'amplification
@@ -326,7 +727,8 @@ class VisionSignalExtractor:
         """
         Calcule la densité de clusters (groupes de joueurs).
         
-        Approche V1 simple : utilise le nombre de contours détectés.
+        Approche V1 simple : utilise le nombre de composantes connexes
+        (blobs) de taille significative.
         
         Args:
             gray: Frame en niveaux de gris.
@@ -335,29 +737,28 @@ class VisionSignalExtractor:
             Valeur entre 0.0 et 1.0.
         """
         try:
-            # Flouter pour réduire le bruit
-            blurred = cv2.GaussianBlur(gray, (5, 5), 0)
+            # Flouter pour réduire le bruit (noyau gaussien pré-calculé)
+            kernel = self._gauss_kernel
+            blurred = cv2.sepFilter2D(gray, -1, kernel, kernel, dst=self._blur_buf)
             
-            # Seuillage adaptatif
+            # Seuillage adaptatif (Otsu), en place dans le buffer de flou
             _, binary = cv2.threshold(
                 blurred, 0, 255, 
-                cv2.THRESH_BINARY + cv2.THRESH_OTSU
+                cv2.THRESH_BINARY + cv2.THRESH_OTSU,
+                dst=blurred
             )
             
-            # Trouver les contours
-            contours, _ = cv2.findContours(
-                binary, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE
+            # Composantes connexes : les aires sont calculées dans le même
+            # passage, sans construire de contours côté Python
+            _, _, stats, _ = cv2.connectedComponentsWithStats(
+                binary, connectivity=8
             )
             
-            # Filtrer les petits contours (bruit)
-            min_area = gray.size * 0.001  # 0.1% de l'image
-            valid_contours = [
-                c for c in contours 
-                if cv2.contourArea(c) > min_area
-            ]
+            # Filtrer les petites composantes (bruit), hors fond (label 0)
+            areas = stats[1:, cv2.CC_STAT_AREA]
             
             # Normaliser le nombre de clusters (max ~22 joueurs visibles)
-            cluster_count = len(valid_contours)
+            cluster_count = int(np.count_nonzero(areas > self._min_area))
             normalized = min(1.0, cluster_count / 25.0)
             
             return normalized
@@ -439,6 +840,7 @@ class VisionEngine:
         self._stream_handler = VideoStreamHandler()
         self._signal_extractor = VisionSignalExtractor()
         self._version = VISION_ENGINE_VERSION
+        self._frames_read = 0
         self._logger = logging.getLogger(__name__)
     
     @property
@@ -478,38 +880,110 @@ class VisionEngine:
         try:
             self._stream_handler.open(video_url)
             
-            frame_idx = 0
-            while True:
+            # Décodage dans un thread dédié (file bornée) : décodage et
+            # extraction se recouvrent, OpenCV relâchant le GIL.
+            frame_queue: queue.Queue = queue.Queue(maxsize=FRAME_QUEUE_SIZE)
+            stop_event = threading.Event()
+            decoder = threading.Thread(
+                target=self._decode_loop,
+                args=(frame_queue, stop_event, sample_interval),
+                daemon=True,
+            )
+            decoder.start()
+        except VideoStreamError:
+            self._stream_handler.close()
+            raise
+        
+        try:
+            # Timestamps dérivés de l'index de frame : une seule horloge
+            # pour tout le flux
+            fps = self._stream_handler.fps or 25.0
+            start = datetime.now()
+            
+            # La file ne contient que les frames échantillonnées
+            while (item := frame_queue.get()) is not None:
+                frame_idx, raw_frame = item
+                
+                metrics = self._signal_extractor.extract_metrics(raw_frame)
+                
+                frames.append(Frame(
+                    timestamp=start + timedelta(seconds=frame_idx / fps),
+                    metrics=metrics
+                ))
+            
+        except Exception as e:
+            self._logger.error(f"Erreur traitement flux: {e}")
+        finally:
+            stop_event.set()
+            decoder.join()
+            self._stream_handler.close()
+        
+        self._logger.info(f"Traité {self._frames_read} frames, {len(frames)} échantillons")
+        
+        return frames
+    
+    def _decode_loop(
+        self, 
+        frame_queue: queue.Queue, 
+        stop_event: threading.Event,
+        sample_interval: int
+    ) -> None:
+        """
+        Boucle du thread de décodage : lit les frames et pousse les frames
+        échantillonnées dans la file.
+        
+        Les frames hors échantillon sont seulement avancées (grab_frame),
+        sans récupération de l'image. Chaque élément poussé est un tuple
+        (index, frame) ; None signale la fin du flux (ou une erreur).
+        
+        Args:
+            frame_queue: File bornée vers le thread d'extraction.
+            stop_event: Arrêt demandé par le consommateur.
+            sample_interval: Intervalle d'échantillonnage (nombre de frames).
+        """
+        frame_idx = 0
+        try:
+            while not stop_event.is_set():
+                if frame_idx % sample_interval != 0:
+                    if not self._stream_handler.grab_frame():
+                        break
+                    frame_idx += 1
+                    continue
+                
                 raw_frame = self._stream_handler.read_frame()
                 
                 if raw_frame is None:
                     break
                 
-                # Échantillonner selon l'intervalle
-                if frame_idx % sample_interval == 0:
-                    metrics = self._signal_extractor.extract_metrics(raw_frame)
-                    
-                    # Calculer le timestamp approximatif
-                    fps = self._stream_handler.fps or 25.0
-                    timestamp = datetime.now()  # En prod: calculer depuis le début
-                    
-                    frames.append(Frame(
-                        timestamp=timestamp,
-                        metrics=metrics
-                    ))
+                if not self._put_frame(frame_queue, (frame_idx, raw_frame), stop_event):
+                    return
                 
                 frame_idx += 1
-            
-            self._logger.info(f"Traité {frame_idx} frames, {len(frames)} échantillons")
-            
-        except VideoStreamError:
-            raise
         except Exception as e:
-            self._logger.error(f"Erreur traitement flux: {e}")
+            self._logger.error(f"Erreur décodage flux: {e}")
         finally:
-            self._stream_handler.close()
+            self._frames_read = frame_idx
+            self._put_frame(frame_queue, None, stop_event)
+    
+    @staticmethod
+    def _put_frame(
+        frame_queue: queue.Queue, 
+        item: Optional[Tuple[int, Any]], 
+        stop_event: threading.Event
+    ) -> bool:
+        """
+        Pousse un élément dans la file sans bloquer au-delà d'un arrêt demandé.
         
-        return frames
+        Returns:
+            True si l'élément a été ajouté, False si l'arrêt a été demandé.
+        """
+        while not stop_event.is_set():
+            try:
+                frame_queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
     
     def extract_signals(self, frames: List[Frame]) -> Dict[str, float]:
         """
@@ -524,6 +998,16 @@ class VisionEngine:
         if not frames:
             return self._signal_extractor._fallback_metrics()
         
+        # Chemin vectorisé : schéma fixe (METRIC_KEYS) sur toutes les frames
+        if HAS_NUMPY and all(
+            frame.metrics.keys() == METRIC_KEY_SET for frame in frames
+        ):
+            matrix = np.array(
+                [[frame.metrics[key] for key in METRIC_KEYS] for frame in frames],
+                dtype=np.float64,
+            )
+            return dict(zip(METRIC_KEYS, matrix.mean(axis=0).tolist()))
+        
         # Initialiser les accumulateurs
         aggregated: Dict[str, List[float]] = {}
         
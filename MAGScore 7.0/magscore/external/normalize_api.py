@@ -30,7 +30,16 @@ Métriques ACCEPTÉES (raw data) :
 """
 
 from typing import Dict, Any, Optional, List, Set, Tuple
+from functools import lru_cache
 import logging
+import re
+
+try:
+    import ahocorasick
+    HAS_AHOCORASICK = True
+except ImportError:
+    HAS_AHOCORASICK = False
+    ahocorasick = None
 
 # Configuration du logger
 logger = logging.getLogger(__name__)
@@ -76,6 +85,59 @@ OPAQUE_METRICS_BLACKLIST: frozenset = frozenset([
 ])
 
 
+# Sous-chaînes signalant une variante de métrique opaque
+OPAQUE_PATTERNS: Tuple[str, ...] = (
+    "momentum",
+    "pressure_index",
+    "power_rating",
+    "attack_strength",
+    "defense_rating",
+    "win_prob",
+    "match_odds",
+)
+
+
+def _minimal_patterns(terms) -> Tuple[str, ...]:
+    """
+    Réduit un ensemble de termes aux seuls termes nécessaires.
+    
+    Un terme contenant déjà un autre terme est couvert par celui-ci
+    (ex. "attack_momentum" par "momentum") et peut être retiré.
+    
+    Args:
+        terms: Termes à réduire.
+    
+    Returns:
+        Tuple trié des termes minimaux.
+    """
+    terms = set(terms)
+    return tuple(sorted(
+        term for term in terms
+        if not any(other != term and other in term for other in terms)
+    ))
+
+
+# Sous-chaînes des variantes : toute clé contenant l'une d'elles est opaque
+OPAQUE_MATCH_PATTERNS: Tuple[str, ...] = _minimal_patterns(OPAQUE_PATTERNS)
+
+# Alternance compilée une seule fois : clé entière de la blacklist, ou clé
+# contenant un pattern (un seul parcours de la clé)
+OPAQUE_PATTERNS_RE = re.compile(
+    r"\A(?:" + "|".join(map(re.escape, sorted(OPAQUE_METRICS_BLACKLIST))) + r")\Z|"
+    + "|".join(map(re.escape, OPAQUE_MATCH_PATTERNS))
+)
+
+# Automate Aho-Corasick des patterns (si pyahocorasick est installé)
+if HAS_AHOCORASICK:
+    OPAQUE_AUTOMATON = ahocorasick.Automaton()
+    for _pattern in OPAQUE_MATCH_PATTERNS:
+        OPAQUE_AUTOMATON.add_word(_pattern, _pattern)
+    OPAQUE_AUTOMATON.make_automaton()
+    del _pattern
+else:
+    OPAQUE_AUTOMATON = None
+
+
 # =============================================================================
 # WHITELIST — DONNÉES BRUTES AUTORISÉES (RAW DATA ONLY)
 # =============================================================================
@@ -225,6 +287,17 @@ RAW_DATA_WHITELIST: frozenset = frozenset([
 ])
 
 
+# =============================================================================
+# SCHÉMA DES DONNÉES DE MATCH
+# =============================================================================
+
+# Blocs équipe : (clé normalisée, alias accepté dans les données API)
+MATCH_TEAM_FIELDS: Tuple[Tuple[str, str], ...] = (
+    ("home_team", "home"),
+    ("away_team", "away"),
+)
+
+
 # =============================================================================
 # SANITIZER FUNCTIONS
 # =============================================================================
@@ -254,24 +327,20 @@ def normalize(raw_api_data: Dict[str, Any]) -> Dict[str, Any]:
     if not raw_api_data:
         return {}
     
-    sanitized: Dict[str, Any] = {}
-    rejected_keys: List[str] = []
-    
-    for key, value in raw_api_data.items():
-        # Normaliser la clé en lowercase pour comparaison
-        key_lower = key.lower().strip()
-        
-        # Vérifier si la clé est dans la blacklist
-        if _is_opaque_metric(key_lower):
-            rejected_keys.append(key)
-            continue
-        
-        # Conserver la donnée (avec clé originale ou normalisée)
-        sanitized[key_lower] = value
-    
-    # Log des clés rejetées (utile pour debug)
-    if rejected_keys:
-        logger.debug(f"Métriques opaques rejetées : {rejected_keys}")
+    # Clé normalisée (lowercase) et verdict blacklist, mis en cache :
+    # seules les données non opaques sont conservées
+    sanitized: Dict[str, Any] = {
+        key_lower: value
+        for key, value in raw_api_data.items()
+        for key_lower, opaque in (_norm_key(key),)
+        if not opaque
+    }
+    
+    # Log des clés rejetées (utile pour debug), construit seulement si actif
+    if logger.isEnabledFor(logging.DEBUG):
+        rejected_keys = get_rejected_metrics(raw_api_data)
+        if rejected_keys:
+            logger.debug(f"Métriques opaques rejetées : {rejected_keys}")
     
     return sanitized
 
@@ -300,31 +369,23 @@ def normalize_match_data(raw_match_data: Dict[str, Any]) -> Optional[Dict[str, A
     if not raw_match_data:
         return None
     
+    get = raw_match_data.get
     result: Dict[str, Any] = {
-        'match_id': raw_match_data.get('match_id', 'unknown'),
-        'timestamp': raw_match_data.get('timestamp', ''),
+        'match_id': get('match_id', 'unknown'),
+        'timestamp': get('timestamp', ''),
         'metadata': {
             'sanitized': True,
             'source': 'normalize_api',
         }
     }
     
-    # Sanitize home_team data
-    home_data = raw_match_data.get('home_team', raw_match_data.get('home', {}))
-    if isinstance(home_data, dict):
-        result['home_team'] = normalize(home_data)
-    else:
-        result['home_team'] = {}
-    
-    # Sanitize away_team data
-    away_data = raw_match_data.get('away_team', raw_match_data.get('away', {}))
-    if isinstance(away_data, dict):
-        result['away_team'] = normalize(away_data)
-    else:
-        result['away_team'] = {}
+    # Sanitize home_team / away_team data (alias lu seulement si absent)
+    for field, alias in MATCH_TEAM_FIELDS:
+        team_data = raw_match_data[field] if field in raw_match_data else get(alias, {})
+        result[field] = normalize(team_data) if isinstance(team_data, dict) else {}
     
     # Sanitize events (si présents)
-    events = raw_match_data.get('events', [])
+    events = get('events', [])
     if isinstance(events, list):
         result['events'] = [normalize(event) for event in events if isinstance(event, dict)]
     else:
@@ -343,26 +404,31 @@ def _is_opaque_metric(key: str) -> bool:
     Returns:
         True si la métrique est opaque/interdite.
     """
-    # Vérification exacte
-    if key in OPAQUE_METRICS_BLACKLIST:
-        return True
-    
-    # Vérification par pattern (pour les variantes)
-    opaque_patterns = [
-        "momentum",
-        "pressure_index",
-        "power_rating",
-        "attack_strength",
-        "defense_rating",
-        "win_prob",
-        "match_odds",
-    ]
-    
-    for pattern in opaque_patterns:
-        if pattern in key:
+    # Blacklist : clé entière ; patterns : sous-chaîne de la clé
+    if OPAQUE_AUTOMATON is not None:
+        if key in OPAQUE_METRICS_BLACKLIST:
             return True
+        return next(OPAQUE_AUTOMATON.iter(key), None) is not None
     
-    return False
+    return OPAQUE_PATTERNS_RE.search(key) is not None
+
+
+@lru_cache(maxsize=512)
+def _norm_key(key: str) -> Tuple[str, bool]:
+    """
+    Normalise une clé API et indique si elle désigne une métrique opaque.
+    
+    Les APIs renvoient toujours les mêmes noms de champs : le résultat
+    est mis en cache pour éviter de refaire lower/strip et le filtrage.
+    
+    Args:
+        key: Clé brute telle que fournie par l'API.
+    
+    Returns:
+        Tuple (clé normalisée, est_opaque).
+    """
+    key_lower = key.lower().strip()
+    return key_lower, _is_opaque_metric(key_lower)
 
 
 def is_opaque_metric(metric_name: str) -> bool:
@@ -375,7 +441,7 @@ def is_opaque_metric(metric_name: str) -> bool:
     Returns:
         True si la métrique est opaque/interdite.
     """
-    return _is_opaque_metric(metric_name.lower().strip())
+    return _norm_key(metric_name)[1]
 
 
 def is_raw_metric(metric_name: str) -> bool:
@@ -409,19 +475,20 @@ def validate_data_integrity(data: Dict[str, Any]) -> Tuple[bool, List[str]]:
     """
     issues: List[str] = []
     
-    for key, value in data.items():
-        # Vérifier absence de métriques opaques
-        if _is_opaque_metric(key.lower()):
-            issues.append(f"Métrique opaque détectée : {key}")
-        
-        # Vérifier types basiques
-        if value is None:
-            continue
-        
-        if isinstance(value, dict):
-            # Validation récursive
-            sub_valid, sub_issues = validate_data_integrity(value)
-            issues.extend(sub_issues)
+    # Parcours en profondeur sans récursion : une pile d'itérateurs,
+    # les sous-dicts sont visités juste après leur clé (même ordre)
+    stack = [iter(data.items())]
+    while stack:
+        for key, value in stack[-1]:
+            # Vérifier absence de métriques opaques (verdict en cache)
+            if _norm_key(key)[1]:
+                issues.append(f"Métrique opaque détectée : {key}")
+            
+            if isinstance(value, dict):
+                stack.append(iter(value.items()))
+                break
+        else:
+            stack.pop()
     
     return (len(issues) == 0, issues)
 
@@ -440,7 +507,7 @@ def get_rejected_metrics(raw_data: Dict[str, Any]) -> List[str]:
     """
     return [
         key for key in raw_data.keys()
-        if _is_opaque_metric(key.lower().strip())
+        if _norm_key(key)[1]
     ]
 
 
@@ -8,16 +8,45 @@ Chaque module extrait les signaux bruts de son domaine :
 - IntensityModule : signaux d'intensité physique
 - PsychologyModule : signaux psychologiques
 - CohesionModule : signaux de cohésion collective
+
+Les méthodes compute_*_batch calculent les signaux de plusieurs matchs,
+empilés en colonnes numpy. StatsView résout une fois par match les
+statistiques globales et last_15 lues par les quatre modules ;
+compute_all_global calcule en un appel les signaux globaux des quatre, à
+partir des données ou d'un StatsRecord (statistiques globales résolues).
+Les méthodes compute_*_signals retournent les signaux en namedtuples figés
+(StabilitySignals, ...) sans construire de dict.
+
+Avec Numba, les noyaux de calcul sont compilés à l'import du package
+(désactivable avec la variable d'environnement MAGSCORE_NO_WARMUP).
 """
 
-from .stability import StabilityModule
-from .intensity import IntensityModule
-from .psychology import PsychologyModule
-from .cohesion import CohesionModule
+import os
+
+from .stability import StabilityModule, StabilitySignals
+from .intensity import IntensityModule, IntensitySignals
+from .psychology import PsychologyModule, PsychologySignals
+from .cohesion import CohesionModule, CohesionSignals
+from .stats_view import StatsView
+from .stats_record import NormalizedStats, StatsRecord
+from .combined import compute_all_global
+from ._kernels import warmup_kernels
 
 __all__ = [
     "StabilityModule",
     "IntensityModule",
     "PsychologyModule",
     "CohesionModule",
+    "StabilitySignals",
+    "IntensitySignals",
+    "PsychologySignals",
+    "CohesionSignals",
+    "StatsView",
+    "NormalizedStats",
+    "StatsRecord",
+    "compute_all_global",
 ]
+
+# Compilation des noyaux hors du premier calcul réel
+if not os.environ.get("MAGSCORE_NO_WARMUP"):
+    warmup_kernels()
@@ -0,0 +1,402 @@
+"""
+MAGScore 7.0 — Noyaux de calcul des modules
+============================================
+Arithmétique des signaux des quatre modules, isolée de la lecture des
+données : chaque noyau reçoit des floats et retourne un tuple de 4 signaux
+bornés, dans l'ordre des clés du dict produit par le module.
+
+Compilés avec Numba (@njit) si disponible, sinon exécutés en Python pur.
+L'arrondi final à 3 décimales n'est pas dans les noyaux : round_signals
+l'applique en Python (round de CPython, correctement arrondi), le round
+de Numba pouvant différer de 0.001 aux frontières d'arrondi.
+"""
+
+from typing import Any, Callable, Tuple
+
+from .._jit import HAS_NUMBA, njit
+
+
+# Inverses exacts (puissances de deux) des seuils de normalisation : la
+# multiplication donne le même résultat que la division, au bit près.
+# Les autres seuils restent des divisions : un inverse arrondi décale
+# certains signaux de 0.001 au voisinage d'un arrondi.
+INV_2 = 1.0 / 2.0
+INV_4 = 1.0 / 4.0
+INV_8 = 1.0 / 8.0
+
+
+@njit(inline="always")
+def _clip01(x):
+    """
+    Borne x à [0, 1] : équivalent de min(1.0, max(0.0, x)), NaN → 0.0.
+    
+    Un seul appel au lieu de deux builtins en Python pur ; sous Numba,
+    inliné et compilé en minsd/maxsd.
+    """
+    return x if 0.0 < x < 1.0 else (1.0 if x >= 1.0 else 0.0)
+
+
+@njit(inline="always")
+def _clip01_nan_high(x):
+    """
+    Borne x à [0, 1] : équivalent de max(0.0, min(1.0, x)), NaN → 1.0.
+    
+    Variante de _clip01 pour les signaux historiquement bornés dans cet
+    ordre (min puis max), qui ramène NaN à 1.0 et non à 0.0.
+    """
+    return x if 0.0 < x < 1.0 else (0.0 if x <= 0.0 else 1.0)
+
+
+# Nombre de jeux de statistiques mémorisés par noyau (cache LRU des modules)
+SIGNAL_CACHE_SIZE = 4096
+
+
+def round_signals(signals: Tuple[float, ...]) -> Tuple[float, ...]:
+    """
+    Arrondit à 3 décimales les signaux retournés par un noyau.
+    
+    Toujours en Python : les signaux publiés sont ceux de round(x, 3) de
+    CPython, que les noyaux soient compilés ou non.
+    """
+    return tuple([round(signal, 3) for signal in signals])
+
+
+# =============================================================================
+# COHESION
+# =============================================================================
+
+# Paramètres des fenêtres de cohésion : (distance de référence, sprints de
+# référence, poids des passes clés, poids des assists, diviseur de coordination)
+COHESION_GLOBAL_PARAMS = (110.0, 150.0, 2.0, 5.0, 20.0)
+COHESION_LAST_15_PARAMS = (18.0, 25.0, 3.0, 6.0, 12.0)  # ~1/6 du match
+
+
+@njit(cache=True)
+def _cohesion(passes_total, passes_completed, passes_accuracy, possession,
+              key_passes, assists, distance, sprints, params):
+    """Signaux de cohésion d'une fenêtre, selon ses paramètres (voir ci-dessus)."""
+    distance_ref, sprints_ref, key_pass_weight, assist_weight, coordination_div = params
+    
+    if passes_accuracy > 0:
+        passing_accuracy_score = min(1.0, passes_accuracy / 100)
+    elif passes_total > 0:
+        passing_accuracy_score = passes_completed / passes_total
+    else:
+        passing_accuracy_score = 0.5
+    
+    # Normaliser: 50% = 0.5, 70% = 0.9
+    if possession > 0:
+        possession_control = min(1.0, (possession - 30) / 50)
+    else:
+        possession_control = 0.5
+    possession_control = max(0.0, possession_control)
+    
+    coordination_score = (
+        (key_passes * key_pass_weight + assists * assist_weight) / coordination_div
+    )
+    team_coordination = _clip01(coordination_score)
+    
+    if distance > 0:
+        movement_score = (distance / distance_ref) * 0.5 + (sprints / sprints_ref) * 0.5
+    else:
+        movement_score = 0.5
+    collective_movement = _clip01(movement_score)
+    
+    return (
+        passing_accuracy_score,
+        possession_control,
+        team_coordination,
+        collective_movement,
+    )
+
+
+@njit(cache=True)
+def _cohesion_global(passes_total, passes_completed, passes_accuracy, possession,
+                     key_passes, assists, distance, sprints):
+    """Signaux de cohésion (0-90') : voir CohesionModule.compute_global."""
+    return _cohesion(passes_total, passes_completed, passes_accuracy, possession,
+                     key_passes, assists, distance, sprints, COHESION_GLOBAL_PARAMS)
+
+
+@njit(cache=True)
+def _cohesion_last_15(passes_total, passes_completed, passes_accuracy, possession,
+                      key_passes, assists, distance, sprints):
+    """Signaux de cohésion (75-90') : voir CohesionModule.compute_last_15."""
+    return _cohesion(passes_total, passes_completed, passes_accuracy, possession,
+                     key_passes, assists, distance, sprints, COHESION_LAST_15_PARAMS)
+
+
+# =============================================================================
+# INTENSITY
+# =============================================================================
+
+@njit(cache=True)
+def _intensity_global(interceptions, ball_recoveries, duels_total, duels_won,
+                      distance, sprints):
+    """Signaux d'intensité (0-90') : voir IntensityModule.compute_global."""
+    # ~25 récupérations = pressing intense
+    pressing_actions = ball_recoveries + interceptions
+    pressing_wave = _clip01(pressing_actions / 25)
+    
+    # Ratios de duels gagnés / perdus, sous le même test
+    if duels_total > 0:
+        duel_win_ratio = duels_won / duels_total
+        duel_loss_ratio = (duels_total - duels_won) / duels_total
+    else:
+        duel_win_ratio = 0.5
+        duel_loss_ratio = 0.5
+    
+    # Ajuster pour que > 55% de duels gagnés = haute pression
+    high_duel_pressure = _clip01((duel_win_ratio - 0.3) / 0.4)
+    
+    if distance > 0 and sprints > 0:
+        # Ratio sprints/distance - si bas = fatigue potentielle
+        sprint_ratio = sprints / (distance / 1000)  # sprints par km
+        running_distance_drop = _clip01_nan_high(0.5 - sprint_ratio / 20)
+    else:
+        running_distance_drop = 0.3  # Valeur neutre
+    
+    # Spike si > 50% de duels perdus
+    duel_loss_spike = _clip01((duel_loss_ratio - 0.3) / 0.4)
+    
+    return (
+        pressing_wave,
+        high_duel_pressure,
+        running_distance_drop,
+        duel_loss_spike,
+    )
+
+
+@njit(cache=True)
+def _intensity_last_15(interceptions, ball_recoveries, duels_total, duels_won,
+                       distance_last_15, distance_global, sprints):
+    """Signaux d'intensité (75-90') : voir IntensityModule.compute_last_15."""
+    # Seuil ajusté pour 15 minutes (~4-5 récupérations = bon pressing)
+    pressing_actions = ball_recoveries + interceptions
+    pressing_wave = _clip01(pressing_actions * INV_8)
+    
+    # Ratios de duels gagnés / perdus, sous le même test
+    if duels_total > 0:
+        duel_win_ratio = duels_won / duels_total
+        duel_loss_ratio = (duels_total - duels_won) / duels_total
+    else:
+        duel_win_ratio = 0.5
+        duel_loss_ratio = 0.5
+    
+    high_duel_pressure = _clip01((duel_win_ratio - 0.3) / 0.4)
+    
+    if distance_global > 0 and distance_last_15 > 0:
+        # Attendu: ~1/6 de la distance totale dans les 15 dernières min
+        expected_last_15 = distance_global / 6
+        if expected_last_15 > 0:
+            drop_ratio = 1.0 - (distance_last_15 / expected_last_15)
+            running_distance_drop = _clip01_nan_high(drop_ratio + 0.3)
+        else:
+            running_distance_drop = 0.5
+    else:
+        # Sans données précises, utiliser les sprints comme proxy
+        running_distance_drop = _clip01_nan_high(0.8 - sprints / 10)
+    
+    # Spike accentué en fin de match
+    duel_loss_spike = _clip01((duel_loss_ratio - 0.25) / 0.35)
+    
+    return (
+        pressing_wave,
+        high_duel_pressure,
+        running_distance_drop,
+        duel_loss_spike,
+    )
+
+
+# =============================================================================
+# PSYCHOLOGY
+# =============================================================================
+
+@njit(cache=True)
+def _psychology_global(fouls, yellow_cards, red_cards, interceptions, tackles,
+                       clearances, duels_won, ball_recoveries):
+    """Signaux psychologiques (0-90') : voir PsychologyModule.compute_global."""
+    # Pondérer les cartons dans le calcul de frustration
+    foul_score = fouls + (yellow_cards * 3) + (red_cards * 6)
+    fouls_spike = _clip01(foul_score / 20)  # ~20 = frustration élevée
+    
+    # Plus de jaunes = plus de protestations probables
+    protest_score = (yellow_cards * 2) + (red_cards * 3)
+    if fouls > 10:
+        protest_score += (fouls - 10) * 0.3
+    protest_pattern = _clip01(protest_score / 6)
+    
+    recovery_actions = interceptions + tackles + clearances
+    high_defensive_recovery = _clip01(recovery_actions / 40)
+    
+    pressing_effort = (duels_won + ball_recoveries) / 30
+    late_pressing_effort = _clip01(pressing_effort)
+    
+    return (
+        fouls_spike,
+        protest_pattern,
+        high_defensive_recovery,
+        late_pressing_effort,
+    )
+
+
+@njit(cache=True)
+def _psychology_last_15(fouls, yellow_cards, red_cards, interceptions, tackles,
+                        clearances, blocks, duels_won, ball_recoveries, sprints):
+    """Signaux psychologiques (75-90') : voir PsychologyModule.compute_last_15."""
+    # En fin de match, moins de fautes nécessaires pour spike
+    foul_score = fouls + (yellow_cards * 4) + (red_cards * 8)
+    fouls_spike = _clip01(foul_score * INV_8)  # Seuil réduit pour 15 min
+    
+    protest_score = (yellow_cards * 3) + (red_cards * 4)
+    if fouls > 3:
+        protest_score += (fouls - 3) * 0.5
+    protest_pattern = _clip01(protest_score * INV_4)
+    
+    # En fin de match, moins d'actions nécessaires pour démontrer résilience
+    recovery_actions = interceptions + tackles + clearances + blocks
+    high_defensive_recovery = _clip01(recovery_actions / 12)
+    
+    # Combinaison de duels, récupérations et sprints
+    pressing_effort = (duels_won + ball_recoveries + sprints) / 15
+    late_pressing_effort = _clip01(pressing_effort)
+    
+    return (
+        fouls_spike,
+        protest_pattern,
+        high_defensive_recovery,
+        late_pressing_effort,
+    )
+
+
+# =============================================================================
+# STABILITY
+# =============================================================================
+
+@njit(cache=True)
+def _stability_global(interceptions, tackles, shots_against, clearances, blocks,
+                      saves, shots_on_target_against, xg_against):
+    """Signaux de stabilité (0-90') : voir StabilityModule.compute_global."""
+    # Plus d'interceptions/tacles et moins de tirs = plus compact
+    defensive_actions = interceptions + tackles
+    if shots_against > 0:
+        compactness_raw = defensive_actions / (shots_against * 3)
+    else:
+        compactness_raw = defensive_actions / 15
+    high_compactness = _clip01(compactness_raw)
+    
+    # Normalisé sur ~20 actions de low block
+    low_block_actions = clearances + blocks + saves
+    successful_low_block = _clip01(low_block_actions / 20)
+    
+    if defensive_actions > 0:
+        drop_ratio = shots_on_target_against / (defensive_actions + 1)
+    else:
+        drop_ratio = shots_on_target_against / 5
+    low_block_drop = _clip01(drop_ratio)
+    
+    if xg_against > 0:
+        xg_against_spike = min(1.0, xg_against * INV_2)  # 2.0 xG = spike max
+    else:
+        # Estimation via tirs cadrés concédés
+        xg_against_spike = min(1.0, shots_on_target_against / 6)
+    
+    return (
+        low_block_drop,
+        xg_against_spike,
+        high_compactness,
+        successful_low_block,
+    )
+
+
+@njit(cache=True)
+def _stability_last_15(interceptions, tackles, shots_against, clearances, blocks,
+                       saves, shots_on_target_against, xg_against):
+    """Signaux de stabilité (75-90') : voir StabilityModule.compute_last_15."""
+    # En fin de match, moins d'actions défensives = potentiel effondrement
+    defensive_actions = interceptions + tackles
+    if shots_against > 0:
+        compactness_raw = defensive_actions / (shots_against * 2)
+    else:
+        compactness_raw = defensive_actions / 10
+    high_compactness = _clip01(compactness_raw)
+    
+    low_block_actions = clearances + blocks + saves
+    successful_low_block = _clip01(low_block_actions / 10)
+    
+    # Multiplier pour sensibilité fin de match
+    drop_ratio = (shots_on_target_against * 1.5) / (defensive_actions + 1)
+    low_block_drop = _clip01(drop_ratio)
+    
+    if xg_against > 0:
+        xg_against_spike = min(1.0, xg_against)  # Seuil plus bas pour 15 min
+    else:
+        xg_against_spike = min(1.0, shots_on_target_against / 3)
+    
+    return (
+        low_block_drop,
+        xg_against_spike,
+        high_compactness,
+        successful_low_block,
+    )
+
+
+# =============================================================================
+# FUSION (4 modules, 0-90')
+# =============================================================================
+
+@njit(cache=True)
+def _all_global(cohesion, intensity, psychology, stability):
+    """
+    Signaux globaux des 4 modules en un seul appel (16 valeurs).
+    
+    Chaque argument est le tuple des arguments du noyau global du module,
+    défauts dérivés résolus (voir les _global_inputs des modules). Ordre
+    de sortie : cohésion, intensité, psychologie, stabilité.
+    """
+    return (
+        _cohesion_global(*cohesion)
+        + _intensity_global(*intensity)
+        + _psychology_global(*psychology)
+        + _stability_global(*stability)
+    )
+
+
+# =============================================================================
+# WARMUP
+# =============================================================================
+
+# Noyaux compilés au chargement du package (voir warmup_kernels), en plus
+# de _all_global
+WARMUP_KERNELS = (
+    _cohesion_global, _cohesion_last_15,
+    _intensity_global, _intensity_last_15,
+    _psychology_global, _psychology_last_15,
+    _stability_global, _stability_last_15,
+)
+
+# Noyaux globaux appelés par _all_global, dans l'ordre de ses arguments
+FUSED_GLOBAL_KERNELS = (
+    _cohesion_global, _intensity_global, _psychology_global, _stability_global,
+)
+
+
+def warmup_kernels() -> None:
+    """
+    Compile les noyaux Numba en les appelant une fois (statistiques fictives).
+    
+    Sort la compilation LLVM du premier calcul réel ; avec cache=True, les
+    processus suivants rechargent le code compilé depuis __pycache__.
+    Sans Numba, ne fait rien.
+    """
+    if not HAS_NUMBA:
+        return
+    
+    for kernel in WARMUP_KERNELS:
+        kernel(*_warmup_args(kernel))
+    _all_global(*map(_warmup_args, FUSED_GLOBAL_KERNELS))
+
+
+def _warmup_args(kernel: Callable[..., Any]) -> Tuple[float, ...]:
+    """Statistiques fictives (1.0) pour chaque argument d'un noyau."""
+    return (1.0,) * getattr(kernel, "py_func", kernel).__code__.co_argcount
@@ -0,0 +1,123 @@
+"""
+MAGScore 7.0 — Lecture des statistiques des modules
+====================================================
+Extraction en une passe des statistiques lues par un calcul de signaux.
+
+Chaque calcul décrit ses entrées par une SPEC : un tuple de triplets
+(clé principale, clé de repli ou None, valeur par défaut). La valeur
+par défaut DERIVED signale une valeur dérivée d'une autre statistique
+(ex. passes_completed ≈ passes_total × 0.8), résolue par l'appelant.
+
+Les signaux calculés sont retournés dans des namedtuples figés (un type
+par module) ; la conversion en dict n'a lieu qu'à la frontière de l'API.
+Les calculs par lot (compute_*_batch) empilent ces tuples en colonnes
+numpy (stack_signals).
+"""
+
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+    np = None
+
+
+# Entrée d'une SPEC : (clé principale, clé de repli, valeur par défaut)
+StatSpec = Tuple[Tuple[str, Optional[str], Any], ...]
+
+# Valeur par défaut dérivée d'une autre statistique (résolue par l'appelant)
+DERIVED = object()
+
+# Clés des statistiques des 15 dernières minutes, par ordre de priorité
+LAST_15_KEYS: Tuple[str, ...] = ("last_15_min", "money_time")
+
+
+class _SignalsTuple:
+    """
+    Base des sorties de signaux (à combiner avec un namedtuple).
+    
+    Accès par attribut sans hachage de clé ; to_dict() fournit le dict
+    {signal: valeur} attendu par les appelants historiques.
+    """
+    __slots__ = ()
+    
+    # Clés des signaux, dans l'ordre des champs (redéfini par chaque type)
+    KEYS: Tuple[str, ...] = ()
+    
+    def to_dict(self) -> Dict[str, float]:
+        """Retourne les signaux sous forme de dict, dans l'ordre de KEYS."""
+        return dict(zip(self.KEYS, self))
+
+
+# Marqueur de clé absente (distinct d'une valeur None explicite)
+_MISSING = object()
+
+
+def _extract(stats: Dict[str, Any], spec: StatSpec) -> List[Optional[float]]:
+    """
+    Lit les statistiques décrites par une SPEC, dans son ordre.
+    
+    La clé de repli n'est consultée que si la clé principale est absente.
+    
+    Args:
+        stats: Statistiques du match (ou de la période).
+        spec: Triplets (clé principale, clé de repli, défaut).
+    
+    Returns:
+        Liste des valeurs converties en float ; None pour une valeur
+        absente dont le défaut est dérivé (à résoudre par l'appelant).
+    """
+    values: List[Optional[float]] = []
+    for key, fallback, default in spec:
+        value = stats.get(key, _MISSING)
+        if value is _MISSING:
+            value = default if fallback is None else stats.get(fallback, default)
+        values.append(None if value is DERIVED else float(value))
+    
+    return values
+
+
+def _first(data: Dict[str, Any], keys: Sequence[str], default: Any) -> Any:
+    """
+    Retourne la valeur de la première clé présente dans data.
+    
+    Équivalent de data.get(a, data.get(b, default)), sans lookup ni
+    évaluation du défaut une fois une clé trouvée.
+    
+    Args:
+        data: Dict à consulter.
+        keys: Clés par ordre de priorité.
+        default: Valeur si aucune clé n'est présente.
+    
+    Returns:
+        Valeur trouvée, ou default.
+    """
+    for key in keys:
+        value = data.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+    
+    return default
+
+
+def stack_signals(
+    keys: Sequence[str],
+    rows: Sequence[Sequence[float]]
+) -> Dict[str, Any]:
+    """
+    Empile les signaux de N matchs en colonnes.
+    
+    Args:
+        keys: Clés des signaux, dans l'ordre des tuples de rows.
+        rows: Signaux de chaque match (un tuple par match).
+    
+    Returns:
+        Dict {clé: tableau de N valeurs} (lignes contiguës de la matrice).
+    """
+    if not HAS_NUMPY:
+        raise ImportError("numpy est requis pour le calcul des signaux par lot")
+    
+    matrix = np.array(rows, dtype=np.float64).reshape(len(rows), len(keys))
+    return dict(zip(keys, np.ascontiguousarray(matrix.T)))
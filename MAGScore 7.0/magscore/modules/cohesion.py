@@ -14,7 +14,90 @@ Signaux auxiliaires extraits :
     - collective_movement
 """
 
-from typing import Dict, Any
+from collections import namedtuple
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Sequence, Tuple, Union
+
+from .stats_view import StatsView
+from ._kernels import (
+    SIGNAL_CACHE_SIZE,
+    _cohesion_global,
+    _cohesion_last_15,
+    round_signals,
+)
+from ._stats import DERIVED, StatSpec, _SignalsTuple, _extract, stack_signals
+
+
+# Clés des signaux produits, dans l'ordre des noyaux de calcul
+COHESION_SIGNALS: Tuple[str, ...] = (
+    "passing_accuracy_score",
+    "possession_control",
+    "team_coordination",
+    "collective_movement",
+)
+
+
+class CohesionSignals(_SignalsTuple, namedtuple("CohesionSignals", COHESION_SIGNALS)):
+    """Signaux de cohésion calculés (namedtuple figé, voir _SignalsTuple)."""
+    __slots__ = ()
+    KEYS = COHESION_SIGNALS
+
+
+# Statistiques lues par chaque calcul : (clé, clé de repli, défaut),
+# dans l'ordre des arguments des noyaux
+COHESION_GLOBAL_SPEC: StatSpec = (
+    ("passes", "passes_total", 400),
+    ("passes_completed", None, DERIVED),  # passes_total × 0.8
+    ("passes_accuracy", "pass_accuracy", 0),
+    ("possession", "possession_percentage", 50),
+    ("key_passes", None, 0),
+    ("assists", None, 0),
+    ("distance_covered", "running_distance", 100),
+    ("sprints", "sprint_count", 0),
+)
+
+COHESION_LAST_15_SPEC: StatSpec = (
+    ("passes", "passes_total", 70),
+    ("passes_completed", None, DERIVED),  # passes_total × 0.75
+    ("passes_accuracy", "pass_accuracy", 0),
+    ("possession", "possession_percentage", 50),
+    ("key_passes", None, 0),
+    ("assists", None, 0),
+    ("distance_covered", "running_distance", 15),
+    ("sprints", "sprint_count", 0),
+)
+
+
+# Noyaux mémorisés sur le tuple des statistiques lues : partagés par toutes
+# les instances, un match déjà évalué ne refait pas le calcul (ni
+# l'allocation de sa sortie)
+@lru_cache(maxsize=SIGNAL_CACHE_SIZE)
+def _global_signals(*stats: float) -> CohesionSignals:
+    return CohesionSignals._make(round_signals(_cohesion_global(*stats)))
+
+
+@lru_cache(maxsize=SIGNAL_CACHE_SIZE)
+def _last_15_signals(*stats: float) -> CohesionSignals:
+    return CohesionSignals._make(round_signals(_cohesion_last_15(*stats)))
+
+
+def _global_inputs(values: Sequence[Optional[float]]) -> Tuple[float, ...]:
+    """
+    Arguments de _cohesion_global, défauts dérivés résolus.
+    
+    Args:
+        values: Valeurs lues selon COHESION_GLOBAL_SPEC (None si dérivée).
+    
+    Returns:
+        Tuple des statistiques, dans l'ordre des arguments du noyau.
+    """
+    (passes_total, passes_completed, passes_accuracy, possession,
+     key_passes, assists, distance, sprints) = values
+    if passes_completed is None:
+        passes_completed = passes_total * 0.8
+    
+    return (passes_total, passes_completed, passes_accuracy, possession,
+            key_passes, assists, distance, sprints)
 
 
 class CohesionModule:
@@ -37,12 +120,13 @@ class CohesionModule:
         """Initialise le module de cohésion."""
         self._default_value = 0.0
     
-    def compute_global(self, normalized_data: Dict[str, Any]) -> Dict[str, float]:
+    def compute_global(self, normalized_data: Union[StatsView, Dict[str, Any]]) -> Dict[str, float]:
         """
         Calcule les signaux de cohésion sur la période globale (0-90').
         
         Args:
-            normalized_data: Données provenant de normalize_api.normalize().
+            normalized_data: Données provenant de normalize_api.normalize(),
+                ou StatsView du match.
         
         Returns:
             Dict avec les signaux auxiliaires :
@@ -51,65 +135,36 @@ class CohesionModule:
             - team_coordination: float (0.0-1.0)
             - collective_movement: float (0.0-1.0)
         """
-        stats = normalized_data.get("stats", normalized_data)
-        
-        # --- PASSING_ACCURACY_SCORE ---
-        passes_total = float(stats.get("passes", stats.get("passes_total", 400)))
-        passes_completed = float(stats.get("passes_completed", passes_total * 0.8))
-        passes_accuracy = float(stats.get("passes_accuracy", 
-                                          stats.get("pass_accuracy", 0)))
-        
-        if passes_accuracy > 0:
-            passing_accuracy_score = min(1.0, passes_accuracy / 100)
-        elif passes_total > 0:
-            passing_accuracy_score = passes_completed / passes_total
-        else:
-            passing_accuracy_score = 0.5
-        
-        # --- POSSESSION_CONTROL ---
-        possession = float(stats.get("possession", 
-                                      stats.get("possession_percentage", 50)))
-        
-        # Normaliser: 50% = 0.5, 70% = 0.9
-        if possession > 0:
-            possession_control = min(1.0, (possession - 30) / 50)
-        else:
-            possession_control = 0.5
-        possession_control = max(0.0, possession_control)
-        
-        # --- TEAM_COORDINATION ---
-        # Basé sur les passes clés et les assists
-        key_passes = float(stats.get("key_passes", 0))
-        assists = float(stats.get("assists", 0))
-        
-        coordination_score = (key_passes * 2 + assists * 5) / 20
-        team_coordination = min(1.0, max(0.0, coordination_score))
-        
-        # --- COLLECTIVE_MOVEMENT ---
-        # Basé sur la distance parcourue et les sprints
-        distance = float(stats.get("distance_covered", 
-                                   stats.get("running_distance", 100)))
-        sprints = float(stats.get("sprints", stats.get("sprint_count", 0)))
-        
-        if distance > 0:
-            movement_score = (distance / 110) * 0.5 + (sprints / 150) * 0.5
-        else:
-            movement_score = 0.5
-        collective_movement = min(1.0, max(0.0, movement_score))
-        
-        return {
-            "passing_accuracy_score": round(passing_accuracy_score, 3),
-            "possession_control": round(possession_control, 3),
-            "team_coordination": round(team_coordination, 3),
-            "collective_movement": round(collective_movement, 3),
-        }
-    
-    def compute_last_15(self, normalized_data: Dict[str, Any]) -> Dict[str, float]:
+        return self.compute_global_signals(normalized_data).to_dict()
+    
+    def compute_global_signals(
+        self,
+        normalized_data: Union[StatsView, Dict[str, Any]]
+    ) -> CohesionSignals:
+        """
+        Comme compute_global, sans dict : retourne un namedtuple figé.
+        
+        Chemin rapide de compute_global : accès par attribut, et un match
+        déjà évalué retourne le CohesionSignals mis en cache.
+        
+        Args:
+            normalized_data: Données provenant de normalize_api.normalize(),
+                ou StatsView du match.
+        
+        Returns:
+            CohesionSignals (même ordre que COHESION_SIGNALS).
+        """
+        stats = StatsView.of(normalized_data).global_
+        
+        return _global_signals(*_global_inputs(_extract(stats, COHESION_GLOBAL_SPEC)))
+    
+    def compute_last_15(self, normalized_data: Union[StatsView, Dict[str, Any]]) -> Dict[str, float]:
         """
         Calcule les signaux de cohésion sur les 15 dernières minutes (75-90').
         
         Args:
-            normalized_data: Données provenant de normalize_api.normalize().
+            normalized_data: Données provenant de normalize_api.normalize(),
+                ou StatsView du match.
         
         Returns:
             Dict avec les signaux auxiliaires :
@@ -118,63 +173,96 @@ class CohesionModule:
             - team_coordination: float (0.0-1.0)
             - collective_movement: float (0.0-1.0)
         """
-        # Chercher les données last_15_min si disponibles
-        last_15_data = normalized_data.get("last_15_min", normalized_data.get("money_time", {}))
-        
-        if last_15_data:
-            stats = last_15_data
-        else:
-            stats = normalized_data.get("stats", normalized_data)
-        
-        # --- PASSING_ACCURACY_SCORE ---
-        passes_total = float(stats.get("passes", stats.get("passes_total", 70)))
-        passes_completed = float(stats.get("passes_completed", passes_total * 0.75))
-        passes_accuracy = float(stats.get("passes_accuracy", 
-                                          stats.get("pass_accuracy", 0)))
-        
-        if passes_accuracy > 0:
-            passing_accuracy_score = min(1.0, passes_accuracy / 100)
-        elif passes_total > 0:
-            passing_accuracy_score = passes_completed / passes_total
-        else:
-            passing_accuracy_score = 0.5
-        
-        # --- POSSESSION_CONTROL ---
-        possession = float(stats.get("possession", 
-                                      stats.get("possession_percentage", 50)))
-        
-        if possession > 0:
-            possession_control = min(1.0, (possession - 30) / 50)
-        else:
-            possession_control = 0.5
-        possession_control = max(0.0, possession_control)
-        
-        # --- TEAM_COORDINATION ---
-        key_passes = float(stats.get("key_passes", 0))
-        assists = float(stats.get("assists", 0))
-        
-        # Seuils ajustés pour 15 min
-        coordination_score = (key_passes * 3 + assists * 6) / 12
-        team_coordination = min(1.0, max(0.0, coordination_score))
-        
-        # --- COLLECTIVE_MOVEMENT ---
-        distance = float(stats.get("distance_covered", 
-                                   stats.get("running_distance", 15)))
-        sprints = float(stats.get("sprints", stats.get("sprint_count", 0)))
-        
-        # Ajusté pour 15 min (~1/6 du match)
-        if distance > 0:
-            movement_score = (distance / 18) * 0.5 + (sprints / 25) * 0.5
-        else:
-            movement_score = 0.5
-        collective_movement = min(1.0, max(0.0, movement_score))
-        
-        return {
-            "passing_accuracy_score": round(passing_accuracy_score, 3),
-            "possession_control": round(possession_control, 3),
-            "team_coordination": round(team_coordination, 3),
-            "collective_movement": round(collective_movement, 3),
-        }
+        return self.compute_last_15_signals(normalized_data).to_dict()
+    
+    def compute_last_15_signals(
+        self,
+        normalized_data: Union[StatsView, Dict[str, Any]]
+    ) -> CohesionSignals:
+        """
+        Comme compute_last_15, sans dict : retourne un namedtuple figé.
+        
+        Chemin rapide de compute_last_15 : accès par attribut, et un match
+        déjà évalué retourne le CohesionSignals mis en cache.
+        
+        Args:
+            normalized_data: Données provenant de normalize_api.normalize(),
+                ou StatsView du match.
+        
+        Returns:
+            CohesionSignals (même ordre que COHESION_SIGNALS).
+        """
+        # Statistiques 75-90' (globales si le bloc last_15 est absent)
+        stats = StatsView.of(normalized_data).last_15
+        
+        (passes_total, passes_completed, passes_accuracy, possession,
+         key_passes, assists, distance, sprints) = _extract(stats, COHESION_LAST_15_SPEC)
+        if passes_completed is None:
+            passes_completed = passes_total * 0.75
+        
+        return _last_15_signals(
+            passes_total, passes_completed, passes_accuracy, possession,
+            key_passes, assists, distance, sprints,
+        )
+    
+    def compute_global_many(
+        self,
+        matches: Sequence[Union[StatsView, Dict[str, Any]]]
+    ) -> List[Dict[str, float]]:
+        """
+        Calcule les signaux globaux de cohésion pour plusieurs matchs.
+        
+        Résultats identiques à compute_global match par match (noyau et
+        cache partagés), en une seule boucle.
+        
+        Args:
+            matches: Données normalisées (ou StatsView), une par match.
+        
+        Returns:
+            Liste des dicts de signaux, dans l'ordre des matchs.
+        """
+        compute = self.compute_global
+        return [compute(match) for match in matches]
+    
+    def compute_global_batch(
+        self,
+        matches: Sequence[Union[StatsView, Dict[str, Any]]]
+    ) -> Dict[str, Any]:
+        """
+        Calcule les signaux globaux de cohésion pour un lot de matchs.
+        
+        Chaque match passe par compute_global_signals (noyau et cache
+        partagés) : résultats identiques à compute_global match par match,
+        empilés en colonnes.
+        
+        Args:
+            matches: Données normalisées (ou StatsView), une par match.
+        
+        Returns:
+            Dict des 4 signaux, chacun un tableau numpy (une valeur par match).
+        """
+        compute = self.compute_global_signals
+        return stack_signals(COHESION_SIGNALS, [compute(match) for match in matches])
+    
+    def compute_last_15_batch(
+        self,
+        matches: Sequence[Union[StatsView, Dict[str, Any]]]
+    ) -> Dict[str, Any]:
+        """
+        Calcule les signaux de cohésion (75-90') pour un lot de matchs.
+        
+        Chaque match passe par compute_last_15_signals (noyau et cache
+        partagés) : résultats identiques à compute_last_15 match par match,
+        empilés en colonnes.
+        
+        Args:
+            matches: Données normalisées (ou StatsView), une par match.
+        
+        Returns:
+            Dict des 4 signaux, chacun un tableau numpy (une valeur par match).
+        """
+        compute = self.compute_last_15_signals
+        return stack_signals(COHESION_SIGNALS, [compute(match) for match in matches])
     
     # =========================================================================
     # LEGACY METHODS (rétrocompatibilité)
@@ -0,0 +1,125 @@
+"""
+MAGScore 7.0 — Signaux globaux combinés
+========================================
+Calcul en un seul passage des signaux globaux (0-90') des quatre modules.
+
+Les modules lisent des statistiques communes (interceptions, tackles,
+sprints, clearances...). compute_all_global les lit une seule fois (ou
+les reprend d'un StatsRecord déjà résolu), relit dans le StatsRecord la
+SPEC de chaque module (défauts propres au module compris), résout ses
+défauts dérivés par le _global_inputs du module et appelle un noyau
+fusionné qui retourne les 16 signaux ; le résultat est identique à celui
+des compute_global de chaque module.
+"""
+
+from dataclasses import fields
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+from . import cohesion, intensity, psychology, stability
+from ._kernels import SIGNAL_CACHE_SIZE, _all_global, round_signals
+from ._stats import DERIVED, StatSpec
+from .cohesion import COHESION_GLOBAL_SPEC, COHESION_SIGNALS
+from .intensity import INTENSITY_GLOBAL_SPEC, INTENSITY_SIGNALS
+from .psychology import PSYCHOLOGY_GLOBAL_SPEC, PSYCHOLOGY_SIGNALS
+from .stability import STABILITY_GLOBAL_SPEC, STABILITY_SIGNALS
+from .stats_record import ALL_GLOBAL_SPEC, StatsRecord
+from .stats_view import StatsView
+
+
+# Entrée de ALL_GLOBAL_SPEC et champ de StatsRecord, par clé principale :
+# clé → (clé de repli, défaut, champ)
+RECORD_FIELDS: Dict[str, Tuple[Optional[str], Any, str]] = {
+    key: (fallback, default, field.name)
+    for (key, fallback, default), field in zip(ALL_GLOBAL_SPEC, fields(StatsRecord))
+}
+
+# Lecture d'une SPEC dans un StatsRecord : (champ, défaut du module)
+RecordSpec = Tuple[Tuple[str, Any], ...]
+
+
+def _record_spec(spec: StatSpec) -> RecordSpec:
+    """
+    Associe chaque entrée d'une SPEC de module à son champ de StatsRecord.
+    
+    Un champ None du StatsRecord (défaut dérivé dans ALL_GLOBAL_SPEC)
+    prend le défaut du module ; les autres défauts doivent être communs.
+    
+    Raises:
+        ValueError: si la SPEC diverge de ALL_GLOBAL_SPEC (clé de repli
+            ou défaut).
+    """
+    entries = []
+    for key, fallback, default in spec:
+        all_fallback, all_default, field = RECORD_FIELDS[key]
+        if fallback != all_fallback or (
+            all_default is not DERIVED and default != all_default
+        ):
+            raise ValueError(f"SPEC divergente de ALL_GLOBAL_SPEC : {key}")
+        entries.append((field, default))
+    
+    return tuple(entries)
+
+
+def _record_values(record: StatsRecord, spec: RecordSpec) -> List[Optional[float]]:
+    """Valeurs d'une SPEC de module lues dans un StatsRecord (comme _extract)."""
+    values: List[Optional[float]] = []
+    for field, default in spec:
+        value = getattr(record, field)
+        if value is None and default is not DERIVED:
+            value = float(default)
+        values.append(value)
+    
+    return values
+
+
+# Résolution des arguments d'un noyau global à partir des valeurs lues
+GlobalInputs = Callable[[Sequence[Optional[float]]], Tuple[float, ...]]
+
+# Modules dans l'ordre des arguments et de la sortie du noyau fusionné :
+# (nom, clés des signaux, lecture de la SPEC globale, résolution des dérivés)
+MODULE_SIGNALS: Tuple[Tuple[str, Tuple[str, ...], RecordSpec, GlobalInputs], ...] = (
+    ("cohesion", COHESION_SIGNALS,
+     _record_spec(COHESION_GLOBAL_SPEC), cohesion._global_inputs),
+    ("intensity", INTENSITY_SIGNALS,
+     _record_spec(INTENSITY_GLOBAL_SPEC), intensity._global_inputs),
+    ("psychology", PSYCHOLOGY_SIGNALS,
+     _record_spec(PSYCHOLOGY_GLOBAL_SPEC), psychology._global_inputs),
+    ("stability", STABILITY_SIGNALS,
+     _record_spec(STABILITY_GLOBAL_SPEC), stability._global_inputs),
+)
+
+# Noyau fusionné mémorisé (voir les caches des modules)
+@lru_cache(maxsize=SIGNAL_CACHE_SIZE)
+def _all_global_signals(*inputs: Tuple[float, ...]) -> Tuple[float, ...]:
+    return round_signals(_all_global(*inputs))
+
+
+def compute_all_global(
+    normalized_data: Union[StatsRecord, StatsView, Dict[str, Any]]
+) -> Dict[str, Dict[str, float]]:
+    """
+    Calcule les signaux globaux (0-90') des quatre modules.
+    
+    Args:
+        normalized_data: Données provenant de normalize_api.normalize(),
+            StatsView ou StatsRecord du match.
+    
+    Returns:
+        Dict {"cohesion", "intensity", "psychology", "stability"} → signaux,
+        identiques aux compute_global des modules.
+    """
+    if isinstance(normalized_data, StatsRecord):
+        record = normalized_data
+    else:
+        record = StatsRecord.from_dict(normalized_data)
+    
+    signals = _all_global_signals(*(
+        inputs(_record_values(record, spec))
+        for _, _, spec, inputs in MODULE_SIGNALS
+    ))
+    
+    return {
+        name: dict(zip(keys, signals[4 * index:4 * index + 4]))
+        for index, (name, keys, _, _) in enumerate(MODULE_SIGNALS)
+    }
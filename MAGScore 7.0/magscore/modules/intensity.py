@@ -14,7 +14,94 @@ Comportements associés :
 Ces signaux DOIVENT correspondre EXACTEMENT aux clés de BEHAVIOR_DEFINITIONS.
 """
 
-from typing import Dict, Any
+from collections import namedtuple
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Sequence, Tuple, Union
+
+from .stats_view import StatsView
+from ._kernels import (
+    SIGNAL_CACHE_SIZE,
+    _intensity_global,
+    _intensity_last_15,
+    round_signals,
+)
+from ._stats import DERIVED, StatSpec, _SignalsTuple, _extract, stack_signals
+
+
+# Clés des signaux produits, dans l'ordre des noyaux de calcul
+INTENSITY_SIGNALS: Tuple[str, ...] = (
+    "pressing_wave",
+    "high_duel_pressure",
+    "running_distance_drop",
+    "duel_loss_spike",
+)
+
+
+class IntensitySignals(_SignalsTuple, namedtuple("IntensitySignals", INTENSITY_SIGNALS)):
+    """Signaux d'intensité calculés (namedtuple figé, voir _SignalsTuple)."""
+    __slots__ = ()
+    KEYS = INTENSITY_SIGNALS
+
+
+# Statistiques lues par chaque calcul : (clé, clé de repli, défaut),
+# dans l'ordre des arguments des noyaux
+INTENSITY_GLOBAL_SPEC: StatSpec = (
+    ("interceptions", None, 0),
+    ("tackles", "tackles_won", 0),
+    ("ball_recoveries", "recoveries", DERIVED),  # interceptions + tackles
+    ("duels", "duels_total", 50),
+    ("duels_won", None, DERIVED),  # duels_total × 0.5
+    ("distance_covered", "running_distance", 0),
+    ("sprints", "sprint_count", 0),
+)
+
+INTENSITY_LAST_15_SPEC: StatSpec = (
+    ("interceptions", None, 0),
+    ("tackles", "tackles_won", 0),
+    ("ball_recoveries", "recoveries", DERIVED),  # interceptions + tackles
+    ("duels", "duels_total", 15),
+    ("duels_won", None, DERIVED),  # duels_total × 0.5
+    ("distance_covered", "running_distance", 0),
+    ("sprints", "sprint_count", 2),
+)
+
+# Distance de référence, lue dans les statistiques globales (0-90')
+INTENSITY_DISTANCE_SPEC: StatSpec = (
+    ("distance_covered", "running_distance", 0),
+)
+
+
+# Noyaux mémorisés sur le tuple des statistiques lues : partagés par toutes
+# les instances, un match déjà évalué ne refait pas le calcul (ni
+# l'allocation de sa sortie)
+@lru_cache(maxsize=SIGNAL_CACHE_SIZE)
+def _global_signals(*stats: float) -> IntensitySignals:
+    return IntensitySignals._make(round_signals(_intensity_global(*stats)))
+
+
+@lru_cache(maxsize=SIGNAL_CACHE_SIZE)
+def _last_15_signals(*stats: float) -> IntensitySignals:
+    return IntensitySignals._make(round_signals(_intensity_last_15(*stats)))
+
+
+def _global_inputs(values: Sequence[Optional[float]]) -> Tuple[float, ...]:
+    """
+    Arguments de _intensity_global, défauts dérivés résolus.
+    
+    Args:
+        values: Valeurs lues selon INTENSITY_GLOBAL_SPEC (None si dérivée).
+    
+    Returns:
+        Tuple des statistiques, dans l'ordre des arguments du noyau.
+    """
+    (interceptions, tackles, ball_recoveries, duels_total, duels_won,
+     distance, sprints) = values
+    if ball_recoveries is None:
+        ball_recoveries = interceptions + tackles
+    if duels_won is None:
+        duels_won = duels_total * 0.5
+    
+    return (interceptions, ball_recoveries, duels_total, duels_won, distance, sprints)
 
 
 class IntensityModule:
@@ -33,12 +120,13 @@ class IntensityModule:
         """Initialise le module d'intensité."""
         self._default_value = 0.0
     
-    def compute_global(self, normalized_data: Dict[str, Any]) -> Dict[str, float]:
+    def compute_global(self, normalized_data: Union[StatsView, Dict[str, Any]]) -> Dict[str, float]:
         """
         Calcule les signaux d'intensité sur la période globale (0-90').
         
         Args:
-            normalized_data: Données provenant de normalize_api.normalize().
+            normalized_data: Données provenant de normalize_api.normalize(),
+                ou StatsView du match.
         
         Returns:
             Dict avec les clés obligatoires :
@@ -47,71 +135,36 @@ class IntensityModule:
             - running_distance_drop: float (0.0-1.0)
             - duel_loss_spike: float (0.0-1.0)
         """
-        stats = normalized_data.get("stats", normalized_data)
-        
-        # --- PRESSING_WAVE ---
-        # Basé sur les récupérations hautes et les passes interceptées
-        interceptions = float(stats.get("interceptions", 0))
-        tackles = float(stats.get("tackles", stats.get("tackles_won", 0)))
-        ball_recoveries = float(stats.get("ball_recoveries", 
-                                          stats.get("recoveries", interceptions + tackles)))
-        
-        # Plus de récupérations = pressing efficace
-        pressing_actions = ball_recoveries + interceptions
-        pressing_wave_raw = pressing_actions / 25  # ~25 récupérations = pressing intense
-        pressing_wave = min(1.0, max(0.0, pressing_wave_raw))
-        
-        # --- HIGH_DUEL_PRESSURE ---
-        # Basé sur le ratio de duels gagnés
-        duels_total = float(stats.get("duels", stats.get("duels_total", 50)))
-        duels_won = float(stats.get("duels_won", duels_total * 0.5))
-        
-        if duels_total > 0:
-            duel_win_ratio = duels_won / duels_total
-        else:
-            duel_win_ratio = 0.5
-        
-        # Ajuster pour que > 55% de duels gagnés = haute pression
-        high_duel_pressure = min(1.0, max(0.0, (duel_win_ratio - 0.3) / 0.4))
-        
-        # --- RUNNING_DISTANCE_DROP ---
-        # En global, pas de "drop" détectable (besoin de comparaison temporelle)
-        # On initialise bas et on laisse last_15 gérer
-        distance = float(stats.get("distance_covered", stats.get("running_distance", 0)))
-        sprints = float(stats.get("sprints", stats.get("sprint_count", 0)))
-        
-        # Si données disponibles, calculer un ratio de fatigue potentielle
-        if distance > 0 and sprints > 0:
-            # Ratio sprints/distance - si bas = fatigue potentielle
-            sprint_ratio = sprints / (distance / 1000)  # sprints par km
-            running_distance_drop = max(0.0, min(1.0, 0.5 - sprint_ratio / 20))
-        else:
-            running_distance_drop = 0.3  # Valeur neutre
-        
-        # --- DUEL_LOSS_SPIKE ---
-        # Inverse du ratio de duels gagnés
-        if duels_total > 0:
-            duels_lost = duels_total - duels_won
-            duel_loss_ratio = duels_lost / duels_total
-        else:
-            duel_loss_ratio = 0.5
-        
-        # Spike si > 50% de duels perdus
-        duel_loss_spike = min(1.0, max(0.0, (duel_loss_ratio - 0.3) / 0.4))
-        
-        return {
-            "pressing_wave": round(pressing_wave, 3),
-            "high_duel_pressure": round(high_duel_pressure, 3),
-            "running_distance_drop": round(running_distance_drop, 3),
-            "duel_loss_spike": round(duel_loss_spike, 3),
-        }
+        return self.compute_global_signals(normalized_data).to_dict()
+    
+    def compute_global_signals(
+        self,
+        normalized_data: Union[StatsView, Dict[str, Any]]
+    ) -> IntensitySignals:
+        """
+        Comme compute_global, sans dict : retourne un namedtuple figé.
+        
+        Chemin rapide de compute_global : accès par attribut, et un match
+        déjà évalué retourne le IntensitySignals mis en cache.
+        
+        Args:
+            normalized_data: Données provenant de normalize_api.normalize(),
+                ou StatsView du match.
+        
+        Returns:
+            IntensitySignals (même ordre que INTENSITY_SIGNALS).
+        """
+        stats = StatsView.of(normalized_data).global_
+        
+        return _global_signals(*_global_inputs(_extract(stats, INTENSITY_GLOBAL_SPEC)))
     
-    def compute_last_15(self, normalized_data: Dict[str, Any]) -> Dict[str, float]:
+    def compute_last_15(self, normalized_data: Union[StatsView, Dict[str, Any]]) -> Dict[str, float]:
         """
         Calcule les signaux d'intensité sur les 15 dernières minutes (75-90').
         
         Args:
-            normalized_data: Données provenant de normalize_api.normalize().
+            normalized_data: Données provenant de normalize_api.normalize(),
+                ou StatsView du match.
         
         Returns:
             Dict avec les clés obligatoires :
@@ -120,75 +173,101 @@ class IntensityModule:
             - running_distance_drop: float (0.0-1.0)
             - duel_loss_spike: float (0.0-1.0)
         """
-        # Chercher les données last_15_min si disponibles
-        last_15_data = normalized_data.get("last_15_min", normalized_data.get("money_time", {}))
-        global_stats = normalized_data.get("stats", normalized_data)
-        
-        if last_15_data:
-            stats = last_15_data
-        else:
-            stats = global_stats
-        
-        # --- PRESSING_WAVE ---
-        interceptions = float(stats.get("interceptions", 0))
-        tackles = float(stats.get("tackles", stats.get("tackles_won", 0)))
-        ball_recoveries = float(stats.get("ball_recoveries", 
-                                          stats.get("recoveries", interceptions + tackles)))
-        
-        # Seuil ajusté pour 15 minutes (~4-5 récupérations = bon pressing)
-        pressing_actions = ball_recoveries + interceptions
-        pressing_wave_raw = pressing_actions / 8
-        pressing_wave = min(1.0, max(0.0, pressing_wave_raw))
-        
-        # --- HIGH_DUEL_PRESSURE ---
-        duels_total = float(stats.get("duels", stats.get("duels_total", 15)))
-        duels_won = float(stats.get("duels_won", duels_total * 0.5))
-        
-        if duels_total > 0:
-            duel_win_ratio = duels_won / duels_total
-        else:
-            duel_win_ratio = 0.5
-        
-        high_duel_pressure = min(1.0, max(0.0, (duel_win_ratio - 0.3) / 0.4))
-        
-        # --- RUNNING_DISTANCE_DROP ---
-        # Comparer distance last_15 vs moyenne attendue
-        distance_last_15 = float(stats.get("distance_covered", 
-                                           stats.get("running_distance", 0)))
-        distance_global = float(global_stats.get("distance_covered",
-                                                  global_stats.get("running_distance", 0)))
-        
-        # Calculer la drop en fin de match
-        if distance_global > 0 and distance_last_15 > 0:
-            # Attendu: ~1/6 de la distance totale dans les 15 dernières min
-            expected_last_15 = distance_global / 6
-            if expected_last_15 > 0:
-                drop_ratio = 1.0 - (distance_last_15 / expected_last_15)
-                running_distance_drop = max(0.0, min(1.0, drop_ratio + 0.3))
-            else:
-                running_distance_drop = 0.5
-        else:
-            # Sans données précises, utiliser les sprints comme proxy
-            sprints = float(stats.get("sprints", stats.get("sprint_count", 2)))
-            running_distance_drop = max(0.0, min(1.0, 0.8 - sprints / 10))
-        
-        # --- DUEL_LOSS_SPIKE ---
-        # Plus sensible en fin de match
-        if duels_total > 0:
-            duels_lost = duels_total - duels_won
-            duel_loss_ratio = duels_lost / duels_total
-        else:
-            duel_loss_ratio = 0.5
-        
-        # Spike accentué en fin de match
-        duel_loss_spike = min(1.0, max(0.0, (duel_loss_ratio - 0.25) / 0.35))
-        
-        return {
-            "pressing_wave": round(pressing_wave, 3),
-            "high_duel_pressure": round(high_duel_pressure, 3),
-            "running_distance_drop": round(running_distance_drop, 3),
-            "duel_loss_spike": round(duel_loss_spike, 3),
-        }
+        return self.compute_last_15_signals(normalized_data).to_dict()
+    
+    def compute_last_15_signals(
+        self,
+        normalized_data: Union[StatsView, Dict[str, Any]]
+    ) -> IntensitySignals:
+        """
+        Comme compute_last_15, sans dict : retourne un namedtuple figé.
+        
+        Chemin rapide de compute_last_15 : accès par attribut, et un match
+        déjà évalué retourne le IntensitySignals mis en cache.
+        
+        Args:
+            normalized_data: Données provenant de normalize_api.normalize(),
+                ou StatsView du match.
+        
+        Returns:
+            IntensitySignals (même ordre que INTENSITY_SIGNALS).
+        """
+        # Statistiques 75-90' (globales si le bloc last_15 est absent)
+        view = StatsView.of(normalized_data)
+        stats = view.last_15
+        global_stats = view.global_
+        
+        (interceptions, tackles, ball_recoveries, duels_total, duels_won,
+         distance_last_15, sprints) = _extract(stats, INTENSITY_LAST_15_SPEC)
+        (distance_global,) = _extract(global_stats, INTENSITY_DISTANCE_SPEC)
+        if ball_recoveries is None:
+            ball_recoveries = interceptions + tackles
+        if duels_won is None:
+            duels_won = duels_total * 0.5
+        
+        return _last_15_signals(
+            interceptions, ball_recoveries, duels_total, duels_won,
+            distance_last_15, distance_global, sprints,
+        )
+    
+    def compute_global_many(
+        self,
+        matches: Sequence[Union[StatsView, Dict[str, Any]]]
+    ) -> List[Dict[str, float]]:
+        """
+        Calcule les signaux globaux d'intensité pour plusieurs matchs.
+        
+        Résultats identiques à compute_global match par match (noyau et
+        cache partagés), en une seule boucle.
+        
+        Args:
+            matches: Données normalisées (ou StatsView), une par match.
+        
+        Returns:
+            Liste des dicts de signaux, dans l'ordre des matchs.
+        """
+        compute = self.compute_global
+        return [compute(match) for match in matches]
+    
+    def compute_global_batch(
+        self,
+        matches: Sequence[Union[StatsView, Dict[str, Any]]]
+    ) -> Dict[str, Any]:
+        """
+        Calcule les signaux globaux d'intensité pour un lot de matchs.
+        
+        Chaque match passe par compute_global_signals (noyau et cache
+        partagés) : résultats identiques à compute_global match par match,
+        empilés en colonnes.
+        
+        Args:
+            matches: Données normalisées (ou StatsView), une par match.
+        
+        Returns:
+            Dict des 4 signaux, chacun un tableau numpy (une valeur par match).
+        """
+        compute = self.compute_global_signals
+        return stack_signals(INTENSITY_SIGNALS, [compute(match) for match in matches])
+    
+    def compute_last_15_batch(
+        self,
+        matches: Sequence[Union[StatsView, Dict[str, Any]]]
+    ) -> Dict[str, Any]:
+        """
+        Calcule les signaux d'intensité (75-90') pour un lot de matchs.
+        
+        Chaque match passe par compute_last_15_signals (noyau et cache
+        partagés) : résultats identiques à compute_last_15 match par match,
+        empilés en colonnes.
+        
+        Args:
+            matches: Données normalisées (ou StatsView), une par match.
+        
+        Returns:
+            Dict des 4 signaux, chacun un tableau numpy (une valeur par match).
+        """
+        compute = self.compute_last_15_signals
+        return stack_signals(INTENSITY_SIGNALS, [compute(match) for match in matches])
     
     # =========================================================================
     # LEGACY METHODS (rétrocompatibilité)
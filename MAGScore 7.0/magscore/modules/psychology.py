@@ -14,7 +14,92 @@ Comportements associés :
 Ces signaux DOIVENT correspondre EXACTEMENT aux clés de BEHAVIOR_DEFINITIONS.
 """
 
-from typing import Dict, Any
+from collections import namedtuple
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Sequence, Tuple, Union
+
+from .stats_view import StatsView
+from ._kernels import (
+    SIGNAL_CACHE_SIZE,
+    _psychology_global,
+    _psychology_last_15,
+    round_signals,
+)
+from ._stats import DERIVED, StatSpec, _SignalsTuple, _extract, stack_signals
+
+
+# Clés des signaux produits, dans l'ordre des noyaux de calcul
+PSYCHOLOGY_SIGNALS: Tuple[str, ...] = (
+    "fouls_spike",
+    "protest_pattern",
+    "high_defensive_recovery",
+    "late_pressing_effort",
+)
+
+
+class PsychologySignals(_SignalsTuple, namedtuple("PsychologySignals", PSYCHOLOGY_SIGNALS)):
+    """Signaux psychologiques calculés (namedtuple figé, voir _SignalsTuple)."""
+    __slots__ = ()
+    KEYS = PSYCHOLOGY_SIGNALS
+
+
+# Statistiques lues par chaque calcul : (clé, clé de repli, défaut),
+# dans l'ordre des arguments des noyaux
+PSYCHOLOGY_GLOBAL_SPEC: StatSpec = (
+    ("fouls", "fouls_committed", 0),
+    ("yellow_cards", None, 0),
+    ("red_cards", None, 0),
+    ("interceptions", None, 0),
+    ("tackles", "tackles_won", 0),
+    ("clearances", None, 0),
+    ("duels_won", None, 0),
+    ("ball_recoveries", "recoveries", DERIVED),  # interceptions
+)
+
+PSYCHOLOGY_LAST_15_SPEC: StatSpec = (
+    ("fouls", "fouls_committed", 0),
+    ("yellow_cards", None, 0),
+    ("red_cards", None, 0),
+    ("interceptions", None, 0),
+    ("tackles", "tackles_won", 0),
+    ("clearances", None, 0),
+    ("blocks", "shots_blocked", 0),
+    ("duels_won", None, 0),
+    ("ball_recoveries", "recoveries", DERIVED),  # interceptions
+    ("sprints", "sprint_count", 0),
+)
+
+
+# Noyaux mémorisés sur le tuple des statistiques lues : partagés par toutes
+# les instances, un match déjà évalué ne refait pas le calcul (ni
+# l'allocation de sa sortie)
+@lru_cache(maxsize=SIGNAL_CACHE_SIZE)
+def _global_signals(*stats: float) -> PsychologySignals:
+    return PsychologySignals._make(round_signals(_psychology_global(*stats)))
+
+
+@lru_cache(maxsize=SIGNAL_CACHE_SIZE)
+def _last_15_signals(*stats: float) -> PsychologySignals:
+    return PsychologySignals._make(round_signals(_psychology_last_15(*stats)))
+
+
+def _global_inputs(values: Sequence[Optional[float]]) -> Tuple[float, ...]:
+    """
+    Arguments de _psychology_global, défauts dérivés résolus.
+    
+    Args:
+        values: Valeurs lues selon PSYCHOLOGY_GLOBAL_SPEC (None si dérivée).
+    
+    Returns:
+        Tuple des statistiques, dans l'ordre des arguments du noyau.
+    """
+    (fouls, yellow_cards, red_cards, interceptions, tackles, clearances,
+     duels_won, ball_recoveries) = values
+    if ball_recoveries is None:
+        ball_recoveries = interceptions
+    
+    return (fouls, yellow_cards, red_cards, interceptions, tackles,
+            clearances, duels_won, ball_recoveries)
 
 
 class PsychologyModule:
@@ -33,12 +118,13 @@ class PsychologyModule:
         """Initialise le module psychologique."""
         self._default_value = 0.0
     
-    def compute_global(self, normalized_data: Dict[str, Any]) -> Dict[str, float]:
+    def compute_global(self, normalized_data: Union[StatsView, Dict[str, Any]]) -> Dict[str, float]:
         """
         Calcule les signaux psychologiques sur la période globale (0-90').
         
         Args:
-            normalized_data: Données provenant de normalize_api.normalize().
+            normalized_data: Données provenant de normalize_api.normalize(),
+                ou StatsView du match.
         
         Returns:
             Dict avec les clés obligatoires :
@@ -47,61 +133,36 @@ class PsychologyModule:
             - high_defensive_recovery: float (0.0-1.0)
             - late_pressing_effort: float (0.0-1.0)
         """
-        stats = normalized_data.get("stats", normalized_data)
-        
-        # --- FOULS_SPIKE ---
-        # Basé sur le nombre de fautes commises
-        fouls = float(stats.get("fouls", stats.get("fouls_committed", 0)))
-        yellow_cards = float(stats.get("yellow_cards", 0))
-        red_cards = float(stats.get("red_cards", 0))
-        
-        # Pondérer les cartons dans le calcul de frustration
-        foul_score = fouls + (yellow_cards * 3) + (red_cards * 6)
-        fouls_spike_raw = foul_score / 20  # ~20 = frustration élevée
-        fouls_spike = min(1.0, max(0.0, fouls_spike_raw))
-        
-        # --- PROTEST_PATTERN ---
-        # Indicateur composite basé sur cartons et fautes tactiques
-        # Plus de jaunes = plus de protestations probables
-        protest_score = (yellow_cards * 2) + (red_cards * 3)
-        if fouls > 10:
-            protest_score += (fouls - 10) * 0.3
-        protest_pattern_raw = protest_score / 6
-        protest_pattern = min(1.0, max(0.0, protest_pattern_raw))
-        
-        # --- HIGH_DEFENSIVE_RECOVERY ---
-        # Basé sur les interceptions, tacles et récupérations
-        interceptions = float(stats.get("interceptions", 0))
-        tackles = float(stats.get("tackles", stats.get("tackles_won", 0)))
-        clearances = float(stats.get("clearances", 0))
-        
-        recovery_actions = interceptions + tackles + clearances
-        high_defensive_recovery_raw = recovery_actions / 40
-        high_defensive_recovery = min(1.0, max(0.0, high_defensive_recovery_raw))
-        
-        # --- LATE_PRESSING_EFFORT ---
-        # En global, mesure la capacité à maintenir le pressing
-        # Basé sur les récupérations et duels
-        duels_won = float(stats.get("duels_won", 0))
-        ball_recoveries = float(stats.get("ball_recoveries", 
-                                          stats.get("recoveries", interceptions)))
-        
-        pressing_effort = (duels_won + ball_recoveries) / 30
-        late_pressing_effort = min(1.0, max(0.0, pressing_effort))
-        
-        return {
-            "fouls_spike": round(fouls_spike, 3),
-            "protest_pattern": round(protest_pattern, 3),
-            "high_defensive_recovery": round(high_defensive_recovery, 3),
-            "late_pressing_effort": round(late_pressing_effort, 3),
-        }
+        return self.compute_global_signals(normalized_data).to_dict()
     
-    def compute_last_15(self, normalized_data: Dict[str, Any]) -> Dict[str, float]:
+    def compute_global_signals(
+        self,
+        normalized_data: Union[StatsView, Dict[str, Any]]
+    ) -> PsychologySignals:
+        """
+        Comme compute_global, sans dict : retourne un namedtuple figé.
+        
+        Chemin rapide de compute_global : accès par attribut, et un match
+        déjà évalué retourne le PsychologySignals mis en cache.
+        
+        Args:
+            normalized_data: Données provenant de normalize_api.normalize(),
+                ou StatsView du match.
+        
+        Returns:
+            PsychologySignals (même ordre que PSYCHOLOGY_SIGNALS).
+        """
+        stats = StatsView.of(normalized_data).global_
+        
+        return _global_signals(*_global_inputs(_extract(stats, PSYCHOLOGY_GLOBAL_SPEC)))
+    
+    def compute_last_15(self, normalized_data: Union[StatsView, Dict[str, Any]]) -> Dict[str, float]:
         """
         Calcule les signaux psychologiques sur les 15 dernières minutes (75-90').
         
         Args:
-            normalized_data: Données provenant de normalize_api.normalize().
+            normalized_data: Données provenant de normalize_api.normalize(),
+                ou StatsView du match.
         
         Returns:
             Dict avec les clés obligatoires :
@@ -110,62 +171,96 @@ class PsychologyModule:
             - high_defensive_recovery: float (0.0-1.0)
             - late_pressing_effort: float (0.0-1.0)
         """
-        # Chercher les données last_15_min si disponibles
-        last_15_data = normalized_data.get("last_15_min", normalized_data.get("money_time", {}))
-        global_stats = normalized_data.get("stats", normalized_data)
-        
-        if last_15_data:
-            stats = last_15_data
-        else:
-            stats = global_stats
-        
-        # --- FOULS_SPIKE ---
-        # Plus sensible en fin de match (seuils ajustés)
-        fouls = float(stats.get("fouls", stats.get("fouls_committed", 0)))
-        yellow_cards = float(stats.get("yellow_cards", 0))
-        red_cards = float(stats.get("red_cards", 0))
-        
-        # En fin de match, moins de fautes nécessaires pour spike
-        foul_score = fouls + (yellow_cards * 4) + (red_cards * 8)
-        fouls_spike_raw = foul_score / 8  # Seuil réduit pour 15 min
-        fouls_spike = min(1.0, max(0.0, fouls_spike_raw))
-        
-        # --- PROTEST_PATTERN ---
-        # Accentué en fin de match
-        protest_score = (yellow_cards * 3) + (red_cards * 4)
-        if fouls > 3:
-            protest_score += (fouls - 3) * 0.5
-        protest_pattern_raw = protest_score / 4
-        protest_pattern = min(1.0, max(0.0, protest_pattern_raw))
-        
-        # --- HIGH_DEFENSIVE_RECOVERY ---
-        interceptions = float(stats.get("interceptions", 0))
-        tackles = float(stats.get("tackles", stats.get("tackles_won", 0)))
-        clearances = float(stats.get("clearances", 0))
-        blocks = float(stats.get("blocks", stats.get("shots_blocked", 0)))
-        
-        # En fin de match, moins d'actions nécessaires pour démontrer résilience
-        recovery_actions = interceptions + tackles + clearances + blocks
-        high_defensive_recovery_raw = recovery_actions / 12
-        high_defensive_recovery = min(1.0, max(0.0, high_defensive_recovery_raw))
-        
-        # --- LATE_PRESSING_EFFORT ---
-        # Spécifiquement important en fin de match
-        duels_won = float(stats.get("duels_won", 0))
-        ball_recoveries = float(stats.get("ball_recoveries", 
-                                          stats.get("recoveries", interceptions)))
-        sprints = float(stats.get("sprints", stats.get("sprint_count", 0)))
-        
-        # Combinaison de duels, récupérations et sprints
-        pressing_effort = (duels_won + ball_recoveries + sprints) / 15
-        late_pressing_effort = min(1.0, max(0.0, pressing_effort))
-        
-        return {
-            "fouls_spike": round(fouls_spike, 3),
-            "protest_pattern": round(protest_pattern, 3),
-            "high_defensive_recovery": round(high_defensive_recovery, 3),
-            "late_pressing_effort": round(late_pressing_effort, 3),
-        }
+        return self.compute_last_15_signals(normalized_data).to_dict()
+    
+    def compute_last_15_signals(
+        self,
+        normalized_data: Union[StatsView, Dict[str, Any]]
+    ) -> PsychologySignals:
+        """
+        Comme compute_last_15, sans dict : retourne un namedtuple figé.
+        
+        Chemin rapide de compute_last_15 : accès par attribut, et un match
+        déjà évalué retourne le PsychologySignals mis en cache.
+        
+        Args:
+            normalized_data: Données provenant de normalize_api.normalize(),
+                ou StatsView du match.
+        
+        Returns:
+            PsychologySignals (même ordre que PSYCHOLOGY_SIGNALS).
+        """
+        # Statistiques 75-90' (globales si le bloc last_15 est absent)
+        stats = StatsView.of(normalized_data).last_15
+        
+        (fouls, yellow_cards, red_cards, interceptions, tackles, clearances,
+         blocks, duels_won, ball_recoveries, sprints) = _extract(stats, PSYCHOLOGY_LAST_15_SPEC)
+        if ball_recoveries is None:
+            ball_recoveries = interceptions
+        
+        return _last_15_signals(
+            fouls, yellow_cards, red_cards, interceptions, tackles,
+            clearances, blocks, duels_won, ball_recoveries, sprints,
+        )
+    
+    def compute_global_many(
+        self,
+        matches: Sequence[Union[StatsView, Dict[str, Any]]]
+    ) -> List[Dict[str, float]]:
+        """
+        Calcule les signaux psychologiques globaux pour plusieurs matchs.
+        
+        Résultats identiques à compute_global match par match (noyau et
+        cache partagés), en une seule boucle.
+        
+        Args:
+            matches: Données normalisées (ou StatsView), une par match.
+        
+        Returns:
+            Liste des dicts de signaux, dans l'ordre des matchs.
+        """
+        compute = self.compute_global
+        return [compute(match) for match in matches]
+    
+    def compute_global_batch(
+        self,
+        matches: Sequence[Union[StatsView, Dict[str, Any]]]
+    ) -> Dict[str, Any]:
+        """
+        Calcule les signaux psychologiques globaux pour un lot de matchs.
+        
+        Chaque match passe par compute_global_signals (noyau et cache
+        partagés) : résultats identiques à compute_global match par match,
+        empilés en colonnes.
+        
+        Args:
+            matches: Données normalisées (ou StatsView), une par match.
+        
+        Returns:
+            Dict des 4 signaux, chacun un tableau numpy (une valeur par match).
+        """
+        compute = self.compute_global_signals
+        return stack_signals(PSYCHOLOGY_SIGNALS, [compute(match) for match in matches])
+    
+    def compute_last_15_batch(
+        self,
+        matches: Sequence[Union[StatsView, Dict[str, Any]]]
+    ) -> Dict[str, Any]:
+        """
+        Calcule les signaux psychologiques (75-90') pour un lot de matchs.
+        
+        Chaque match passe par compute_last_15_signals (noyau et cache
+        partagés) : résultats identiques à compute_last_15 match par match,
+        empilés en colonnes.
+        
+        Args:
+            matches: Données normalisées (ou StatsView), une par match.
+        
+        Returns:
+            Dict des 4 signaux, chacun un tableau numpy (une valeur par match).
+        """
+        compute = self.compute_last_15_signals
+        return stack_signals(PSYCHOLOGY_SIGNALS, [compute(match) for match in matches])
     
     # =========================================================================
     # LEGACY METHODS (rétrocompatibilité)
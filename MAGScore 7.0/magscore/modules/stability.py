@@ -14,7 +14,84 @@ Comportements associés :
 Ces signaux DOIVENT correspondre EXACTEMENT aux clés de BEHAVIOR_DEFINITIONS.
 """
 
-from typing import Dict, Any
+from collections import namedtuple
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Sequence, Tuple, Union
+
+from .stats_view import StatsView
+from ._kernels import (
+    SIGNAL_CACHE_SIZE,
+    _stability_global,
+    _stability_last_15,
+    round_signals,
+)
+from ._stats import StatSpec, _SignalsTuple, _extract, stack_signals
+
+
+# Clés des signaux produits, dans l'ordre des noyaux de calcul
+STABILITY_SIGNALS: Tuple[str, ...] = (
+    "low_block_drop",
+    "xg_against_spike",
+    "high_compactness",
+    "successful_low_block",
+)
+
+
+class StabilitySignals(_SignalsTuple, namedtuple("StabilitySignals", STABILITY_SIGNALS)):
+    """Signaux de stabilité calculés (namedtuple figé, voir _SignalsTuple)."""
+    __slots__ = ()
+    KEYS = STABILITY_SIGNALS
+
+
+# Statistiques lues par chaque calcul : (clé, clé de repli, défaut),
+# dans l'ordre des arguments des noyaux
+STABILITY_GLOBAL_SPEC: StatSpec = (
+    ("interceptions", None, 0),
+    ("tackles", "tackles_won", 0),
+    ("shots_conceded", "shots_against", 5),
+    ("clearances", None, 0),
+    ("blocks", "shots_blocked", 0),
+    ("saves", None, 0),
+    ("shots_on_target_against", "shots_on_target_conceded", 2),
+    ("xg_against", "expected_goals_against", 0),
+)
+
+STABILITY_LAST_15_SPEC: StatSpec = (
+    ("interceptions", None, 0),
+    ("tackles", "tackles_won", 0),
+    ("shots_conceded", "shots_against", 2),
+    ("clearances", None, 0),
+    ("blocks", "shots_blocked", 0),
+    ("saves", None, 0),
+    ("shots_on_target_against", "shots_on_target_conceded", 1),
+    ("xg_against", "expected_goals_against", 0),
+)
+
+
+# Noyaux mémorisés sur le tuple des statistiques lues : partagés par toutes
+# les instances, un match déjà évalué ne refait pas le calcul (ni
+# l'allocation de sa sortie)
+@lru_cache(maxsize=SIGNAL_CACHE_SIZE)
+def _global_signals(*stats: float) -> StabilitySignals:
+    return StabilitySignals._make(round_signals(_stability_global(*stats)))
+
+
+@lru_cache(maxsize=SIGNAL_CACHE_SIZE)
+def _last_15_signals(*stats: float) -> StabilitySignals:
+    return StabilitySignals._make(round_signals(_stability_last_15(*stats)))
+
+
+def _global_inputs(values: Sequence[Optional[float]]) -> Tuple[float, ...]:
+    """
+    Arguments de _stability_global (aucun défaut dérivé).
+    
+    Args:
+        values: Valeurs lues selon STABILITY_GLOBAL_SPEC.
+    
+    Returns:
+        Tuple des statistiques, dans l'ordre des arguments du noyau.
+    """
+    return tuple(values)
 
 
 class StabilityModule:
@@ -33,12 +110,13 @@ class StabilityModule:
         """Initialise le module de stabilité."""
         self._default_value = 0.0
     
-    def compute_global(self, normalized_data: Dict[str, Any]) -> Dict[str, float]:
+    def compute_global(self, normalized_data: Union[StatsView, Dict[str, Any]]) -> Dict[str, float]:
         """
         Calcule les signaux de stabilité sur la période globale (0-90').
         
         Args:
-            normalized_data: Données provenant de normalize_api.normalize().
+            normalized_data: Données provenant de normalize_api.normalize(),
+                ou StatsView du match.
         
         Returns:
             Dict avec les clés obligatoires :
@@ -47,68 +125,36 @@ class StabilityModule:
             - high_compactness: float (0.0-1.0)
             - successful_low_block: float (0.0-1.0)
         """
-        # Extraire les données pertinentes
-        stats = normalized_data.get("stats", normalized_data)
-        
-        # --- HIGH_COMPACTNESS ---
-        # Basé sur le ratio d'interceptions + tacles réussis vs tirs concédés
-        interceptions = float(stats.get("interceptions", 0))
-        tackles = float(stats.get("tackles", stats.get("tackles_won", 0)))
-        shots_against = float(stats.get("shots_conceded", stats.get("shots_against", 5)))
-        
-        # Plus d'interceptions/tacles et moins de tirs = plus compact
-        defensive_actions = interceptions + tackles
-        if shots_against > 0:
-            compactness_raw = defensive_actions / (shots_against * 3)  # Normalize
-        else:
-            compactness_raw = defensive_actions / 15  # Fallback
-        high_compactness = min(1.0, max(0.0, compactness_raw))
-        
-        # --- SUCCESSFUL_LOW_BLOCK ---
-        # Basé sur les dégagements, blocks et tirs bloqués
-        clearances = float(stats.get("clearances", 0))
-        blocks = float(stats.get("blocks", stats.get("shots_blocked", 0)))
-        saves = float(stats.get("saves", 0))
-        
-        # Plus de dégagements et blocks = low block réussi
-        low_block_actions = clearances + blocks + saves
-        successful_low_block_raw = low_block_actions / 20  # Normalize sur ~20 actions
-        successful_low_block = min(1.0, max(0.0, successful_low_block_raw))
-        
-        # --- LOW_BLOCK_DROP ---
-        # Inverse de la solidité défensive - utilisé pour effondrement
-        # Si on a peu de récupérations mais beaucoup de tirs contre
-        shots_on_target_against = float(stats.get("shots_on_target_against", 
-                                                   stats.get("shots_on_target_conceded", 2)))
-        if defensive_actions > 0:
-            drop_ratio = shots_on_target_against / (defensive_actions + 1)
-        else:
-            drop_ratio = shots_on_target_against / 5
-        low_block_drop = min(1.0, max(0.0, drop_ratio))
-        
-        # --- XG_AGAINST_SPIKE ---
-        # Basé sur xG concédé si disponible, sinon estimation via tirs
-        xg_against = float(stats.get("xg_against", stats.get("expected_goals_against", 0)))
-        if xg_against > 0:
-            xg_spike = min(1.0, xg_against / 2.0)  # 2.0 xG = spike max
-        else:
-            # Estimation via tirs cadrés concédés
-            xg_spike = min(1.0, shots_on_target_against / 6)
-        xg_against_spike = xg_spike
-        
-        return {
-            "low_block_drop": round(low_block_drop, 3),
-            "xg_against_spike": round(xg_against_spike, 3),
-            "high_compactness": round(high_compactness, 3),
-            "successful_low_block": round(successful_low_block, 3),
-        }
+        return self.compute_global_signals(normalized_data).to_dict()
     
-    def compute_last_15(self, normalized_data: Dict[str, Any]) -> Dict[str, float]:
+    def compute_global_signals(
+        self,
+        normalized_data: Union[StatsView, Dict[str, Any]]
+    ) -> StabilitySignals:
+        """
+        Comme compute_global, sans dict : retourne un namedtuple figé.
+        
+        Chemin rapide de compute_global : accès par attribut, et un match
+        déjà évalué retourne le StabilitySignals mis en cache.
+        
+        Args:
+            normalized_data: Données provenant de normalize_api.normalize(),
+                ou StatsView du match.
+        
+        Returns:
+            StabilitySignals (même ordre que STABILITY_SIGNALS).
+        """
+        stats = StatsView.of(normalized_data).global_
+        
+        return _global_signals(*_global_inputs(_extract(stats, STABILITY_GLOBAL_SPEC)))
+    
+    def compute_last_15(self, normalized_data: Union[StatsView, Dict[str, Any]]) -> Dict[str, float]:
         """
         Calcule les signaux de stabilité sur les 15 dernières minutes (75-90').
         
         Args:
-            normalized_data: Données provenant de normalize_api.normalize().
+            normalized_data: Données provenant de normalize_api.normalize(),
+                ou StatsView du match.
         
         Returns:
             Dict avec les clés obligatoires :
@@ -117,60 +163,94 @@ class StabilityModule:
             - high_compactness: float (0.0-1.0)
             - successful_low_block: float (0.0-1.0)
         """
-        # Chercher les données last_15_min si disponibles
-        last_15_data = normalized_data.get("last_15_min", normalized_data.get("money_time", {}))
-        
-        if last_15_data:
-            stats = last_15_data
-        else:
-            # Fallback: utiliser les données globales avec ajustement
-            stats = normalized_data.get("stats", normalized_data)
-        
-        # --- Calculs similaires à global mais pondérés pour la fin de match ---
-        
-        interceptions = float(stats.get("interceptions", 0))
-        tackles = float(stats.get("tackles", stats.get("tackles_won", 0)))
-        shots_against = float(stats.get("shots_conceded", stats.get("shots_against", 2)))
-        
-        # En fin de match, moins d'actions défensives = potentiel effondrement
-        defensive_actions = interceptions + tackles
-        
-        # HIGH_COMPACTNESS (peut diminuer en fin de match)
-        if shots_against > 0:
-            compactness_raw = defensive_actions / (shots_against * 2)
-        else:
-            compactness_raw = defensive_actions / 10
-        high_compactness = min(1.0, max(0.0, compactness_raw))
-        
-        # SUCCESSFUL_LOW_BLOCK
-        clearances = float(stats.get("clearances", 0))
-        blocks = float(stats.get("blocks", stats.get("shots_blocked", 0)))
-        saves = float(stats.get("saves", 0))
-        low_block_actions = clearances + blocks + saves
-        successful_low_block_raw = low_block_actions / 10  # Échelle réduite pour 15 min
-        successful_low_block = min(1.0, max(0.0, successful_low_block_raw))
-        
-        # LOW_BLOCK_DROP (plus sensible en fin de match)
-        shots_on_target_against = float(stats.get("shots_on_target_against",
-                                                   stats.get("shots_on_target_conceded", 1)))
-        # Multiplier pour sensibilité fin de match
-        drop_ratio = (shots_on_target_against * 1.5) / (defensive_actions + 1)
-        low_block_drop = min(1.0, max(0.0, drop_ratio))
-        
-        # XG_AGAINST_SPIKE
-        xg_against = float(stats.get("xg_against", stats.get("expected_goals_against", 0)))
-        if xg_against > 0:
-            xg_spike = min(1.0, xg_against / 1.0)  # Seuil plus bas pour 15 min
-        else:
-            xg_spike = min(1.0, shots_on_target_against / 3)
-        xg_against_spike = xg_spike
-        
-        return {
-            "low_block_drop": round(low_block_drop, 3),
-            "xg_against_spike": round(xg_against_spike, 3),
-            "high_compactness": round(high_compactness, 3),
-            "successful_low_block": round(successful_low_block, 3),
-        }
+        return self.compute_last_15_signals(normalized_data).to_dict()
+    
+    def compute_last_15_signals(
+        self,
+        normalized_data: Union[StatsView, Dict[str, Any]]
+    ) -> StabilitySignals:
+        """
+        Comme compute_last_15, sans dict : retourne un namedtuple figé.
+        
+        Chemin rapide de compute_last_15 : accès par attribut, et un match
+        déjà évalué retourne le StabilitySignals mis en cache.
+        
+        Args:
+            normalized_data: Données provenant de normalize_api.normalize(),
+                ou StatsView du match.
+        
+        Returns:
+            StabilitySignals (même ordre que STABILITY_SIGNALS).
+        """
+        # Statistiques 75-90' (globales si le bloc last_15 est absent)
+        stats = StatsView.of(normalized_data).last_15
+        
+        (interceptions, tackles, shots_against, clearances, blocks, saves,
+         shots_on_target_against, xg_against) = _extract(stats, STABILITY_LAST_15_SPEC)
+        
+        return _last_15_signals(
+            interceptions, tackles, shots_against, clearances, blocks,
+            saves, shots_on_target_against, xg_against,
+        )
+    
+    def compute_global_many(
+        self,
+        matches: Sequence[Union[StatsView, Dict[str, Any]]]
+    ) -> List[Dict[str, float]]:
+        """
+        Calcule les signaux globaux de stabilité pour plusieurs matchs.
+        
+        Résultats identiques à compute_global match par match (noyau et
+        cache partagés), en une seule boucle.
+        
+        Args:
+            matches: Données normalisées (ou StatsView), une par match.
+        
+        Returns:
+            Liste des dicts de signaux, dans l'ordre des matchs.
+        """
+        compute = self.compute_global
+        return [compute(match) for match in matches]
+    
+    def compute_global_batch(
+        self,
+        matches: Sequence[Union[StatsView, Dict[str, Any]]]
+    ) -> Dict[str, Any]:
+        """
+        Calcule les signaux globaux de stabilité pour un lot de matchs.
+        
+        Chaque match passe par compute_global_signals (noyau et cache
+        partagés) : résultats identiques à compute_global match par match,
+        empilés en colonnes.
+        
+        Args:
+            matches: Données normalisées (ou StatsView), une par match.
+        
+        Returns:
+            Dict des 4 signaux, chacun un tableau numpy (une valeur par match).
+        """
+        compute = self.compute_global_signals
+        return stack_signals(STABILITY_SIGNALS, [compute(match) for match in matches])
+    
+    def compute_last_15_batch(
+        self,
+        matches: Sequence[Union[StatsView, Dict[str, Any]]]
+    ) -> Dict[str, Any]:
+        """
+        Calcule les signaux de stabilité (75-90') pour un lot de matchs.
+        
+        Chaque match passe par compute_last_15_signals (noyau et cache
+        partagés) : résultats identiques à compute_last_15 match par match,
+        empilés en colonnes.
+        
+        Args:
+            matches: Données normalisées (ou StatsView), une par match.
+        
+        Returns:
+            Dict des 4 signaux, chacun un tableau numpy (une valeur par match).
+        """
+        compute = self.compute_last_15_signals
+        return stack_signals(STABILITY_SIGNALS, [compute(match) for match in matches])
     
     # =========================================================================
     # LEGACY METHODS (rétrocompatibilité)
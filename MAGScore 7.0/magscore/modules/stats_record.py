@@ -0,0 +1,134 @@
+"""
+MAGScore 7.0 — Stats Record
+============================
+Schéma des statistiques lues par les modules, et enregistrement résolu.
+
+NormalizedStats décrit (pour le typage) les clés numériques produites par
+normalize_api.normalize() et lues par les modules. StatsRecord contient les
+statistiques globales (0-90') d'un match, clés de repli et valeurs par
+défaut déjà résolues : un match évalué plusieurs fois (re-scoring) ne
+repasse pas par les lookups du dict.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, TypedDict, Union
+
+from ._stats import DERIVED, StatSpec, _extract
+from .stats_view import StatsView
+
+
+class NormalizedStats(TypedDict, total=False):
+    """Statistiques numériques lues par les modules (clés et clés de repli)."""
+    passes: float
+    passes_total: float
+    passes_completed: float
+    passes_accuracy: float
+    pass_accuracy: float
+    possession: float
+    possession_percentage: float
+    key_passes: float
+    assists: float
+    distance_covered: float
+    running_distance: float
+    sprints: float
+    sprint_count: float
+    interceptions: float
+    tackles: float
+    tackles_won: float
+    ball_recoveries: float
+    recoveries: float
+    duels: float
+    duels_total: float
+    duels_won: float
+    fouls: float
+    fouls_committed: float
+    yellow_cards: float
+    red_cards: float
+    clearances: float
+    shots_conceded: float
+    shots_against: float
+    blocks: float
+    shots_blocked: float
+    saves: float
+    shots_on_target_against: float
+    shots_on_target_conceded: float
+    xg_against: float
+    expected_goals_against: float
+
+
+# Union des statistiques lues par les 4 modules (0-90'), dans l'ordre des
+# champs de StatsRecord. DERIVED marque aussi les statistiques dont le
+# défaut dépend du module.
+ALL_GLOBAL_SPEC: StatSpec = (
+    ("passes", "passes_total", 400),
+    ("passes_completed", None, DERIVED),  # passes_total × 0.8
+    ("passes_accuracy", "pass_accuracy", 0),
+    ("possession", "possession_percentage", 50),
+    ("key_passes", None, 0),
+    ("assists", None, 0),
+    ("distance_covered", "running_distance", DERIVED),  # 100 cohésion, 0 intensité
+    ("sprints", "sprint_count", 0),
+    ("interceptions", None, 0),
+    ("tackles", "tackles_won", 0),
+    ("ball_recoveries", "recoveries", DERIVED),  # intensité : + tackles
+    ("duels", "duels_total", 50),
+    ("duels_won", None, DERIVED),  # duels_total × 0.5 intensité, 0 psychologie
+    ("fouls", "fouls_committed", 0),
+    ("yellow_cards", None, 0),
+    ("red_cards", None, 0),
+    ("clearances", None, 0),
+    ("shots_conceded", "shots_against", 5),
+    ("blocks", "shots_blocked", 0),
+    ("saves", None, 0),
+    ("shots_on_target_against", "shots_on_target_conceded", 2),
+    ("xg_against", "expected_goals_against", 0),
+)
+
+
+@dataclass(frozen=True, slots=True)
+class StatsRecord:
+    """
+    Statistiques globales résolues d'un match (une valeur par ALL_GLOBAL_SPEC).
+    
+    Les champs None sont des valeurs absentes dont le défaut est dérivé
+    d'une autre statistique, résolu par le calcul des signaux.
+    """
+    passes_total: float
+    passes_completed: Optional[float]
+    passes_accuracy: float
+    possession: float
+    key_passes: float
+    assists: float
+    distance: Optional[float]
+    sprints: float
+    interceptions: float
+    tackles: float
+    ball_recoveries: Optional[float]
+    duels_total: float
+    duels_won: Optional[float]
+    fouls: float
+    yellow_cards: float
+    red_cards: float
+    clearances: float
+    shots_against: float
+    blocks: float
+    saves: float
+    shots_on_target_against: float
+    xg_against: float
+    
+    @classmethod
+    def from_dict(
+        cls,
+        normalized_data: Union[StatsView, Dict[str, Any]]
+    ) -> "StatsRecord":
+        """
+        Résout une fois les statistiques globales d'un match.
+        
+        Args:
+            normalized_data: Données provenant de normalize_api.normalize(),
+                ou StatsView du match.
+        
+        Returns:
+            StatsRecord du match.
+        """
+        return cls(*_extract(StatsView.of(normalized_data).global_, ALL_GLOBAL_SPEC))
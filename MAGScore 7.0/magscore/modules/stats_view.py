@@ -0,0 +1,56 @@
+"""
+MAGScore 7.0 — Stats View
+==========================
+Vue des statistiques d'un match, résolue une seule fois.
+
+Les quatre modules lisent les mêmes blocs de données normalisées : les
+statistiques globales (clé "stats" ou racine) et celles des 15 dernières
+minutes (clé "last_15_min" ou "money_time"). Le pipeline construit un
+StatsView par match et le passe à tous les modules, au lieu de refaire
+ces lookups dans chaque compute_*.
+
+Les modules ne lisent que des statistiques scalaires (ni événements ni
+horodatages) : la vue référence les dicts normalisés sans copie ni
+conversion en tableaux, réservée aux calculs par lot (compute_*_batch).
+"""
+
+from typing import Any, Dict, Union
+
+from ._stats import LAST_15_KEYS, _first
+
+
+class StatsView:
+    """
+    Statistiques globales et des 15 dernières minutes d'un match.
+    
+    Attributes:
+        global_: Statistiques 0-90'.
+        last_15: Statistiques 75-90' (les statistiques globales si le bloc
+            last_15 est absent ou vide).
+    """
+    
+    __slots__ = ("global_", "last_15")
+    
+    def __init__(self, global_: Dict[str, Any], last_15: Dict[str, Any]) -> None:
+        self.global_ = global_
+        self.last_15 = last_15
+    
+    @classmethod
+    def of(cls, normalized_data: Union["StatsView", Dict[str, Any]]) -> "StatsView":
+        """
+        Construit la vue d'un match (ou retourne la vue déjà construite).
+        
+        Args:
+            normalized_data: Données provenant de normalize_api.normalize(),
+                ou StatsView.
+        
+        Returns:
+            StatsView du match.
+        """
+        if isinstance(normalized_data, StatsView):
+            return normalized_data
+        
+        global_ = normalized_data.get("stats", normalized_data)
+        last_15 = _first(normalized_data, LAST_15_KEYS, {})
+        
+        return cls(global_, last_15 or global_)
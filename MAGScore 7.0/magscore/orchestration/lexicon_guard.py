@@ -11,7 +11,15 @@ Lexique autorisé : stabilité, intensité, cohésion, dynamique, contrôle, pre
 Lexique interdit : pari, cote, favori, value, prono, bankroll, etc.
 """
 
-from typing import List, Tuple, Optional, Iterable
+import re
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, Iterator, List, Tuple, Optional
+
+try:
+    import ahocorasick
+    HAS_AHOCORASICK = True
+except ImportError:
+    HAS_AHOCORASICK = False
 
 
 # =============================================================================
@@ -27,19 +35,25 @@ class LexiconGuardError(Exception):
         text: Texte original (optionnel).
     """
     
+    __slots__ = ("violations", "text")
+    
     def __init__(self, violations: List[str], text: Optional[str] = None):
         self.violations = violations
         self.text = text
         message = f"Forbidden term detected: {violations[0]}" if len(violations) == 1 else \
                   f"Forbidden terms detected: {', '.join(violations)}"
         super().__init__(message)
+    
+    def __reduce__(self):
+        """Préserve violations/text au pickling (pas de __dict__)."""
+        return (self.__class__, (self.violations, self.text))
 
 
 # =============================================================================
 # BLACKLIST — VOCABULAIRE INTERDIT (SPEC PARTIE 4)
 # =============================================================================
 
-BLACKLIST: Iterable[str] = frozenset([
+BLACKLIST: FrozenSet[str] = frozenset([
     # --- Termes de paris directs ---
     "pari",
     "parier",
@@ -137,11 +151,72 @@ BLACKLIST: Iterable[str] = frozenset([
 ])
 
 
+# Termes échappés une fois pour toutes, les plus longs d'abord. La
+# blacklist est figée (frozenset) : pas de reconstruction à l'exécution,
+# qui invaliderait aussi le cache de find_violations.
+_ESCAPED_BLACKLIST: Tuple[str, ...] = tuple(
+    re.escape(term) for term in sorted(BLACKLIST, key=len, reverse=True)
+)
+
+
+# Blacklist compilée en une seule alternative (termes les plus longs
+# d'abord), testée en lookahead à chaque début de mot : un seul passage sur
+# le texte, et les termes qui se chevauchent ("value bet", "bet") sont
+# tous détectés.
+_BLACKLIST_RE = re.compile(r'\b(?=(' + '|'.join(_ESCAPED_BLACKLIST) + r')\b)')
+
+
+def _implied_terms() -> Dict[str, Tuple[str, ...]]:
+    """
+    Termes détectés sans être retenus par l'alternative de _BLACKLIST_RE.
+    
+    Ce sont les termes qui commencent au même endroit qu'un terme plus long
+    et se terminent sur une limite de mot (ex. "value" dans "value bet").
+    
+    Returns:
+        Dict {terme: termes impliqués}, pour les seuls termes concernés.
+    """
+    implied: Dict[str, Tuple[str, ...]] = {}
+    for term in BLACKLIST:
+        prefixes = tuple(
+            prefix for prefix in BLACKLIST
+            if prefix != term and term.startswith(prefix)
+            and re.match(r'\b' + re.escape(prefix) + r'\b', term)
+        )
+        if prefixes:
+            implied[term] = prefixes
+    
+    return implied
+
+
+_IMPLIED_TERMS = _implied_terms()
+
+
+def _build_automaton() -> Any:
+    """
+    Construit l'automate Aho-Corasick des termes de la blacklist.
+    
+    Returns:
+        ahocorasick.Automaton (valeur associée à chaque terme : le terme).
+    """
+    automaton = ahocorasick.Automaton()
+    for term in BLACKLIST:
+        automaton.add_word(term, term)
+    automaton.make_automaton()
+    
+    return automaton
+
+
+# Avec pyahocorasick : un passage en O(len(texte)), indépendant de la taille
+# de la blacklist ; sinon _BLACKLIST_RE
+_BLACKLIST_AUTOMATON = _build_automaton() if HAS_AHOCORASICK else None
+
+
 # =============================================================================
 # WHITELIST — TERMES AUTORISÉS (référence)
 # =============================================================================
 
-WHITELIST: Iterable[str] = frozenset([
+WHITELIST: FrozenSet[str] = frozenset([
     # Analyse structurelle
     "stabilité",
     "stability",
@@ -208,6 +283,13 @@ WHITELIST: Iterable[str] = frozenset([
 # VALIDATION FUNCTIONS
 # =============================================================================
 
+# Nombre de textes dont find_violations mémorise le résultat (sections de
+# rapport gabaritées revalidées à l'identique), et longueur maximale d'un
+# texte mémorisé : au-delà, le texte est analysé sans entrer dans le cache
+VIOLATIONS_CACHE_SIZE = 256
+VIOLATIONS_CACHE_MAX_LENGTH = 16384
+
+
 def validate(text: str) -> None:
     """
     Vérifie que le texte ne contient aucun terme interdit.
@@ -243,36 +325,99 @@ def find_violations(text: str) -> List[str]:
     Returns:
         Liste des termes interdits trouvés (sans doublons).
     """
-    import re
-    
     if not text:
         return []
     
+    # Liste neuve à chaque appel : le tuple mémorisé n'est jamais exposé
+    if len(text) <= VIOLATIONS_CACHE_MAX_LENGTH:
+        return list(_cached_violations(text))
+    
+    return list(_scan_violations(text))
+
+
+def _scan_violations(text: str) -> Tuple[str, ...]:
+    """
+    Analyse un texte non vide (corps de find_violations, sans cache).
+    
+    Args:
+        text: Texte à analyser.
+    
+    Returns:
+        Termes interdits trouvés, sans doublons, par ordre d'apparition.
+    """
     lowered = text.lower()
-    violations = []
+    if _BLACKLIST_AUTOMATON is not None:
+        return tuple(dict.fromkeys(_automaton_hits(lowered)))
+    
+    # Dict ordonné : termes sans doublons, dans leur ordre d'apparition
+    violations: Dict[str, None] = {}
+    for match in _BLACKLIST_RE.finditer(lowered):
+        forbidden = match.group(1)
+        violations[forbidden] = None
+        for implied in _IMPLIED_TERMS.get(forbidden, ()):
+            violations[implied] = None
+    
+    return tuple(violations)
+
+
+# Analyse mémorisée (BLACKLIST, _BLACKLIST_RE et l'automate sont figés au
+# chargement du module : le résultat ne dépend que du texte)
+_cached_violations = lru_cache(maxsize=VIOLATIONS_CACHE_SIZE)(_scan_violations)
+
+
+def _automaton_hits(lowered: str) -> Iterator[str]:
+    """
+    Termes interdits trouvés par l'automate Aho-Corasick, au fil du texte.
+    
+    L'automate trouve toutes les occurrences (chevauchements compris) ;
+    les limites de mot sont vérifiées ensuite. Les termes commencent
+    et finissent par une lettre : une limite de mot est donc un caractère
+    voisin qui n'est pas un caractère de mot, ou le bord du texte.
     
-    for forbidden in BLACKLIST:
-        # Utiliser word boundaries pour matcher des mots entiers
-        # \b = word boundary
-        pattern = r'\b' + re.escape(forbidden) + r'\b'
-        if re.search(pattern, lowered):
-            if forbidden not in violations:
-                violations.append(forbidden)
+    Args:
+        lowered: Texte à analyser, en minuscules.
+    
+    Yields:
+        Chaque occurrence d'un terme interdit, par ordre de fin (un terme
+        peut apparaître plusieurs fois).
+    """
+    last = len(lowered) - 1
     
-    return violations
+    for end, forbidden in _BLACKLIST_AUTOMATON.iter(lowered):
+        start = end - len(forbidden) + 1
+        if start > 0 and _is_word_char(lowered[start - 1]):
+            continue
+        if end < last and _is_word_char(lowered[end + 1]):
+            continue
+        yield forbidden
+
+
+def _is_word_char(char: str) -> bool:
+    """Caractère de mot au sens des expressions régulières (Unicode)."""
+    return char.isalnum() or char == "_"
 
 
 def is_clean(text: str) -> bool:
     """
     Vérifie si un texte est propre (aucun terme interdit).
     
+    S'arrête au premier terme interdit trouvé, sans construire la liste
+    des violations.
+    
     Args:
         text: Texte à vérifier.
     
     Returns:
         True si aucun terme interdit n'est trouvé.
     """
-    return len(find_violations(text)) == 0
+    if not text:
+        return True
+    
+    lowered = text.lower()
+    if _BLACKLIST_AUTOMATON is not None:
+        return next(_automaton_hits(lowered), None) is None
+    
+    return _BLACKLIST_RE.search(lowered) is None
 
 
 def is_term_forbidden(term: str) -> bool:
@@ -301,12 +446,12 @@ def is_term_allowed(term: str) -> bool:
     return term.lower().strip() in WHITELIST
 
 
-def get_blacklist() -> frozenset:
+def get_blacklist() -> FrozenSet[str]:
     """Retourne l'ensemble des termes interdits."""
     return BLACKLIST
 
 
-def get_whitelist() -> frozenset:
+def get_whitelist() -> FrozenSet[str]:
     """Retourne l'ensemble des termes autorisés."""
     return WHITELIST
 
@@ -318,11 +463,11 @@ def get_whitelist() -> frozenset:
 FORBIDDEN_TERMS = BLACKLIST
 ALLOWED_TERMS = WHITELIST
 
-def get_forbidden_terms() -> frozenset:
+def get_forbidden_terms() -> FrozenSet[str]:
     """Alias legacy pour get_blacklist()."""
     return BLACKLIST
 
-def get_allowed_terms() -> frozenset:
+def get_allowed_terms() -> FrozenSet[str]:
     """Alias legacy pour get_whitelist()."""
     return WHITELIST
 
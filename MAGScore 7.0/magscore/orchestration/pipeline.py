@@ -18,20 +18,21 @@ Pipeline neutre :
 Règle absolue : Aucune prédiction.
 """
 
-from typing import Dict, Any, Optional, List
+from collections import OrderedDict
+from typing import Dict, Any, Optional, List, Sequence, Tuple
 
 from ..external.normalize_api import normalize
 from ..modules.stability import StabilityModule
 from ..modules.intensity import IntensityModule
 from ..modules.psychology import PsychologyModule
 from ..modules.cohesion import CohesionModule
+from ..modules.stats_view import StatsView
+from ..modules.combined import compute_all_global
 from ..engine.behavior_engine import BehaviorEngine
 from ..engine.pattern_engine import PatternEngine
 from ..engine.signal_memory import SignalMemory
 from ..engine.match_flow import MatchFlowReconstructor
 from ..engine.quality_control import QualityControlEngine, QualityControlError
-from ..engine.vision_engine import VisionEngine, VisionEngineError
-from ..engine.memory_engine import MemoryEngine, ForbiddenDataError
 from ..bots.analysis_bot import AnalysisBot
 from .lexicon_guard import validate as validate_lexicon, LexiconGuardError
 
@@ -42,6 +43,23 @@ from .lexicon_guard import validate as validate_lexicon, LexiconGuardError
 
 PIPELINE_VERSION = "2.7"
 
+# Nombre de payloads dont run_analysis mémorise les signaux extraits
+# (étapes 1-2), pour les rejeux d'un même match ; 0 désactive le cache
+PIPELINE_CACHE_SIZE = 32
+
+# Signaux des étapes 1-2 : (global, last_15) de stability, intensity,
+# psychology puis cohesion
+ExtractedSignals = Tuple[Dict[str, float], ...]
+
+# Clé du cache des signaux : statistiques globales puis 75-90' lues par
+# les modules, en paires (clé, valeur) triées
+SignalsCacheKey = Tuple[Tuple[Tuple[str, Any], ...], Tuple[Tuple[str, Any], ...]]
+
+
+def _copy_signals(signals: ExtractedSignals) -> ExtractedSignals:
+    """Copies des dicts de signaux mémorisés : l'appelant peut les modifier."""
+    return tuple([dict(module_signals) for module_signals in signals])
+
 
 # =============================================================================
 # EXCEPTIONS
@@ -102,13 +120,20 @@ class Pipeline:
     Aucune prédiction, aucune influence.
     """
     
-    def __init__(self, enable_vision: bool = True, enable_memory: bool = True) -> None:
+    def __init__(
+        self,
+        enable_vision: bool = True,
+        enable_memory: bool = True,
+        cache_size: int = PIPELINE_CACHE_SIZE
+    ) -> None:
         """
         Initialise le pipeline avec tous les composants.
         
         Args:
             enable_vision: Active le traitement visuel (7.0).
             enable_memory: Active le stockage mémoire (7.0).
+            cache_size: Nombre de payloads dont les signaux extraits sont
+                mémorisés (0 : pas de cache).
         """
         # Modules de signaux
         self.stability_module = StabilityModule()
@@ -134,13 +159,38 @@ class Pipeline:
         # Quality Control Engine v1
         self.quality_control = QualityControlEngine()
         
-        # Vision Engine v1 (NOUVEAU 7.0)
+        # Vision Engine v1 (NOUVEAU 7.0) et Memory Engine v1 (NOUVEAU 7.0) :
+        # modules importés seulement si actifs (cv2 pour la vision)
         self._enable_vision = enable_vision
-        self.vision_engine = VisionEngine() if enable_vision else None
+        self.vision_engine = None
+        if enable_vision:
+            from ..engine.vision_engine import VisionEngine
+            self.vision_engine = VisionEngine()
         
-        # Memory Engine v1 (NOUVEAU 7.0)
         self._enable_memory = enable_memory
-        self.memory_engine = MemoryEngine() if enable_memory else None
+        self.memory_engine = None
+        if enable_memory:
+            from ..engine.memory_engine import MemoryEngine
+            self.memory_engine = MemoryEngine()
+        
+        # Versions des composants, fixées à l'initialisation : copiées telles
+        # quelles dans chaque meta (dans l'ordre des clés du payload)
+        self._static_meta: Dict[str, str] = {
+            "pattern_engine_version": self.pattern_engine.version,
+            "signal_memory_version": self.signal_memory.version,
+            "match_flow_version": self.match_flow.version,
+            "quality_control_version": self.quality_control.version,
+        }
+        
+        # Signaux extraits par match (LRU, clé : statistiques normalisées)
+        self._cache_size = cache_size
+        self._signals_cache: "OrderedDict[SignalsCacheKey, ExtractedSignals]" = (
+            OrderedDict()
+        )
+    
+    def clear_cache(self) -> None:
+        """Vide le cache des signaux extraits."""
+        self._signals_cache.clear()
     
     def run_analysis(
         self, 
@@ -191,38 +241,14 @@ class Pipeline:
             LexiconViolationError: Si le rapport contient des termes interdits.
             QualityControlViolationError: Si le contrôle qualité échoue.
         """
-        try:
-            # =================================================================
-            # ÉTAPE 1: Normalisation
-            # =================================================================
-            normalized = normalize(raw_match_data)
-            
-        except Exception as e:
-            raise NormalizationError(f"Normalization failed: {str(e)}") from e
+        # =====================================================================
+        # ÉTAPES 1-2: Normalisation et extraction des signaux (mémorisées)
+        # =====================================================================
         
-        try:
-            # =================================================================
-            # ÉTAPE 2: Extraction des signaux bruts (globaux et last_15)
-            # =================================================================
-            
-            # Stability
-            stability_global = self.stability_module.compute_global(normalized)
-            stability_last15 = self.stability_module.compute_last_15(normalized)
-            
-            # Intensity
-            intensity_global = self.intensity_module.compute_global(normalized)
-            intensity_last15 = self.intensity_module.compute_last_15(normalized)
-            
-            # Psychology
-            psychology_global = self.psychology_module.compute_global(normalized)
-            psychology_last15 = self.psychology_module.compute_last_15(normalized)
-            
-            # Cohesion (auxiliaire)
-            cohesion_global = self.cohesion_module.compute_global(normalized)
-            cohesion_last15 = self.cohesion_module.compute_last_15(normalized)
-            
-        except Exception as e:
-            raise SignalExtractionError(f"Signal extraction failed: {str(e)}") from e
+        (stability_global, stability_last15,
+         intensity_global, intensity_last15,
+         psychology_global, psychology_last15,
+         cohesion_global, cohesion_last15) = self._extracted_signals(raw_match_data)
         
         # =====================================================================
         # ÉTAPE 3: Construction des signaux RAW par catégorie
@@ -249,6 +275,8 @@ class Pipeline:
         visual_raw: Dict[str, float] = {}
         
         if self._enable_vision and video_url and self.vision_engine:
+            from ..engine.vision_engine import VisionEngineError
+            
             try:
                 visual_result = self.vision_engine.process_and_discretize(video_url)
                 visual_signals = visual_result.discrete
@@ -309,6 +337,8 @@ class Pipeline:
         historical_context: Dict[str, Any] = {}
         
         if self._enable_memory and team_id and self.memory_engine:
+            from ..engine.memory_engine import ForbiddenDataError
+            
             try:
                 # Récupérer le contexte historique AVANT d'ajouter le nouvel épisode
                 opposing_style = metadata.get("opposing_style", "")
@@ -316,14 +346,16 @@ class Pipeline:
                     team_id, opposing_style
                 )
                 
-                # Ingérer le nouvel épisode (SÉCURISÉ)
+                # Ingérer le nouvel épisode (SÉCURISÉ). Synchrone : l'appel
+                # suivant pour l'équipe doit voir cet épisode, et un refus
+                # strict ne doit pas se perdre dans un thread d'arrière-plan.
                 self.memory_engine.ingest(
                     team_id=team_id,
                     data={
                         "match_id": f"{metadata.get('home_team', 'A')}_{metadata.get('away_team', 'B')}",
                         "behaviors": [b.get("code", "") for b in behaviors if b.get("status") == "ACTIVE"],
                         "patterns": [p.get("pattern_code", "") for p in patterns],
-                        "flow_phases": [f.split(" : ", 1)[-1] if " : " in f else f for f in flow],
+                        "flow_phases": [f.partition(" : ")[2] if " : " in f else f for f in flow],
                         "opposing_style": opposing_style,
                         # NOTE: Pas de score, result, odds ici (SÉCURITÉ)
                     },
@@ -345,7 +377,7 @@ class Pipeline:
                 flow,
                 historical_context=historical_context if historical_context else None
             )
-            
+        
         except Exception as e:
             raise ReportGenerationError(f"Report generation failed: {str(e)}") from e
         
@@ -355,7 +387,7 @@ class Pipeline:
             # =================================================================
             
             validate_lexicon(report)
-            
+        
         except LexiconGuardError as e:
             raise LexiconViolationError(
                 f"Report contains forbidden terms: {e.violations}"
@@ -365,33 +397,32 @@ class Pipeline:
         # ÉTAPE 11: Construction du résultat final
         # =====================================================================
         
+        behavior_meta = behavior_state["meta"]
+        meta = {
+            "pipeline_version": PIPELINE_VERSION,
+            "behavior_engine_version": behavior_meta.get("version", "unknown"),
+            **self._static_meta,
+            "behaviors_detected": behavior_meta.get("behaviors_detected", 0),
+            "patterns_detected": len(patterns),
+            "recency_model": behavior_meta.get("recency_model", "unknown"),
+        }
         final_payload = {
             "behaviors": behaviors,
             "patterns": patterns,
             "flow": flow,
             "report": report,
-            "meta": {
-                "pipeline_version": PIPELINE_VERSION,
-                "behavior_engine_version": behavior_state["meta"].get("version", "unknown"),
-                "pattern_engine_version": self.pattern_engine.version,
-                "signal_memory_version": self.signal_memory.version,
-                "match_flow_version": self.match_flow.version,
-                "quality_control_version": self.quality_control.version,
-                "behaviors_detected": behavior_state["meta"].get("behaviors_detected", 0),
-                "patterns_detected": len(patterns),
-                "recency_model": behavior_state["meta"].get("recency_model", "unknown"),
-            },
+            "meta": meta,
         }
         
         # Ajouter les infos 7.0 si actives
         if self._enable_vision and self.vision_engine:
             final_payload["visual_signals"] = visual_signals
             final_payload["visual_raw"] = visual_raw
-            final_payload["meta"]["vision_engine_version"] = self.vision_engine.version
+            meta["vision_engine_version"] = self.vision_engine.version
         
         if self._enable_memory and self.memory_engine:
             final_payload["historical_context"] = historical_context
-            final_payload["meta"]["memory_engine_version"] = self.memory_engine.version
+            meta["memory_engine_version"] = self.memory_engine.version
         
         try:
             # =================================================================
@@ -405,7 +436,7 @@ class Pipeline:
                 report_text=report,
                 final_payload=final_payload
             )
-            
+        
         except QualityControlError as e:
             raise QualityControlViolationError(
                 f"Quality control failed: {str(e)}"
@@ -413,6 +444,30 @@ class Pipeline:
         
         return final_payload
     
+    def run_analysis_many(
+        self,
+        jobs: Sequence[Tuple[Any, ...]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Exécute run_analysis pour plusieurs matchs, dans l'ordre.
+        
+        Résultats identiques à des appels successifs de run_analysis sur
+        cette instance (cache des signaux et mémoire partagés). Boucle
+        séquentielle : la mémoire dépend de l'ordre des matchs.
+        
+        Args:
+            jobs: Arguments de run_analysis par match :
+                (raw_match_data, metadata[, video_url[, team_id]]).
+        
+        Returns:
+            Liste des payloads, dans l'ordre des matchs.
+        
+        Raises:
+            PipelineError: Première erreur rencontrée (voir run_analysis).
+        """
+        run = self.run_analysis
+        return [run(*job) for job in jobs]
+    
     # =========================================================================
     # LEGACY METHODS (rétrocompatibilité)
     # =========================================================================
@@ -456,6 +511,115 @@ class Pipeline:
         
         return self.run_analysis(raw_data, metadata)
     
+    def _extracted_signals(self, raw_match_data: Dict[str, Any]) -> ExtractedSignals:
+        """
+        Étapes 1-2 : normalise le payload et extrait les signaux des 4 modules.
+        
+        Les signaux dépendent uniquement des statistiques normalisées lues
+        par les modules : ils sont mémorisés (LRU) sous ces statistiques,
+        pour les rejeux d'un même match. Chaque appel reçoit ses propres
+        dicts (copies des signaux mémorisés).
+        
+        Args:
+            raw_match_data: Données brutes du match (format API).
+        
+        Returns:
+            Signaux (global, last_15) de stability, intensity, psychology
+            puis cohesion.
+        
+        Raises:
+            NormalizationError: Si la normalisation échoue.
+            SignalExtractionError: Si l'extraction des signaux échoue.
+        """
+        try:
+            # =================================================================
+            # ÉTAPE 1: Normalisation
+            # =================================================================
+            normalized = normalize(raw_match_data)
+        
+        except Exception as e:
+            raise NormalizationError(f"Normalization failed: {str(e)}") from e
+        
+        try:
+            # =================================================================
+            # ÉTAPE 2: Extraction des signaux bruts (globaux et last_15)
+            # =================================================================
+            
+            # Statistiques globales / last_15 résolues une fois pour les 4 modules
+            view = StatsView.of(normalized)
+            
+            key = self._cache_key(view) if self._cache_size > 0 else None
+            if key is not None:
+                cached = self._signals_cache.get(key)
+                if cached is not None:
+                    self._signals_cache.move_to_end(key)
+                    return _copy_signals(cached)
+            
+            # Signaux globaux des 4 modules en un seul noyau
+            global_signals = compute_all_global(view)
+            
+            # Stability
+            stability_global = global_signals["stability"]
+            stability_last15 = self.stability_module.compute_last_15(view)
+            
+            # Intensity
+            intensity_global = global_signals["intensity"]
+            intensity_last15 = self.intensity_module.compute_last_15(view)
+            
+            # Psychology
+            psychology_global = global_signals["psychology"]
+            psychology_last15 = self.psychology_module.compute_last_15(view)
+            
+            # Cohesion (auxiliaire)
+            cohesion_global = global_signals["cohesion"]
+            cohesion_last15 = self.cohesion_module.compute_last_15(view)
+        
+        except Exception as e:
+            raise SignalExtractionError(f"Signal extraction failed: {str(e)}") from e
+        
+        signals = (
+            stability_global, stability_last15,
+            intensity_global, intensity_last15,
+            psychology_global, psychology_last15,
+            cohesion_global, cohesion_last15,
+        )
+        
+        if key is not None:
+            self._signals_cache[key] = signals
+            if len(self._signals_cache) > self._cache_size:
+                self._signals_cache.popitem(last=False)
+            return _copy_signals(signals)
+        
+        return signals
+    
+    @staticmethod
+    def _cache_key(view: StatsView) -> Optional[SignalsCacheKey]:
+        """
+        Clé de cache d'un match : ses statistiques normalisées.
+        
+        Les signaux ne dépendent que des statistiques globales et 75-90'
+        du StatsView : deux payloads de mêmes statistiques partagent leurs
+        signaux, quel que soit leur encodage ou leurs autres champs.
+        
+        Args:
+            view: StatsView des données normalisées.
+        
+        Returns:
+            Paires (clé, valeur) triées des deux blocs, ou None s'ils ne
+            sont pas mémorisables (clés non comparables, valeurs non
+            hachables).
+        """
+        try:
+            key = (
+                tuple(sorted(view.global_.items())),
+                tuple(sorted(view.last_15.items())),
+            )
+            hash(key)
+        except TypeError:
+            return None
+        
+        return key
+    
     def _extract_all_signals(
         self, 
         normalized_data: Dict[str, Any]
@@ -469,11 +633,13 @@ class Pipeline:
         Returns:
             Dict avec signaux par module.
         """
+        global_signals = compute_all_global(normalized_data)
+        
         return {
-            "stability": self.stability_module.compute_global(normalized_data),
-            "intensity": self.intensity_module.compute_global(normalized_data),
-            "psychology": self.psychology_module.compute_global(normalized_data),
-            "cohesion": self.cohesion_module.compute_global(normalized_data),
+            "stability": global_signals["stability"],
+            "intensity": global_signals["intensity"],
+            "psychology": global_signals["psychology"],
+            "cohesion": global_signals["cohesion"],
         }
     
     def _validate_output(self, result: Dict[str, Any]) -> bool:
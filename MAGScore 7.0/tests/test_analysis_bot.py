@@ -30,8 +30,7 @@ class TestAnalysisBotInstantiation:
     def test_generate_report_method_exists(self):
         """Vérifie que la méthode generate_report existe."""
         bot = AnalysisBot()
-        assert hasattr(bot, 'generate_report')
-        assert callable(bot.generate_report)
+        assert callable(getattr(type(bot), 'generate_report', None))
 
 
 class TestReportStructure:
@@ -10,13 +10,76 @@ Vérifie :
     - CohesionModule
 """
 
+import random
+
 import pytest
 from magscore.modules import (
     StabilityModule,
     IntensityModule,
     PsychologyModule,
     CohesionModule,
+    NormalizedStats,
+    StatsView,
+    StatsRecord,
+    compute_all_global,
 )
+from magscore.modules.cohesion import COHESION_SIGNALS
+from magscore.modules.intensity import INTENSITY_SIGNALS
+from magscore.modules.psychology import PSYCHOLOGY_SIGNALS
+from magscore.modules.stability import STABILITY_SIGNALS
+
+
+# Matchs de référence pour les calculs par lot (clés principales, de repli,
+# absentes et valeurs nulles)
+BATCH_RECORDS = [
+    {
+        "passes": 512, "passes_completed": 430, "possession": 58,
+        "key_passes": 6, "assists": 1, "distance_covered": 108, "sprints": 120,
+        "interceptions": 11, "tackles": 17, "ball_recoveries": 21,
+        "duels": 96, "duels_won": 51, "fouls": 12, "yellow_cards": 2,
+        "clearances": 19, "blocks": 4, "saves": 3,
+        "shots_conceded": 9, "shots_on_target_against": 4, "xg_against": 1.4,
+    },
+    {
+        "stats": {
+            "passes_total": 380, "pass_accuracy": 81, "possession_percentage": 44,
+            "running_distance": 0, "sprint_count": 90, "tackles_won": 9,
+            "recoveries": 14, "duels_total": 0, "fouls_committed": 8,
+            "red_cards": 1, "shots_blocked": 2, "shots_against": 0,
+        },
+    },
+    {},
+]
+
+
+def _random_stats(rng, keys):
+    """Statistiques aléatoires : ~1/3 des clés absentes, zéros fréquents."""
+    stats = {}
+    for key in keys:
+        kind = rng.random()
+        if kind < 0.35:
+            continue
+        if kind < 0.5:
+            stats[key] = 0
+        elif kind < 0.8:
+            stats[key] = rng.randint(1, 40)
+        elif kind < 0.9:
+            stats[key] = rng.randint(40, 700)
+        else:
+            stats[key] = round(rng.uniform(0.0, 4.0), 2)
+    return stats
+
+
+def _random_records(rng, count):
+    """Matchs aléatoires, avec ou sans statistiques 75-90'."""
+    keys = sorted(NormalizedStats.__annotations__)
+    records = []
+    for _ in range(count):
+        record = {"stats": _random_stats(rng, keys)}
+        if rng.random() < 0.7:
+            record["last_15_min"] = _random_stats(rng, keys)
+        records.append(record)
+    return records
 
 
 class TestStabilityModule:
@@ -30,8 +93,7 @@ class TestStabilityModule:
     def test_extract_signals_method_exists(self):
         """Vérifie que la méthode extract_signals existe."""
         module = StabilityModule()
-        assert hasattr(module, 'extract_signals')
-        assert callable(module.extract_signals)
+        assert callable(getattr(type(module), 'extract_signals', None))
     
     def test_extract_signals_returns_list(self):
         """extract_signals doit retourner une liste."""
@@ -50,8 +112,7 @@ class TestIntensityModule:
     def test_extract_signals_method_exists(self):
         """Vérifie que la méthode extract_signals existe."""
         module = IntensityModule()
-        assert hasattr(module, 'extract_signals')
-        assert callable(module.extract_signals)
+        assert callable(getattr(type(module), 'extract_signals', None))
     
     def test_extract_signals_returns_list(self):
         """extract_signals doit retourner une liste."""
@@ -70,8 +131,7 @@ class TestPsychologyModule:
     def test_extract_signals_method_exists(self):
         """Vérifie que la méthode extract_signals existe."""
         module = PsychologyModule()
-        assert hasattr(module, 'extract_signals')
-        assert callable(module.extract_signals)
+        assert callable(getattr(type(module), 'extract_signals', None))
     
     def test_extract_signals_returns_list(self):
         """extract_signals doit retourner une liste."""
@@ -90,10 +150,275 @@ class TestCohesionModule:
     def test_extract_signals_method_exists(self):
         """Vérifie que la méthode extract_signals existe."""
         module = CohesionModule()
-        assert hasattr(module, 'extract_signals')
-        assert callable(module.extract_signals)
+        assert callable(getattr(type(module), 'extract_signals', None))
     
     def test_extract_signals_returns_list(self):
         """extract_signals doit retourner une liste."""
         # TODO: Implémenter dans PARTIE 2
         pass
+
+
+class TestSignalKernels:
+    """Tests des noyaux de calcul partagés par les modules."""
+    
+    @pytest.mark.parametrize("module_cls, signals", [
+        (StabilityModule, STABILITY_SIGNALS),
+        (IntensityModule, INTENSITY_SIGNALS),
+        (PsychologyModule, PSYCHOLOGY_SIGNALS),
+        (CohesionModule, COHESION_SIGNALS),
+    ])
+    def test_outputs_follow_kernel_order(self, module_cls, signals):
+        """Les dicts produits suivent l'ordre des signaux des noyaux."""
+        module = module_cls()
+        
+        for record in BATCH_RECORDS:
+            assert tuple(module.compute_global(record)) == signals
+            assert tuple(module.compute_last_15(record)) == signals
+    
+    def test_kernel_returns_bounded_tuple(self):
+        """Un noyau retourne 4 signaux bornés ; round_signals les arrondit."""
+        from magscore.modules._kernels import _intensity_global, round_signals
+        
+        result = _intensity_global(7.0, 3.0, 40.0, 27.0, 0.0, 0.0)
+        
+        assert result == (0.4, (27.0 / 40.0 - 0.3) / 0.4, 0.3, (13.0 / 40.0 - 0.3) / 0.4)
+        assert round_signals(result) == (0.4, 0.938, 0.3, 0.063)
+    
+    def test_compiled_kernels_match_python(self):
+        """Noyaux compilés par Numba : mêmes signaux publiés qu'en Python pur."""
+        pytest.importorskip("numba")
+        from magscore.modules._kernels import WARMUP_KERNELS, round_signals
+        
+        rng = random.Random(0)
+        for kernel in WARMUP_KERNELS:
+            argcount = kernel.py_func.__code__.co_argcount
+            for _ in range(2000):
+                stats = tuple(
+                    float(rng.choice((0, rng.randint(0, 40), rng.randint(0, 700))))
+                    for _ in range(argcount)
+                )
+                assert round_signals(kernel(*stats)) == round_signals(kernel.py_func(*stats))
+    
+    def test_clip01_matches_min_max(self):
+        """_clip01 et _clip01_nan_high bornent à [0, 1] comme min/max."""
+        from magscore.modules._kernels import _clip01, _clip01_nan_high
+        
+        for value in (-3.0, -0.0, 0.0, 0.25, 1.0, 7.5, float("inf"), float("-inf"), float("nan")):
+            assert repr(_clip01(value)) == repr(min(1.0, max(0.0, value)))
+            assert repr(_clip01_nan_high(value)) == repr(max(0.0, min(1.0, value)))
+    
+    def test_warmup_calls_every_kernel(self, monkeypatch):
+        """warmup_kernels appelle chaque noyau avec son nombre d'arguments."""
+        from magscore.modules import _kernels
+        
+        monkeypatch.setattr(_kernels, "HAS_NUMBA", True)
+        
+        _kernels.warmup_kernels()
+    
+    def test_extract_follows_spec(self):
+        """_extract lit clé principale, clé de repli puis défaut, dans l'ordre."""
+        from magscore.modules._stats import _extract
+        from magscore.modules.intensity import INTENSITY_GLOBAL_SPEC
+        
+        stats = {"interceptions": "4", "tackles_won": 6, "duels": 40, "sprint_count": 90}
+        
+        assert _extract(stats, INTENSITY_GLOBAL_SPEC) == [4.0, 6.0, None, 40.0, None, 0.0, 90.0]
+    
+    def test_first_returns_first_present_key(self):
+        """_first retient la première clé présente, même de valeur nulle."""
+        from magscore.modules._stats import _first
+        
+        assert _first({"money_time": {"fouls": 2}}, ("last_15_min", "money_time"), {}) == {"fouls": 2}
+        assert _first({"last_15_min": {}, "money_time": {"fouls": 2}}, ("last_15_min", "money_time"), None) == {}
+        assert _first({}, ("last_15_min", "money_time"), {}) == {}
+    
+    def test_repeated_stats_hit_shared_cache(self):
+        """Un match déjà évalué (par une autre instance) est lu depuis le cache."""
+        from magscore.modules.stability import _global_signals
+        
+        record = {"interceptions": 13, "tackles": 21, "saves": 4, "xg_against": 0.7}
+        first = StabilityModule().compute_global(record)
+        hits_before = _global_signals.cache_info().hits
+        second = StabilityModule().compute_global(dict(record))
+        
+        assert first == second
+        assert _global_signals.cache_info().hits == hits_before + 1
+    
+    @pytest.mark.parametrize("module_cls, signals", [
+        (StabilityModule, STABILITY_SIGNALS),
+        (IntensityModule, INTENSITY_SIGNALS),
+        (PsychologyModule, PSYCHOLOGY_SIGNALS),
+        (CohesionModule, COHESION_SIGNALS),
+    ])
+    def test_signals_tuple_matches_dict(self, module_cls, signals):
+        """compute_*_signals retourne les signaux du dict, en namedtuple figé."""
+        module = module_cls()
+        
+        for record in BATCH_RECORDS:
+            result = module.compute_global_signals(record)
+            assert result.KEYS == result._fields == signals
+            assert result.to_dict() == module.compute_global(record)
+            assert module.compute_global_signals(dict(record)) is result
+            assert module.compute_last_15_signals(record).to_dict() == module.compute_last_15(record)
+        with pytest.raises(AttributeError):
+            result.extra = 0.0
+    
+    @pytest.mark.parametrize("module_cls", [
+        StabilityModule, IntensityModule, PsychologyModule, CohesionModule,
+    ])
+    def test_stats_view_matches_raw_data(self, module_cls):
+        """Un StatsView partagé donne les mêmes signaux que les données brutes."""
+        module = module_cls()
+        record = {"stats": BATCH_RECORDS[0], "money_time": BATCH_RECORDS[1]["stats"]}
+        view = StatsView.of(record)
+        
+        assert StatsView.of(view) is view
+        assert module.compute_global(view) == module.compute_global(record)
+        assert module.compute_last_15(view) == module.compute_last_15(record)
+    
+    def test_fused_global_matches_modules(self):
+        """compute_all_global reproduit les compute_global des 4 modules."""
+        modules = {
+            "stability": StabilityModule(),
+            "intensity": IntensityModule(),
+            "psychology": PsychologyModule(),
+            "cohesion": CohesionModule(),
+        }
+        
+        for record in BATCH_RECORDS:
+            expected = {name: module.compute_global(record) for name, module in modules.items()}
+            assert compute_all_global(record) == expected
+    
+    @pytest.mark.parametrize("stats", [
+        {},
+        {"passes": 300, "interceptions": 9, "tackles": 14, "duels": 60},
+        {"running_distance": 105.0, "recoveries": 30, "tackles_won": 11},
+        {"distance_covered": 0, "duels_won": 0, "passes_completed": 0},
+        {"shots_against": 12, "pass_accuracy": 71.5, "sprint_count": 140},
+    ])
+    def test_fused_global_matches_modules_missing_keys(self, stats):
+        """Défauts propres à chaque module et dérivés : mêmes signaux."""
+        modules = {
+            "cohesion": CohesionModule(),
+            "intensity": IntensityModule(),
+            "psychology": PsychologyModule(),
+            "stability": StabilityModule(),
+        }
+        record = {"stats": stats}
+        
+        expected = {name: module.compute_global(record) for name, module in modules.items()}
+        assert compute_all_global(record) == expected
+        assert compute_all_global(StatsRecord.from_dict(record)) == expected
+    
+    def test_stats_record_resolves_once(self):
+        """Un StatsRecord résolu donne les mêmes signaux que les données."""
+        record = StatsRecord.from_dict(BATCH_RECORDS[1])
+        
+        assert record.passes_total == 380.0
+        assert record.duels_won is None  # dérivé, résolu par le calcul
+        assert compute_all_global(record) == compute_all_global(BATCH_RECORDS[1])
+        with pytest.raises(AttributeError):
+            record.passes_total = 0.0
+
+
+class TestBatchComputation:
+    """Tests du calcul par lot (compute_global_batch, compute_last_15_batch)."""
+    
+    @pytest.mark.parametrize("module_cls", [
+        StabilityModule, IntensityModule, PsychologyModule, CohesionModule,
+    ])
+    def test_batch_matches_scalar(self, module_cls):
+        """Le calcul par lot reproduit compute_global match par match."""
+        pytest.importorskip("numpy")
+        module = module_cls()
+        
+        batch = module.compute_global_batch(BATCH_RECORDS)
+        
+        for row, record in enumerate(BATCH_RECORDS):
+            expected = module.compute_global(record)
+            assert set(batch) == set(expected)
+            for key, value in expected.items():
+                assert batch[key][row] == pytest.approx(value, abs=1e-9)
+    
+    @pytest.mark.parametrize("module_cls", [
+        StabilityModule, IntensityModule, PsychologyModule, CohesionModule,
+    ])
+    def test_last_15_batch_matches_scalar(self, module_cls):
+        """Le calcul 75-90' par lot reproduit compute_last_15 match par match."""
+        pytest.importorskip("numpy")
+        module = module_cls()
+        records = BATCH_RECORDS + [
+            {"stats": BATCH_RECORDS[0], "money_time": BATCH_RECORDS[1]["stats"]},
+            {"stats": BATCH_RECORDS[1]["stats"], "last_15_min": BATCH_RECORDS[0]},
+            {"stats": BATCH_RECORDS[0], "last_15_min": {}},
+        ]
+        
+        batch = module.compute_last_15_batch(records)
+        
+        for row, record in enumerate(records):
+            expected = module.compute_last_15(record)
+            assert list(batch) == list(expected)
+            for key, value in expected.items():
+                assert batch[key][row] == pytest.approx(value, abs=1e-9)
+    
+    @pytest.mark.parametrize("module_cls", [
+        StabilityModule, IntensityModule, PsychologyModule, CohesionModule,
+    ])
+    @pytest.mark.parametrize("seed", [0, 1, 2])
+    def test_batch_matches_scalar_random(self, module_cls, seed):
+        """Matchs aléatoires avec statistiques absentes : lot == scalaire."""
+        pytest.importorskip("numpy")
+        module = module_cls()
+        records = _random_records(random.Random(seed), 200)
+        
+        batch = module.compute_global_batch(records)
+        batch_15 = module.compute_last_15_batch(records)
+        
+        for row, record in enumerate(records):
+            for result, expected in (
+                (batch, module.compute_global(record)),
+                (batch_15, module.compute_last_15(record)),
+            ):
+                for key, value in expected.items():
+                    assert result[key][row] == pytest.approx(value, abs=1e-9), (row, key)
+    
+    @pytest.mark.parametrize("module_cls", [
+        StabilityModule, IntensityModule, PsychologyModule, CohesionModule,
+    ])
+    def test_many_matches_scalar(self, module_cls):
+        """compute_global_many retourne compute_global de chaque match, dans l'ordre."""
+        module = module_cls()
+        
+        result = module.compute_global_many(BATCH_RECORDS)
+        
+        assert result == [module.compute_global(record) for record in BATCH_RECORDS]
+        assert module.compute_global_many([]) == []
+    
+    def test_batch_follows_scalar_on_nan_and_text(self):
+        """NaN explicite : mêmes signaux qu'en scalaire ; texte : même erreur."""
+        pytest.importorskip("numpy")
+        module = IntensityModule()
+        records = [{"duels": float("nan"), "duels_won": 30}, {"stats": {"duels": 40}}]
+        
+        batch = module.compute_global_batch(records)
+        
+        for row, record in enumerate(records):
+            for key, value in module.compute_global(record).items():
+                assert batch[key][row] == value
+        with pytest.raises(ValueError):
+            module.compute_global_batch([{"duels": "n/a"}])
+        with pytest.raises(ValueError):
+            module.compute_last_15_batch([{"last_15_min": {"duels": "n/a"}}])
+    
+    def test_stack_signals_builds_contiguous_columns(self):
+        """stack_signals empile un tuple de signaux par match en colonnes."""
+        pytest.importorskip("numpy")
+        from magscore.modules._stats import stack_signals
+        
+        result = stack_signals(("a", "b"), [(1.0, -2.0), (0.5, 0.333)])
+        
+        assert list(result) == ["a", "b"]
+        assert list(result["a"]) == [1.0, 0.5]
+        assert list(result["b"]) == [-2.0, 0.333]
+        assert result["b"].flags["C_CONTIGUOUS"]
+        assert list(stack_signals(("a", "b"), [])["a"]) == []
@@ -110,6 +110,25 @@ class TestDefinitionsDataclasses:
 # TESTS: VISION ENGINE
 # =============================================================================
 
+@pytest.fixture
+def sample_video(tmp_path):
+    """Fixture : courte vidéo synthétique (60 frames 320×180 @ 25 ips)."""
+    np = pytest.importorskip("numpy")
+    cv2 = pytest.importorskip("cv2")
+    
+    path = str(tmp_path / "sample.avi")
+    writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*"MJPG"), 25, (320, 180))
+    if not writer.isOpened():
+        pytest.skip("Encodeur MJPG indisponible")
+    
+    rng = np.random.default_rng(0)
+    for _ in range(60):
+        writer.write(rng.integers(0, 256, (180, 320, 3), dtype=np.uint8))
+    writer.release()
+    
+    return path
+
+
 class TestVisionEngine:
     """Tests du VisionEngine v1."""
     
@@ -138,6 +157,67 @@ class TestVisionEngine:
         
         assert isinstance(discrete, list)
         assert len(discrete) == 4
+    
+    def test_process_stream_samples_frames(self, sample_video):
+        """process_stream échantillonne une frame sur sample_interval."""
+        engine = VisionEngine()
+        frames = engine.process_stream(sample_video, sample_interval=10)
+        
+        assert len(frames) == 6
+        for frame in frames:
+            assert isinstance(frame, Frame)
+            assert len(frame.metrics) == 4
+    
+    def test_process_stream_timestamps_follow_frame_index(self, sample_video):
+        """Les timestamps sont espacés de sample_interval / fps."""
+        engine = VisionEngine()
+        frames = engine.process_stream(sample_video, sample_interval=10)
+        
+        gaps = [
+            (later.timestamp - earlier.timestamp).total_seconds()
+            for earlier, later in zip(frames, frames[1:])
+        ]
+        assert gaps == [pytest.approx(10 / 25.0)] * 5
+    
+    def test_process_stream_invalid_source(self):
+        """process_stream lève VideoStreamError si le flux est introuvable."""
+        pytest.importorskip("cv2")
+        from magscore.engine.vision_engine import VideoStreamError
+        
+        engine = VisionEngine()
+        with pytest.raises(VideoStreamError):
+            engine.process_stream("/nonexistent/stream.mp4")
+    
+    def test_extract_signals_averages_frames(self):
+        """extract_signals moyenne chaque métrique sur les frames."""
+        engine = VisionEngine()
+        frames = [
+            Frame(timestamp=datetime.now(), metrics={
+                "density_def": 0.2, "density_off": 0.4,
+                "optical_flow_avg": 0.1, "cluster_density": 0.6,
+            }),
+            Frame(timestamp=datetime.now(), metrics={
+                "density_def": 0.4, "density_off": 0.4,
+                "optical_flow_avg": 0.3, "cluster_density": 0.8,
+            }),
+        ]
+        
+        signals = engine.extract_signals(frames)
+        
+        assert signals["density_def"] == pytest.approx(0.3)
+        assert signals["density_off"] == pytest.approx(0.4)
+        assert signals["optical_flow_avg"] == pytest.approx(0.2)
+        assert signals["cluster_density"] == pytest.approx(0.7)
+    
+    def test_extract_signals_partial_metrics(self):
+        """extract_signals gère des frames aux métriques partielles."""
+        engine = VisionEngine()
+        frames = [
+            Frame(timestamp=datetime.now(), metrics={"density_def": 0.5}),
+            Frame(timestamp=datetime.now(), metrics={"density_def": 0.7}),
+        ]
+        
+        assert engine.extract_signals(frames) == {"density_def": pytest.approx(0.6)}
 
 
 class TestVisionSignalExtractor:
@@ -158,6 +238,155 @@ class TestVisionSignalExtractor:
         assert isinstance(result, VisualSignal)
         assert result.raw == raw
         assert len(result.discrete) >= 1
+    
+    def test_extract_metrics_synthetic_frames(self):
+        """extract_metrics produit 4 métriques dans [0, 1] sur des frames BGR."""
+        np = pytest.importorskip("numpy")
+        pytest.importorskip("cv2")
+        extractor = VisionSignalExtractor()
+        rng = np.random.default_rng(0)
+        frame = rng.integers(0, 256, (360, 640, 3), dtype=np.uint8)
+        
+        first = extractor.extract_metrics(frame)
+        second = extractor.extract_metrics(frame)
+        
+        assert set(first) == {
+            "density_def", "density_off", "optical_flow_avg", "cluster_density"
+        }
+        for value in second.values():
+            assert 0.0 <= value <= 1.0
+        # Pas de frame précédente → valeur neutre ; frame identique → aucun mouvement
+        assert first["optical_flow_avg"] == 0.5
+        assert second["optical_flow_avg"] == 0.0
+    
+    def test_extract_metrics_none_frame(self):
+        """extract_metrics(None) retourne les métriques par défaut."""
+        extractor = VisionSignalExtractor()
+        assert extractor.extract_metrics(None) == extractor._fallback_metrics()
+    
+    def test_extract_metrics_batch_matches_sequential(self):
+        """Le traitement par lot donne les mêmes métriques que frame par frame."""
+        np = pytest.importorskip("numpy")
+        pytest.importorskip("cv2")
+        rng = np.random.default_rng(1)
+        frames = rng.integers(0, 256, (4, 360, 640, 3), dtype=np.uint8)
+        
+        sequential = VisionSignalExtractor()
+        expected = [sequential.extract_metrics(frame) for frame in frames]
+        batched = VisionSignalExtractor()
+        
+        assert batched.extract_metrics_batch(frames) == expected
+        # L'état du flux optique est conservé après le lot
+        assert batched.extract_metrics(frames[0]) == sequential.extract_metrics(frames[0])
+        assert batched.extract_metrics_batch(frames[:0]) == []
+    
+    def test_cuda_failure_falls_back_to_cpu(self):
+        """Une erreur du chemin CUDA le désactive et repasse sur CPU."""
+        np = pytest.importorskip("numpy")
+        pytest.importorskip("cv2")
+        rng = np.random.default_rng(3)
+        frame = rng.integers(0, 256, (360, 640, 3), dtype=np.uint8)
+        expected = VisionSignalExtractor().extract_metrics(frame)
+        
+        extractor = VisionSignalExtractor()
+        extractor._use_cuda = True  # GpuMat absents : l'envoi échoue
+        
+        assert extractor.extract_metrics(frame) == expected
+        assert extractor._use_cuda is False
+    
+    def test_fused_metrics_match_opencv_path(self):
+        """Le noyau fusionné reproduit densités de zone et flux optique."""
+        np = pytest.importorskip("numpy")
+        pytest.importorskip("cv2")
+        extractor = VisionSignalExtractor()
+        rng = np.random.default_rng(2)
+        gray = extractor._next_gray_buffer()
+        gray[:] = rng.integers(0, 256, gray.shape, dtype=np.uint8)
+        prev = np.clip(gray.astype(np.int16) + rng.integers(-8, 9, gray.shape), 0, 255)
+        prev = prev.astype(np.uint8)
+        
+        expected_zones = extractor._compute_zone_densities(
+            gray, extractor._def_y, extractor._off_y
+        )
+        assert extractor._compute_fused_metrics(gray) == expected_zones + (0.5,)
+        
+        extractor._prev_frame = prev
+        fused = extractor._compute_fused_metrics(gray)
+        assert fused[:2] == expected_zones
+        assert fused[2] == pytest.approx(extractor._compute_optical_flow(gray))
+        assert 0.0 < fused[2] < 1.0
+    
+    def test_numba_dispatch_matches_opencv_path(self, monkeypatch):
+        """Avec HAS_NUMBA, extract_metrics passe par le noyau : mêmes métriques."""
+        np = pytest.importorskip("numpy")
+        pytest.importorskip("cv2")
+        from magscore.engine import vision_engine
+        rng = np.random.default_rng(4)
+        frames = rng.integers(0, 256, (3, 360, 640, 3), dtype=np.uint8)
+        
+        monkeypatch.setattr(vision_engine, "HAS_NUMBA", False)
+        extractor = VisionSignalExtractor()
+        expected = [extractor.extract_metrics(frame) for frame in frames]
+        monkeypatch.setattr(vision_engine, "HAS_NUMBA", True)
+        extractor = VisionSignalExtractor()
+        fused = [extractor.extract_metrics(frame) for frame in frames]
+        
+        for metrics, reference in zip(fused, expected):
+            assert metrics == pytest.approx(reference)
+    
+    def test_compiled_metrics_kernel_matches_python(self):
+        """Noyau compilé par Numba : mêmes comptes qu'en Python pur."""
+        np = pytest.importorskip("numpy")
+        pytest.importorskip("numba")
+        from magscore.engine.vision_engine import _metrics_kernel
+        rng = np.random.default_rng(5)
+        gray = rng.integers(0, 256, (180, 320), dtype=np.uint8)
+        prev = rng.integers(0, 256, (180, 320), dtype=np.uint8)
+        
+        for def_y, off_y in ((120, 60), (0, 180), (180, 0)):
+            assert (
+                _metrics_kernel(gray, prev, def_y, off_y)
+                == _metrics_kernel.py_func(gray, prev, def_y, off_y)
+            )
+
+
+class TestVideoStreamHandler:
+    """Tests du VideoStreamHandler."""
+    
+    def test_default_stride(self):
+        """Sans down-sampling, le pas est 1."""
+        handler = VideoStreamHandler()
+        assert handler.sample_stride == 1
+    
+    def test_compute_stride(self):
+        """Le pas est arrondi depuis fps / sample_fps."""
+        assert VideoStreamHandler._compute_stride(30.0, 5.0) == 6
+        assert VideoStreamHandler._compute_stride(25.0, 10.0) == 2
+        assert VideoStreamHandler._compute_stride(25.0, 50.0) == 1
+        assert VideoStreamHandler._compute_stride(25.0, None) == 1
+        assert VideoStreamHandler._compute_stride(0.0, 5.0) == 1
+    
+    def test_read_frame_closed_returns_none(self):
+        """read_frame retourne None si le flux n'est pas ouvert."""
+        handler = VideoStreamHandler()
+        assert handler.read_frame() is None
+    
+    def test_grab_frame_closed_returns_false(self):
+        """grab_frame retourne False si le flux n'est pas ouvert."""
+        handler = VideoStreamHandler()
+        assert handler.grab_frame() is False
+    
+    def test_sample_fps_reads_one_frame_per_stride(self, sample_video):
+        """Avec sample_fps, read_frame avance de sample_stride frames."""
+        with VideoStreamHandler() as handler:
+            handler.open(sample_video, sample_fps=5.0)
+            assert handler.sample_stride == 5
+            
+            count = 0
+            while handler.read_frame() is not None:
+                count += 1
+        
+        assert count == 12
 
 
 # =============================================================================
@@ -454,6 +683,16 @@ class TestPipelineV27:
         assert "historical_context" in result
         assert result["meta"]["memory_engine_version"] == "1.0"
     
+    def test_episode_stored_before_run_analysis_returns(self, raw_data_valid, metadata):
+        """L'épisode est ingéré avant le retour : l'appel suivant le voit."""
+        pipeline = Pipeline(enable_vision=False, enable_memory=True)
+        
+        first = pipeline.run_analysis(raw_data_valid, metadata, team_id="FC_TEST")
+        second = pipeline.run_analysis(raw_data_valid, metadata, team_id="FC_TEST")
+        
+        assert first["historical_context"]["total_episodes"] == 0
+        assert second["historical_context"]["total_episodes"] == 1
+    
     def test_meta_contains_all_versions(self, raw_data_valid, metadata):
         """meta contient toutes les versions."""
         pipeline = Pipeline(enable_vision=True, enable_memory=True)
@@ -19,6 +19,7 @@ from magscore.external.normalize_api import (
     validate_data_integrity,
     get_rejected_metrics,
     OPAQUE_METRICS_BLACKLIST,
+    OPAQUE_PATTERNS,
     RAW_DATA_WHITELIST,
 )
 
@@ -77,6 +78,25 @@ class TestNormalizeFunction:
         
         assert "shots" in result
         assert "passes" in result
+    
+    def test_repeated_keys_use_cache(self):
+        """Les clés déjà vues sont résolues depuis le cache de normalisation."""
+        from magscore.external.normalize_api import _norm_key
+        
+        raw = {" Momentum ": 0.4, "Shots ": 9}
+        first = normalize(raw)
+        hits_before = _norm_key.cache_info().hits
+        second = normalize(raw)
+        
+        assert first == second == {"shots": 9}
+        assert _norm_key.cache_info().hits >= hits_before + 2
+    
+    def test_rejected_keys_logged_in_debug(self, caplog):
+        """Les clés rejetées sont journalisées au niveau DEBUG."""
+        with caplog.at_level("DEBUG", logger="magscore.external.normalize_api"):
+            normalize({"shots": 3, "Momentum": 0.9})
+        
+        assert "Momentum" in caplog.text
 
 
 class TestOpaqueMetricsBlacklist:
@@ -119,6 +139,42 @@ class TestOpaqueMetricsBlacklist:
     def test_passes_is_not_opaque(self):
         """passes ne doit PAS être opaque."""
         assert not is_opaque_metric("passes")
+    
+    def test_pattern_variants_are_opaque(self):
+        """Les variantes contenant un pattern opaque sont rejetées."""
+        assert is_opaque_metric("home_momentum_5min")
+        assert is_opaque_metric("team_win_prob_live")
+        assert is_opaque_metric("pre_match_odds")
+        assert not is_opaque_metric("shots_on_target")
+    
+    def test_blacklist_entries_match_whole_keys(self):
+        """Les entrées de la blacklist sont rejetées en clé entière seulement."""
+        from magscore.external.normalize_api import OPAQUE_MATCH_PATTERNS
+        
+        assert is_opaque_metric("goal_threat")
+        assert not is_opaque_metric("home_goal_threat")
+        assert not is_opaque_metric("elo_rating_source")
+        assert is_opaque_metric("home_attack_momentum")  # pattern "momentum"
+        assert all(is_opaque_metric(metric) for metric in OPAQUE_METRICS_BLACKLIST)
+        assert not any(is_opaque_metric(metric) for metric in RAW_DATA_WHITELIST)
+        assert OPAQUE_MATCH_PATTERNS == tuple(sorted(OPAQUE_PATTERNS))
+    
+    def test_automaton_matches_regex(self):
+        """L'automate Aho-Corasick et l'expression compilée s'accordent."""
+        pytest.importorskip("ahocorasick")
+        from magscore.external.normalize_api import (
+            OPAQUE_AUTOMATON,
+            OPAQUE_PATTERNS_RE,
+        )
+        
+        keys = [
+            "goal_threat", "home_goal_threat", "pre_match_odds", "shots",
+            "momentum", "elo_rating", "elo_rating_source", "passes",
+        ]
+        for key in keys:
+            automaton_hit = next(OPAQUE_AUTOMATON.iter(key), None) is not None
+            expected = key in OPAQUE_METRICS_BLACKLIST or automaton_hit
+            assert expected == (OPAQUE_PATTERNS_RE.search(key) is not None), key
 
 
 class TestRawDataWhitelist:
@@ -200,6 +256,22 @@ class TestNormalizeMatchData:
         
         assert "metadata" in result
         assert result["metadata"]["sanitized"] is True
+    
+    def test_team_aliases_and_invalid_blocks(self):
+        """Les alias home/away sont acceptés, les blocs non-dict ignorés."""
+        raw = {
+            "home": {"Shots": 7, "momentum": 0.3},
+            "away_team": None,
+            "away": {"shots": 2},
+            "events": [{"minute": 12, "match_odds": 1.8}, "invalid"],
+        }
+        
+        result = normalize_match_data(raw)
+        
+        assert result["match_id"] == "unknown"
+        assert result["home_team"] == {"shots": 7}
+        assert result["away_team"] == {}
+        assert result["events"] == [{"minute": 12}]
 
 
 class TestValidateDataIntegrity:
@@ -229,6 +301,23 @@ class TestValidateDataIntegrity:
         
         assert not is_valid
         assert len(issues) > 0
+    
+    def test_nested_opaque_metrics_detected_in_order(self):
+        """Les métriques opaques imbriquées sont détectées, dans l'ordre."""
+        data = {
+            "home": {"shots": 4, "stats": {"Momentum": 0.2}},
+            "pressure_index": 12,
+            "away": {"form_index": 3, "passes": None},
+        }
+        
+        is_valid, issues = validate_data_integrity(data)
+        
+        assert not is_valid
+        assert issues == [
+            "Métrique opaque détectée : Momentum",
+            "Métrique opaque détectée : pressure_index",
+            "Métrique opaque détectée : form_index",
+        ]
 
 
 class TestGetRejectedMetrics:
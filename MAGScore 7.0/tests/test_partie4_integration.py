@@ -11,6 +11,8 @@ Vérifie :
     - LexiconGuard v2 (validate)
 """
 
+import uuid
+
 import pytest
 from magscore.orchestration.pipeline import (
     Pipeline,
@@ -30,6 +32,8 @@ from magscore.modules.stability import StabilityModule
 from magscore.modules.intensity import IntensityModule
 from magscore.modules.psychology import PsychologyModule
 from magscore.modules.cohesion import CohesionModule
+from magscore.modules.stats_view import StatsView
+from magscore.external.normalize_api import normalize
 
 
 # =============================================================================
@@ -94,10 +98,8 @@ class TestModulesV2Interface:
     def test_stability_module_has_compute_methods(self):
         """StabilityModule doit avoir compute_global et compute_last_15."""
         module = StabilityModule()
-        assert hasattr(module, 'compute_global')
-        assert hasattr(module, 'compute_last_15')
-        assert callable(module.compute_global)
-        assert callable(module.compute_last_15)
+        assert callable(getattr(type(module), 'compute_global', None))
+        assert callable(getattr(type(module), 'compute_last_15', None))
     
     def test_intensity_module_has_compute_methods(self):
         """IntensityModule doit avoir compute_global et compute_last_15."""
@@ -192,8 +194,7 @@ class TestPipelineV2:
     def test_pipeline_has_run_analysis(self):
         """Pipeline doit avoir la méthode run_analysis."""
         pipeline = Pipeline()
-        assert hasattr(pipeline, 'run_analysis')
-        assert callable(pipeline.run_analysis)
+        assert callable(getattr(type(pipeline), 'run_analysis', None))
     
     def test_run_analysis_returns_expected_structure(self, sample_raw_data, sample_metadata):
         """run_analysis doit retourner la structure attendue."""
@@ -236,6 +237,97 @@ class TestPipelineV2:
         
         # Le rapport a déjà été validé, mais vérifions
         assert is_clean(report)
+    
+    def test_meta_lists_component_versions_in_order(self, sample_raw_data, sample_metadata):
+        """meta reprend les versions des composants, dans un dict par appel."""
+        pipeline = Pipeline(enable_vision=False, enable_memory=False)
+        first = pipeline.run_analysis(sample_raw_data, sample_metadata)["meta"]
+        second = pipeline.run_analysis(sample_raw_data, sample_metadata)["meta"]
+        
+        assert list(first) == [
+            "pipeline_version", "behavior_engine_version",
+            "pattern_engine_version", "signal_memory_version",
+            "match_flow_version", "quality_control_version",
+            "behaviors_detected", "patterns_detected", "recency_model",
+        ]
+        assert first["match_flow_version"] == pipeline.match_flow.version
+        assert first == second and first is not second
+    
+    def test_run_analysis_reuses_cached_signals(self, sample_raw_data, sample_metadata):
+        """Un payload rejoué réutilise ses signaux, pour le même résultat."""
+        pipeline = Pipeline(enable_vision=False, enable_memory=False)
+        first = pipeline.run_analysis(sample_raw_data, sample_metadata)
+        cached = pipeline._signals_cache.copy()
+        
+        # Mêmes statistiques, autre objet, autre ordre et autres champs : même clé
+        replay = dict(reversed(list(sample_raw_data.items())))
+        replay["match_id"] = "replay"
+        assert pipeline.run_analysis(replay, sample_metadata)["report"] == first["report"]
+        assert list(pipeline._signals_cache) == list(cached)
+        assert all(pipeline._signals_cache[key] is cached[key] for key in cached)
+        
+        pipeline.clear_cache()
+        assert not pipeline._signals_cache
+    
+    def test_cached_signals_are_copied(self, sample_raw_data):
+        """Modifier les signaux retournés ne modifie pas le cache."""
+        pipeline = Pipeline(enable_vision=False, enable_memory=False)
+        first = pipeline._extracted_signals(sample_raw_data)
+        expected = [dict(signals) for signals in first]
+        for signals in first:
+            signals.clear()
+        
+        second = pipeline._extracted_signals(sample_raw_data)
+        assert list(second) == expected
+        second[0].clear()
+        assert list(pipeline._extracted_signals(sample_raw_data)) == expected
+    
+    def test_run_analysis_many_matches_sequential_calls(self, sample_raw_data, sample_metadata):
+        """run_analysis_many équivaut à run_analysis match par match, dans l'ordre."""
+        matches = [
+            {**sample_raw_data, "stats": {**sample_raw_data["stats"], "passes": passes}}
+            for passes in (300, 400, 300)
+        ]
+        
+        sequential = Pipeline(enable_vision=False, enable_memory=False)
+        expected = [sequential.run_analysis(raw, sample_metadata) for raw in matches]
+        
+        batch = Pipeline(enable_vision=False, enable_memory=False)
+        results = batch.run_analysis_many([(raw, sample_metadata) for raw in matches])
+        
+        assert results == expected
+        assert len(batch._signals_cache) == 2
+        assert batch.run_analysis_many([]) == []
+    
+    def test_signal_cache_is_bounded(self, sample_raw_data, sample_metadata):
+        """Le cache garde les cache_size derniers matchs ; 0 le désactive."""
+        pipeline = Pipeline(enable_vision=False, enable_memory=False, cache_size=2)
+        matches = [
+            {**sample_raw_data, "stats": {**sample_raw_data["stats"], "passes": passes}}
+            for passes in (300, 400, 500)
+        ]
+        for raw in matches:
+            pipeline.run_analysis(raw, sample_metadata)
+        
+        assert len(pipeline._signals_cache) == 2
+        evicted = Pipeline._cache_key(StatsView.of(normalize(matches[0])))
+        assert evicted not in pipeline._signals_cache
+        
+        uncached = Pipeline(enable_vision=False, enable_memory=False, cache_size=0)
+        uncached.run_analysis(sample_raw_data, sample_metadata)
+        assert not uncached._signals_cache
+    
+    def test_cache_key_uses_normalized_stats(self):
+        """La clé suit les statistiques normalisées, pas leur encodage JSON."""
+        def key(stats):
+            return Pipeline._cache_key(StatsView.of(normalize({"stats": stats})))
+        
+        match_uuid = uuid.UUID(int=7)
+        assert key({"b": 1, "a": 2}) == key({"a": 2, "b": 1})
+        assert key({"ref": match_uuid}) != key({"ref": str(match_uuid)})
+        assert key({"ref": (1, 2)}) != key({"ref": [1, 2]})
+        assert key({"ref": [1, 2]}) is None
+        assert key({1: 5, "fouls": 3}) is None
 
 
 # =============================================================================
@@ -250,6 +342,17 @@ class TestLexiconGuardV2:
         with pytest.raises(LexiconGuardError):
             validate("This is a surebet for tonight!")
     
+    def test_error_keeps_attributes_through_pickle(self):
+        """LexiconGuardError (slots) conserve violations/text au pickling."""
+        import pickle
+        
+        error = LexiconGuardError(["pari", "cote"], "un pari, une cote")
+        restored = pickle.loads(pickle.dumps(error))
+        assert not hasattr(error, "__dict__") or not error.__dict__
+        assert restored.violations == ["pari", "cote"]
+        assert restored.text == "un pari, une cote"
+        assert str(restored) == str(error)
+    
     def test_validate_passes_clean_text(self):
         """validate ne doit pas lever d'exception sur texte propre."""
         clean_text = "The team shows good stability and intensity."
@@ -264,6 +367,75 @@ class TestLexiconGuardV2:
         assert "pari" in violations
         assert "value" in violations
     
+    def test_find_violations_reports_overlapping_terms(self):
+        """Les termes qui se chevauchent sont tous détectés, sans doublons."""
+        violations = find_violations("Sure bet à Paris ; value bet, sure BET.")
+        
+        assert sorted(violations) == ["bet", "sure", "sure bet", "value", "value bet"]
+        assert violations[0] == "sure bet"
+    
+    @pytest.mark.parametrize("text", [
+        "", None, "Analyse de la stabilité à Paris.", "Un pari risqué", "value bet",
+    ])
+    def test_is_clean_agrees_with_find_violations(self, text):
+        """is_clean (arrêt au premier terme) équivaut à l'absence de violation."""
+        assert is_clean(text) == (not find_violations(text))
+    
+    def test_automaton_matches_regex_scan(self, monkeypatch):
+        """La recherche Aho-Corasick (filtre de limites de mot) égale la regex."""
+        from magscore.orchestration import lexicon_guard
+        
+        class NaiveAutomaton:
+            """Interface de ahocorasick.Automaton.iter : (indice de fin, terme)."""
+            def iter(self, text):
+                for end in range(len(text)):
+                    for term in BLACKLIST:
+                        if text.endswith(term, 0, end + 1):
+                            yield end, term
+        
+        texts = [
+            "Sure bet à Paris ; value bet, sure BET.",
+            "surebets_bet bet_ 2bet l'odd cote-d'ivoire gains.",
+            "Stabilité élevée, aucun terme interdit",
+        ]
+        expected = [sorted(find_violations(text)) for text in texts]
+        
+        monkeypatch.setattr(lexicon_guard, "_BLACKLIST_AUTOMATON", NaiveAutomaton())
+        lexicon_guard._cached_violations.cache_clear()
+        
+        assert [sorted(find_violations(text)) for text in texts] == expected
+        lexicon_guard._cached_violations.cache_clear()
+    
+    def test_find_violations_cache_returns_fresh_lists(self):
+        """Un texte revalidé est servi par le cache, dans une liste neuve."""
+        from magscore.orchestration import lexicon_guard
+        
+        text = "Stabilité : 0.71 — un pari, une cote, un pari."
+        first = find_violations(text)
+        hits_before = lexicon_guard._cached_violations.cache_info().hits
+        first.append("mutation")
+        
+        assert find_violations(text) == ["pari", "cote"]
+        assert lexicon_guard._cached_violations.cache_info().hits == hits_before + 1
+    
+    def test_find_violations_skips_cache_for_long_texts(self):
+        """Les textes trop longs sont analysés sans entrer dans le cache."""
+        from magscore.orchestration import lexicon_guard
+        
+        text = "stabilité " * lexicon_guard.VIOLATIONS_CACHE_MAX_LENGTH + "bankroll"
+        size_before = lexicon_guard._cached_violations.cache_info().currsize
+        
+        assert find_violations(text) == ["bankroll"]
+        assert lexicon_guard._cached_violations.cache_info().currsize == size_before
+    
+    def test_term_checks_normalize(self):
+        """is_term_forbidden / is_term_allowed normalisent le terme."""
+        from magscore.orchestration.lexicon_guard import is_term_forbidden, is_term_allowed
+        
+        assert is_term_forbidden(" Pari ")
+        assert not is_term_forbidden("Paris")
+        assert is_term_allowed("Stabilité")
+    
     def test_blacklist_contains_required_terms(self):
         """La blacklist doit contenir les termes requis."""
         required = ["pari", "parier", "mise", "cote", "odds", "bankroll", 
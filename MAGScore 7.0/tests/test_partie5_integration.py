@@ -151,8 +151,7 @@ class TestPatternEngine:
     def test_compute_patterns_method_exists(self):
         """compute_patterns existe et est callable."""
         engine = PatternEngine()
-        assert hasattr(engine, 'compute_patterns')
-        assert callable(engine.compute_patterns)
+        assert callable(getattr(type(engine), 'compute_patterns', None))
     
     def test_compute_patterns_returns_list(self, sample_behaviors_active):
         """compute_patterns retourne une liste."""
@@ -182,6 +181,18 @@ class TestPatternEngine:
             assert "category" in pattern
             assert pattern["category"] == "composite"
     
+    def test_pattern_sources_are_fresh_sorted_lists(self, sample_behaviors_active):
+        """Les sources sont triées et propres à chaque appel."""
+        engine = PatternEngine()
+        first = engine.compute_patterns(sample_behaviors_active)
+        first[0]["sources"].append("MUTATED")
+        second = engine.compute_patterns(sample_behaviors_active)
+        
+        for pattern in second:
+            assert isinstance(pattern["sources"], list)
+            assert pattern["sources"] == sorted(pattern["sources"])
+            assert "MUTATED" not in pattern["sources"]
+    
     def test_no_pattern_with_single_behavior(self):
         """Aucun pattern avec un seul comportement."""
         engine = PatternEngine()
@@ -262,8 +273,7 @@ class TestSignalMemory:
     def test_smooth_method_exists(self):
         """smooth existe et est callable."""
         memory = SignalMemory()
-        assert hasattr(memory, 'smooth')
-        assert callable(memory.smooth)
+        assert callable(getattr(type(memory), 'smooth', None))
     
     def test_smooth_returns_dict(self, sample_signals):
         """smooth retourne un dictionnaire."""
@@ -312,11 +322,39 @@ class TestSignalMemory:
         assert smoothed2["stability"]["low_block_drop"] == 0.1
         assert smoothed2["intensity"]["pressing_wave"] == 0.2
     
+    def test_smooth_returns_new_dicts(self, sample_signals):
+        """smooth ne modifie pas l'entrée et n'en retourne aucun dict."""
+        memory = SignalMemory()
+        snapshot = {category: dict(values) for category, values in sample_signals.items()}
+        
+        smoothed = memory.smooth(sample_signals)
+        for category in smoothed:
+            smoothed[category]["injected"] = 1.0
+        
+        assert sample_signals == snapshot
+        assert all(smoothed[category] is not sample_signals[category] for category in smoothed)
+    
     def test_smooth_empty_returns_empty(self):
         """smooth({}) retourne {}."""
         memory = SignalMemory()
         smoothed = memory.smooth({})
         assert smoothed == {}
+    
+    def test_average_non_numeric_falls_back(self):
+        """Une valeur non numérique est ignorée (moyenne 0.0)."""
+        memory = SignalMemory()
+        smoothed = memory.smooth({"stability": {"low_block_drop": "n/a", "x": 0.4}})
+        assert smoothed == {"stability": {"low_block_drop": 0.0, "x": 0.4}}
+    
+    def test_average_of_varying_copies(self):
+        """La moyenne porte sur toutes les copies du buffer."""
+        memory = SignalMemory()
+        buffer = [
+            {"intensity": {"pressing_wave": 0.2}},
+            {"intensity": {"pressing_wave": 0.4}},
+            {"intensity": {"pressing_wave": 0.9}},
+        ]
+        assert memory._compute_average(buffer) == {"intensity": {"pressing_wave": 0.5}}
 
 
 # =============================================================================
@@ -345,8 +383,7 @@ class TestMatchFlowReconstructor:
     def test_reconstruct_method_exists(self):
         """reconstruct existe et est callable."""
         reconstructor = MatchFlowReconstructor()
-        assert hasattr(reconstructor, 'reconstruct')
-        assert callable(reconstructor.reconstruct)
+        assert callable(getattr(type(reconstructor), 'reconstruct', None))
     
     def test_reconstruct_returns_list(self, sample_behaviors_active):
         """reconstruct retourne une liste."""
@@ -35,8 +35,7 @@ class TestPipelineInstantiation:
     def test_run_method_exists(self):
         """Vérifie que la méthode run existe."""
         pipeline = Pipeline()
-        assert hasattr(pipeline, 'run')
-        assert callable(pipeline.run)
+        assert callable(getattr(type(pipeline), 'run', None))
 
 
 class TestPipelineNeutrality:
@@ -24,6 +24,7 @@ from magscore.engine.quality_control import (
     REQUIRED_SECTIONS,
     REQUIRED_DISCLAIMER,
     create_quality_control_engine,
+    _index_contradictions,
 )
 
 
@@ -408,8 +409,7 @@ class TestQualityControlEngineInstantiation:
     
     def test_validate_method_exists(self, qc_engine):
         """La méthode validate existe et est callable."""
-        assert hasattr(qc_engine, 'validate')
-        assert callable(qc_engine.validate)
+        assert callable(getattr(type(qc_engine), 'validate', None))
     
     def test_factory_function(self):
         """Factory function crée une instance."""
@@ -500,6 +500,48 @@ class TestContradictionPSY:
         assert "PSY" in str(exc_info.value)
 
 
+# =============================================================================
+# TESTS: CONTRADICTIONS COMPORTEMENTS — ORDRE ET INDEX
+# =============================================================================
+
+class TestContradictionOrder:
+    """Tests de l'ordre de détection et de l'index des paires."""
+    
+    def test_first_declared_pair_reported(self, qc_engine, report_valid):
+        """STB et INT contradictoires : la paire STB (déclarée d'abord) est rapportée."""
+        behaviors = [
+            {"code": "INT_01", "status": "ACTIVE"},
+            {"code": "INT_02", "status": "ACTIVE"},
+            {"code": "STB_01", "status": "ACTIVE"},
+            {"code": "STB_02", "status": "ACTIVE"},
+        ]
+        with pytest.raises(QualityControlError) as exc_info:
+            qc_engine.validate(
+                behaviors=behaviors,
+                patterns=[],
+                flow=[],
+                report_text=report_valid,
+                final_payload={
+                    "behaviors": behaviors,
+                    "patterns": [],
+                    "flow": [],
+                    "report": report_valid,
+                    "meta": {},
+                },
+            )
+        assert exc_info.value.violations == ["STB_01", "STB_02"]
+    
+    def test_index_keeps_pairs_sharing_first_code(self):
+        """Deux paires de même premier code sont toutes deux indexées."""
+        index = _index_contradictions([
+            ("A", "B", "A & B"),
+            ("C", "D", "C & D"),
+            ("A", "E", "A & E"),
+        ])
+        assert index["A"] == ((0, "A", "B", "A & B"), (2, "A", "E", "A & E"))
+        assert index["C"] == ((1, "C", "D", "C & D"),)
+
+
 # =============================================================================
 # TESTS: PATTERNS ↔ BEHAVIORS
 # =============================================================================
@@ -527,6 +569,19 @@ class TestPatternBehaviorValidation:
             )
         assert "source" in str(exc_info.value).lower() or "INT_02" in str(exc_info.value)
     
+    def test_first_missing_source_is_reported(self, qc_engine):
+        """La première source absente (ordre des patterns) est signalée, même avec None."""
+        patterns = [
+            {"pattern_code": "PTN_01", "sources": ["STB_01", "ZZZ_09"]},
+            {"pattern_code": "PTN_02", "sources": [None, "AAA_01"]},
+        ]
+        
+        with pytest.raises(QualityControlError) as exc_info:
+            qc_engine._check_pattern_sources({"STB_01"}, patterns)
+        
+        assert "ZZZ_09" in str(exc_info.value)
+        assert exc_info.value.violations == ["ZZZ_09"]
+    
     def test_valid_pattern_sources_pass(
         self, qc_engine, behaviors_valid, patterns_valid, report_valid
     ):
@@ -913,6 +968,16 @@ class TestQualityControlEdgeCases:
         assert error.violations == ["v1", "v2"]
         assert error.category == "test"
     
+    def test_qc_error_pickle_preserves_attributes(self):
+        """QualityControlError (slots) conserve ses attributs au pickling."""
+        import pickle
+        
+        error = QualityControlError("test", violations=["v1"], category="flow")
+        restored = pickle.loads(pickle.dumps(error))
+        assert restored.violations == ["v1"]
+        assert restored.category == "flow"
+        assert str(restored) == "test"
+    
     def test_pattern_code_also_valid_in_flow(self, qc_engine, report_valid):
         """Les pattern_codes sont aussi valides dans le flow."""
         behaviors = [{"code": "STB_01", "status": "ACTIVE"}]
@@ -24,8 +24,7 @@ class TestSupportBotInstantiation:
     def test_record_method_exists(self):
         """Vérifie que la méthode record existe."""
         bot = SupportBot()
-        assert hasattr(bot, 'record')
-        assert callable(bot.record)
+        assert callable(getattr(type(bot), 'record', None))
     
     def test_has_min_words_threshold(self):
         """Vérifie que le seuil de mots minimum est défini."""